@@ -5,16 +5,112 @@ from .sounds import DEFAULT_VOLUME
 
 CONFIG = {
     "volume": DEFAULT_VOLUME,
+    # Toca os sons em uma thread dedicada (False = direto no loop de vídeo)
+    "audio_threaded": True,
     "camera_index": 0,
+    # Modos (FOURCC, largura, altura, FPS) em ordem de preferência; o primeiro
+    # que entregar camera_target_fps é escolhido
+    "camera_modes": [
+        ("MJPG", 1280, 720, 60),
+        ("MJPG", 1280, 720, 30),
+        ("YUYV", 1280, 720, 30),
+        ("MJPG", 960, 540, 30),
+        ("YUYV", 640, 480, 30),
+    ],
+    "camera_target_fps": 30,
+    "camera_probe_frames": 20,
+    "camera_threaded": False,  # Captura em thread dedicada (só o frame mais recente)
+    # Fonte de vídeo em arquivo/diretório de frames (substitui camera_index)
+    "camera_source": None,
+    "camera_source_realtime": False,  # True = taxa gravada, False = o mais rápido possível
+    "camera_source_fps": 30.0,  # Taxa usada para diretórios de frames
+    "camera_source_loop": True,
     "hands_config": {
         "max_num_hands": 2,
         "min_detection_confidence": 0.7,
         "min_tracking_confidence": 0.7,
     },
+    # IDs persistentes das mãos: deslocamento máximo do punho por frame (fração
+    # da imagem) e frames que uma mão ausente mantém seu estado de toque
+    "hand_track_max_distance": 0.2,
+    "hand_track_max_missing": 15,
+    # Filtro One-Euro nos landmarks: corte (Hz) parado, ganho com a velocidade
+    # (imagens/s) e corte da estimativa de velocidade. Desligado por padrão:
+    # reduz o tremor ao custo de algum atraso nos landmarks (e nos toques)
+    "landmark_smoothing": False,
+    "smoothing_min_cutoff": 1.0,
+    "smoothing_beta": 10.0,
+    "smoothing_d_cutoff": 1.0,
+    # Inferência em processo separado (resultados com 1 frame de atraso)
+    "hand_tracking_pipelined": False,
+    # Clareia frames escuros (gamma via LUT) antes da inferência, para o
+    # MediaPipe manter o rastreamento em vez de rodar o detector de palma
+    "lighting_normalization": False,
+    "lighting_target": 0.45,  # Luminância média desejada (0 a 1)
+    "lighting_min_gamma": 0.4,  # Clareamento máximo
+    "lighting_drift": 0.15,  # Mudança do histograma (L1) que refaz a LUT
+    # Roda o MediaPipe só a cada N frames (N <= inference_max_skip, menor com
+    # mãos rápidas) e extrapola os landmarks nos frames pulados
+    "inference_skipping": False,
+    "inference_max_skip": 3,
+    "inference_max_step": 0.01,  # Deslocamento extrapolado máximo por frame (fração da imagem)
+    # Inferência só na região das mãos do frame anterior (modo inline); um
+    # frame inteiro a cada roi_refresh_frames encontra mãos novas
+    "hand_tracking_roi": False,
+    "roi_working_size": 320,  # Maior lado da região enviada ao MediaPipe (px)
+    "roi_refresh_frames": 15,
+    # "image" espelha o frame antes da inferência; "landmarks" espelha só os resultados
+    "mirror_mode": "image",
+    "mirror_display": True,  # False (modo "landmarks") exibe o frame sem espelhar
     "fps": 60,
+    # Sem mãos por idle_after s: cai para idle_fps e só roda um detector de
+    # movimento em cinza reduzido; o movimento religa o loop completo
+    "idle_mode": False,
+    "idle_after": 10.0,
+    "idle_fps": 5,
+    # Resolução pedida à câmera no modo ocioso (o FPS do driver cai para idle_fps)
+    "idle_capture_size": (320, 240),
+    "idle_motion_size": (160, 90),
+    "idle_motion_threshold": 0.02,  # Fração de pixels alterados que acorda o loop
+    # Ajusta a qualidade da inferência para sustentar quality_target_fps,
+    # descendo/subindo pelos níveis abaixo (do mais caro ao mais barato)
+    "adaptive_quality": False,
+    "quality_target_fps": 30,
+    "quality_levels": [
+        {"inference_scale": 1.0, "model_complexity": 1,
+         "min_detection_confidence": 0.7, "min_tracking_confidence": 0.7},
+        {"inference_scale": 0.75, "model_complexity": 1,
+         "min_detection_confidence": 0.7, "min_tracking_confidence": 0.7},
+        {"inference_scale": 0.5, "model_complexity": 1,
+         "min_detection_confidence": 0.6, "min_tracking_confidence": 0.6},
+        {"inference_scale": 0.5, "model_complexity": 0,
+         "min_detection_confidence": 0.6, "min_tracking_confidence": 0.5},
+    ],
+    "fps_uncapped": False,  # True roda sem limite de FPS (benchmark)
+    # Instrumentação por estágio ([P] alterna o HUD durante o jogo)
+    "profiling": False,
+    "profile_hud": False,
+    "profile_window": 300,  # Frames usados nos percentis
+    "profile_output": "profile_summary.json",  # Salvo ao sair (None desativa)
+    # Grava os eventos de nota da sessão em recording_path
     "recording_mode": False,
+    # Em vez de abrir a câmera, renderiza recording_path para render_output (WAV)
     "playback_mode": False,
-    "gesture_touch_threshold": 40,  # Distância em pixels para detectar toque
+    "recording_path": "recordings/take.npz",
+    "render_output": "recordings/take.wav",
+    # Limiares de toque em comprimentos de mão (punho -> base do dedo médio),
+    # independentes da resolução e da distância até a câmera
+    "gesture_press_threshold": 0.3,  # Distância ponta-polegar que inicia o toque
+    "gesture_release_threshold": 0.42,  # Distância que encerra o toque (histerese)
+    "gesture_min_hold": 0.08,  # Duração mínima do toque (s), evita retriggers
+    # Volume da nota segue a velocidade com que o dedo se aproxima do polegar
+    "velocity_sensitive": True,
+    # Velocidade de aproximação (mãos/s) do toque mais leve e do mais forte
+    "velocity_speed_range": (1.0, 10.0),
+    # Dispara a nota quando o toque é previsto para o próximo frame (menos latência)
+    "predictive_onset": False,
+    "predictive_margin": 0.04,  # Folga (em mãos) abaixo do limiar exigida da previsão
+    "predictive_max_frames": 3,  # Frames até cancelar uma previsão sem toque
     "left_hand_gestures": LEFT_HAND_GESTURES,
     "right_hand_gestures": RIGHT_HAND_GESTURES,
 }
@@ -2,6 +2,7 @@
 
 # Configuração de gestos para mão esquerda
 # Formato: {finger_landmark_id: {"sound": "path", "name": "note_name"}}
+# "sound" pode ser um arquivo ou "synth:<nota>" para gerar a nota (ex.: "synth:A5")
 LEFT_HAND_GESTURES = {
     # Indicador + Polegar
     8: {
@@ -44,7 +45,7 @@ RIGHT_HAND_GESTURES = {
     },
     # Mindinho + Polegar
     20: {
-        "sound": "assets/sounds/notes/piano_cs4(fake).wav",
+        "sound": "synth:C#4",
         "name": "C#4",
     },
 }
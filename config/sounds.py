@@ -1,5 +1,7 @@
 """Configurações de áudio."""
 
+import os
+
 # Volume padrão (0.0 a 1.0)
 DEFAULT_VOLUME = 0.5
 
@@ -16,3 +18,30 @@ MIXER_CONFIG = {
     "channels": 2,
     "buffer": 512,
 }
+
+# Canais extras (além de um por nota) para notas repetidas que se sobrepõem
+OVERFLOW_VOICES = 8
+
+# Ganho por velocity (velocidade de aproximação do dedo): velocity 0 toca
+# com VELOCITY_MIN_GAIN; a curva < 1 realça toques leves
+VELOCITY_MIN_GAIN = 0.35
+VELOCITY_CURVE = 0.6
+
+# Cache de amostras decodificadas (.npy); None desliga o cache
+SAMPLE_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "gesto-songs", "samples"
+)
+
+# Volume RMS alvo das amostras (fração do fundo de escala); None mantém o original
+SAMPLE_TARGET_RMS = 0.1
+
+# Síntese de notas ("synth:<nota>" nos mapeamentos, ex.: "synth:C#4")
+SYNTH_CONFIG = {
+    "duration": 1.5,  # segundos, incluindo o release
+    "harmonics": (1.0, 0.5, 0.3, 0.15, 0.08, 0.04),  # amplitude por harmônico
+    "attack": 0.005,
+    "decay": 0.15,
+    "sustain": 0.5,
+    "release": 0.4,
+    "cache_size": 48,  # notas mantidas no banco LRU
+}
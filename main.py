@@ -1,7 +1,9 @@
 import asyncio
+import multiprocessing
 import platform
 import logging
 from src.core.app import GestoSongs
+from src.core.frame_scheduler import FrameScheduler
 from config.config import CONFIG
 
 logging.basicConfig(
@@ -13,16 +15,29 @@ logger = logging.getLogger(__name__)
 async def main():
     """Função assíncrona principal para compatibilidade com Pyodide."""
     app = GestoSongs()
+    if CONFIG.get("playback_mode"):
+        try:
+            app.render_recording()
+        finally:
+            app.sound_service.cleanup()
+        return
+
+    scheduler = FrameScheduler(
+        target_fps=CONFIG["fps"],
+        uncapped=CONFIG.get("fps_uncapped", False),
+    )
+    app.on_target_fps = scheduler.set_target_fps
     try:
         app.setup()
         while True:
             app.update_loop()
-            await asyncio.sleep(1.0 / CONFIG["fps"])
+            await scheduler.wait()
     except SystemExit:
         pass
     except Exception as e:
         logger.error(f"Erro inesperado: {e}")
     finally:
+        scheduler.log_summary()
         app.cleanup()
 
 
@@ -30,4 +45,6 @@ if platform.system() == "Emscripten":
     asyncio.ensure_future(main())
 else:
     if __name__ == "__main__":
+        # Necessário para o worker de rastreamento em executáveis PyInstaller
+        multiprocessing.freeze_support()
         asyncio.run(main())
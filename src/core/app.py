@@ -1,17 +1,33 @@
 """Gesto Songs - Aplicação principal."""
 
 import logging
-from typing import Dict, Optional
+import os
+import time
+from typing import Callable, Dict, Optional, Tuple
 
 import cv2
-from mediapipe.python.solutions.drawing_utils import draw_landmarks
-from mediapipe.python.solutions.hands import HAND_CONNECTIONS
+import numpy as np
 
 from config.config import CONFIG
+from src.core.frame_profiler import FrameProfiler
+from src.core.idle_monitor import IdleMonitor
+from src.core.quality_controller import QualityController
+from src.domain.interfaces import CameraServiceProtocol
+from src.domain.models import CameraMode
 from src.services.sound_service import SoundService
+from src.services.audio_dispatcher import AudioDispatcher
+from src.services.offline_renderer import render_performance, to_pcm16, write_wav
+from src.services.performance_recorder import PerformanceRecorder, load_performance
 from src.services.gesture_service import GestureService
 from src.services.camera_service import CameraService
+from src.services.file_camera_service import FileCameraService
+from src.services.frame_preprocessor import FramePreprocessor
 from src.services.hand_tracking_service import HandTrackingService
+from src.services.hand_tracker import HandTracker
+from src.services.landmark_filter import LandmarkFilter
+from src.services.lighting_normalizer import LightingNormalizer
+from src.services.inference_skipper import InferenceSkipper
+from src.services.motion_detector import MotionDetector
 from src.game.challenge_manager import ChallengeManager
 from src.ui.renderer import UIRenderer
 
@@ -22,16 +38,78 @@ class GestoSongs:
     """Classe principal para o Gesto Songs com interação baseada em gestos."""
 
     def __init__(self):
-        self.hand_labels: Dict[int, str] = {}
+        self.hand_labels: Dict[int, str] = {}  # {ID persistente da mão: lateralidade}
 
         # Serviços
         self.sound_service = SoundService(volume=CONFIG["volume"])
+        self.audio_dispatcher = AudioDispatcher(
+            self.sound_service,
+            threaded=CONFIG.get("audio_threaded", True),
+        )
         self.gesture_service = GestureService(
-            touch_threshold=CONFIG.get("gesture_touch_threshold", 40)
+            press_threshold=CONFIG.get("gesture_press_threshold", 0.3),
+            release_threshold=CONFIG.get("gesture_release_threshold", 0.42),
+            min_hold=CONFIG.get("gesture_min_hold", 0.08),
+            left_hand_gestures=CONFIG["left_hand_gestures"],
+            right_hand_gestures=CONFIG["right_hand_gestures"],
+            max_hands=CONFIG["hands_config"]["max_num_hands"],
+            velocity_speed_range=CONFIG.get("velocity_speed_range", (1.0, 10.0)),
+            predictive=CONFIG.get("predictive_onset", False),
+            predictive_margin=CONFIG.get("predictive_margin", 0.04),
+            predictive_max_frames=CONFIG.get("predictive_max_frames", 3),
         )
-        self.camera_service = CameraService(camera_index=CONFIG["camera_index"])
+        self.velocity_sensitive: bool = CONFIG.get("velocity_sensitive", True)
+        self.camera_service = self._create_camera_service()
         self.hand_tracking_service = HandTrackingService(
-            **CONFIG["hands_config"]
+            **CONFIG["hands_config"],
+            pipelined=CONFIG.get("hand_tracking_pipelined", False),
+            roi=CONFIG.get("hand_tracking_roi", False),
+            roi_working_size=CONFIG.get("roi_working_size", 320),
+            roi_refresh_frames=CONFIG.get("roi_refresh_frames", 15),
+        )
+        self.hand_tracker = HandTracker(
+            max_tracks=2 * CONFIG["hands_config"]["max_num_hands"],
+            max_distance=CONFIG.get("hand_track_max_distance", 0.2),
+            max_missing_frames=CONFIG.get("hand_track_max_missing", 15),
+        )
+        self.landmark_filter: Optional[LandmarkFilter] = None
+        if CONFIG.get("landmark_smoothing", False):
+            self.landmark_filter = LandmarkFilter(
+                min_cutoff=CONFIG.get("smoothing_min_cutoff", 1.0),
+                beta=CONFIG.get("smoothing_beta", 10.0),
+                d_cutoff=CONFIG.get("smoothing_d_cutoff", 1.0),
+                max_hands=CONFIG["hands_config"]["max_num_hands"],
+            )
+        self.inference_skipper: Optional[InferenceSkipper] = None
+        if CONFIG.get("inference_skipping", False):
+            self.inference_skipper = InferenceSkipper(
+                max_skip=CONFIG.get("inference_max_skip", 3),
+                max_step=CONFIG.get("inference_max_step", 0.01),
+            )
+        # Modo ocioso: sem mãos por idle_after s, só detecção de movimento
+        self.idle_monitor: Optional[IdleMonitor] = None
+        self.motion_detector: Optional[MotionDetector] = None
+        if CONFIG.get("idle_mode", False):
+            self.idle_monitor = IdleMonitor(idle_after=CONFIG.get("idle_after", 10.0))
+            self.motion_detector = MotionDetector(
+                size=CONFIG.get("idle_motion_size", (160, 90)),
+                motion_threshold=CONFIG.get("idle_motion_threshold", 0.02),
+            )
+        # Modo negociado da câmera, restaurado ao sair do modo ocioso
+        self.camera_mode: Optional[CameraMode] = None
+        # Recebe o novo FPS alvo ao entrar/sair do modo ocioso
+        # (ex.: FrameScheduler.set_target_fps)
+        self.on_target_fps: Optional[Callable[[float], None]] = None
+        self.lighting_normalizer: Optional[LightingNormalizer] = None
+        if CONFIG.get("lighting_normalization", False):
+            self.lighting_normalizer = LightingNormalizer(
+                target=CONFIG.get("lighting_target", 0.45),
+                min_gamma=CONFIG.get("lighting_min_gamma", 0.4),
+                drift=CONFIG.get("lighting_drift", 0.15),
+            )
+        self.frame_preprocessor = FramePreprocessor(
+            mirror_mode=CONFIG.get("mirror_mode", "image"),
+            mirror_display=CONFIG.get("mirror_display", True),
         )
         self.ui_renderer = UIRenderer()
 
@@ -44,6 +122,41 @@ class GestoSongs:
         # Modo de jogo
         self.game_mode: str = "challenge"  # "free" ou "challenge"
 
+        # Instrumentação por estágio e HUD de desempenho
+        self.profiler = FrameProfiler(
+            enabled=CONFIG.get("profiling", False),
+            window=CONFIG.get("profile_window", 300),
+        )
+        self.show_perf_hud: bool = CONFIG.get("profile_hud", False)
+
+        # Qualidade adaptativa da inferência
+        self.quality_controller: Optional[QualityController] = None
+        if CONFIG.get("adaptive_quality", False):
+            self.quality_controller = QualityController(
+                CONFIG["quality_levels"],
+                target_fps=CONFIG.get("quality_target_fps", 30),
+            )
+            self.hand_tracking_service.configure(**self.quality_controller.settings)
+
+        # Gravação dos eventos de nota (recording_mode)
+        self.recorder: Optional[PerformanceRecorder] = (
+            PerformanceRecorder() if CONFIG.get("recording_mode") else None
+        )
+
+    def _create_camera_service(self) -> CameraServiceProtocol:
+        """Cria a fonte de vídeo: arquivo/diretório se configurado, senão webcam."""
+        if CONFIG.get("camera_source"):
+            return FileCameraService(
+                source=CONFIG["camera_source"],
+                realtime=CONFIG.get("camera_source_realtime", False),
+                fps=CONFIG.get("camera_source_fps", 30.0),
+                loop=CONFIG.get("camera_source_loop", True),
+            )
+        return CameraService(
+            camera_index=CONFIG["camera_index"],
+            threaded=CONFIG.get("camera_threaded", False),
+        )
+
     def setup(self) -> None:
         """Inicializa serviços e recursos."""
         # Inicializa som
@@ -52,6 +165,7 @@ class GestoSongs:
             CONFIG["left_hand_gestures"],
             CONFIG["right_hand_gestures"],
         )
+        self.audio_dispatcher.start()
 
         # Inicializa rastreamento de mãos
         if not self.hand_tracking_service.initialize():
@@ -60,8 +174,12 @@ class GestoSongs:
         # Inicializa câmera
         if not self.camera_service.initialize():
             raise RuntimeError("Failed to initialize camera service")
-        
-        self.camera_service.set_resolution(1280, 720)
+
+        self.camera_mode = self.camera_service.negotiate_mode(
+            CONFIG["camera_modes"],
+            target_fps=CONFIG.get("camera_target_fps", 30),
+            probe_frames=CONFIG.get("camera_probe_frames", 20),
+        )
 
         # Constrói mapeamento de notas
         self._build_note_mapping()
@@ -84,96 +202,211 @@ class GestoSongs:
                 note_name = gesture_data["name"]
                 self.note_to_gesture[note_name] = (hand_label, finger_id)
 
+    def _start_note(
+        self,
+        sound_path: str,
+        velocity: float = 1.0,
+        voice: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """
+        Inicia uma nota (toque real ou previsto).
+
+        Args:
+            sound_path: Caminho do som da nota
+            velocity: Intensidade do toque (0.0 a 1.0)
+            voice: (track_id, coluna) de uma nota prevista, que pode ser
+                cancelada depois
+        """
+        # Enfileira o som para a thread de áudio
+        self.audio_dispatcher.note_on(sound_path, velocity, voice)
+        if self.recorder is not None:
+            self.recorder.note_on(sound_path, velocity)
+
+    def _stop_note(self, sound_path: str, voice: Tuple[int, int]) -> None:
+        """
+        Encerra uma nota disparada por uma previsão que não se confirmou.
+
+        Só o canal da previsão é parado; notas reais anteriores do mesmo som
+        continuam soando.
+
+        Args:
+            sound_path: Caminho do som da nota
+            voice: (track_id, coluna) dado no ``_start_note`` da previsão
+        """
+        self.audio_dispatcher.note_off(sound_path, voice)
+        if self.recorder is not None:
+            self.recorder.note_off(sound_path)
+
     def _on_gesture_detected(
         self, note_name: str, gesture_data: dict, hand_label: str
     ) -> None:
         """
-        Callback chamado quando um gesto é detectado.
+        Callback chamado quando um gesto é detectado (toque confirmado).
 
         Args:
             note_name: Nome da nota
             gesture_data: Dados do gesto
             hand_label: Mão utilizada
         """
-        # Toca o som
-        sound_path = gesture_data["sound"]
-        self.sound_service.play_sound(sound_path)
-
         # Verifica se completou o desafio
         if self.game_mode == "challenge" and self.challenge_manager:
             self.challenge_manager.check_completion(note_name, hand_label)
 
         logger.info(f"{hand_label} hand - Gesture: {note_name}")
 
+    def render_recording(self) -> bool:
+        """
+        Renderiza a sessão gravada em recording_path para um WAV (playback_mode).
+
+        Usa as mesmas amostras carregadas pelo SoundService; não precisa de
+        câmera nem de dispositivo de som.
+
+        Returns:
+            True se o WAV foi gerado
+        """
+        path = CONFIG["recording_path"]
+        try:
+            performance = load_performance(path)
+        except (OSError, KeyError, ValueError) as e:
+            logger.error(f"Failed to load recording {path}: {e}")
+            return False
+
+        # Sem dispositivo de áudio, o driver "dummy" do SDL basta para decodificar
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        self.sound_service.initialize()
+        self.sound_service.load_sounds_from_config(
+            CONFIG["left_hand_gestures"],
+            CONFIG["right_hand_gestures"],
+        )
+
+        start = time.perf_counter()
+        sample_rate = self.sound_service.sample_rate
+        mix = render_performance(
+            performance,
+            self.sound_service.get_samples,
+            sample_rate=sample_rate,
+            channels=self.sound_service.channels,
+            volume=self.sound_service.volume,
+            velocity_gain=self.sound_service.velocity_gain,
+        )
+        write_wav(CONFIG["render_output"], to_pcm16(mix), sample_rate)
+        elapsed = time.perf_counter() - start
+
+        audio_seconds = len(mix) / sample_rate
+        logger.info(
+            f"Rendered {performance.n_events} events ({audio_seconds:.1f} s of audio) "
+            f"to {CONFIG['render_output']} in {elapsed:.2f} s "
+            f"({audio_seconds / max(elapsed, 1e-9):.0f}x realtime)"
+        )
+        return True
+
     def update_loop(self) -> None:
         """Processa um frame do vídeo."""
-        # Lê frame da câmera
-        success, frame = self.camera_service.read_frame()
-        if not success or frame is None:
+        profiler = self.profiler
+        profiler.begin_frame()
+
+        # Lê frame da câmera (reutilizando o buffer do frame anterior)
+        success, captured = self.camera_service.read_frame(
+            self.frame_preprocessor.capture_buffer
+        )
+        if not success or captured is None:
             logger.warning("Failed to read frame from camera.")
             return
-
-        frame = cv2.flip(frame, 1)
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        result = self.hand_tracking_service.process_frame(rgb)
-
-        w, h = frame.shape[1], frame.shape[0]
+        if not self.camera_service.frame_is_new:
+            # Captura em thread ainda sem frame novo: só mantém a janela responsiva
+            self._handle_key(cv2.waitKey(1) & 0xFF)
+            return
+        profiler.mark("capture")
+        if self.idle_monitor is not None and self.idle_monitor.idle:
+            if self._idle_frame(captured):
+                return
+        # Tempo de processamento, sem a espera pela câmera
+        work_start = time.perf_counter()
+
+        skipper = self.inference_skipper
+        infer = skipper is None or skipper.should_infer()
+        frame, rgb = self.frame_preprocessor.process(captured, need_rgb=infer)
+        if infer and self.lighting_normalizer is not None:
+            self.lighting_normalizer.apply(rgb)
+        profiler.mark("preprocess")
+
+        if infer:
+            hand_frame = self.hand_tracking_service.detect(rgb)
+            if self.frame_preprocessor.mirrors_landmarks:
+                hand_frame.mirror(mirror_x=self.frame_preprocessor.mirror_display)
+            self.hand_tracker.update(hand_frame)
+            if skipper is not None:
+                skipper.observe(hand_frame)
+        else:
+            # Frame pulado: landmarks extrapolados (já espelhados e com IDs)
+            hand_frame = skipper.extrapolate()
+        profiler.mark("inference")
+
+        if self.landmark_filter is not None:
+            self.landmark_filter.apply(hand_frame)
+        profiler.mark("smoothing")
+
+        # Detecta gestos de todas as mãos de uma vez
+        events = self.gesture_service.detect_frame(hand_frame)
+        profiler.mark("gestures")
+
+        if self.idle_monitor is not None and self.idle_monitor.update(hand_frame.n_hands):
+            self._enter_idle()
+
+        handedness = hand_frame.handedness
+        gesture_data = self.gesture_service.gesture_data
+
+        # Notas começam no toque ou antes dele, quando o onset é previsto
+        track_ids = hand_frame.track_ids
+        for hand_idx, column in zip(*np.nonzero(events.onsets)):
+            velocity = 1.0
+            if self.velocity_sensitive:
+                velocity = float(events.velocity[hand_idx, column])
+            sound_path = gesture_data(handedness[hand_idx], column)["sound"]
+            # Previsões guardam o canal, para o cancelamento parar só ele
+            voice = None
+            if events.predicted[hand_idx, column]:
+                voice = (int(track_ids[hand_idx]), int(column))
+            self._start_note(sound_path, velocity, voice)
+
+        for hand_idx, column in zip(*np.nonzero(events.cancelled)):
+            voice = (int(track_ids[hand_idx]), int(column))
+            self._stop_note(gesture_data(handedness[hand_idx], column)["sound"], voice)
+        for hand_id, column, data in events.lost:
+            self._stop_note(data["sound"], (hand_id, column))
+        for hand_idx, column in zip(*np.nonzero(events.confirmed)):
+            self.audio_dispatcher.release_voice((int(track_ids[hand_idx]), int(column)))
+
+        # O jogo só conta toques reais
+        for hand_idx, column in zip(*np.nonzero(events.pressed)):
+            data = gesture_data(handedness[hand_idx], column)
+            self._on_gesture_detected(data["name"], data, hand_frame.label(hand_idx))
+        profiler.mark("sound")
 
         # Processa mãos
-        multi_hand_landmarks = getattr(result, "multi_hand_landmarks", None)
-        multi_handedness = getattr(result, "multi_handedness", None)
-
-        if multi_hand_landmarks and multi_handedness:
-            for idx, (hand_landmarks, handedness) in enumerate(
-                zip(multi_hand_landmarks, multi_handedness)
-            ):
-                hand_label = handedness.classification[0].label
-                self.hand_labels[idx] = hand_label
-
-                # Seleciona configuração de gestos
-                gesture_config = (
-                    CONFIG["left_hand_gestures"]
-                    if hand_label == "Left"
-                    else CONFIG["right_hand_gestures"]
-                )
-
-                # Detecta gestos
-                active_gestures = self.gesture_service.detect_finger_gestures(
-                    hand_landmarks,
-                    idx,
-                    gesture_config,
-                    w,
-                    h,
-                    lambda note, data: self._on_gesture_detected(
-                        note, data, hand_label
-                    ),
-                )
+        self.hand_labels.clear()
+        for idx, hand_id in enumerate(hand_frame.track_ids.tolist()):
+            hand_label = hand_frame.label(idx)
+            self.hand_labels[hand_id] = hand_label
 
-                # Desenha feedback visual
-                self.ui_renderer.draw_visual_feedback(
-                    frame,
-                    hand_landmarks,
-                    active_gestures,
-                    gesture_config,
-                    w,
-                    h,
-                )
+            # Seleciona configuração de gestos
+            gesture_config = (
+                CONFIG["left_hand_gestures"]
+                if hand_label == "Left"
+                else CONFIG["right_hand_gestures"]
+            )
 
-                # Desenha landmarks da mão
-                draw_landmarks(frame, hand_landmarks, list(HAND_CONNECTIONS))
+            # Desenha feedback visual
+            self.ui_renderer.draw_visual_feedback(
+                frame,
+                hand_frame,
+                idx,
+                events.active(idx),
+                gesture_config,
+            )
 
-                # Label da mão
-                wrist = hand_landmarks.landmark[0]
-                text_x, text_y = int(wrist.x * w), int(wrist.y * h) - 20
-                cv2.putText(
-                    frame,
-                    hand_label,
-                    (text_x, text_y),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    (0, 255, 255),
-                    2,
-                )
+            # Desenha landmarks e label da mão
+            self.ui_renderer.draw_hand(frame, hand_frame, idx)
 
         # Gerencia desafios no modo challenge
         if self.game_mode == "challenge" and self.challenge_manager:
@@ -214,10 +447,26 @@ class GestoSongs:
                     None,
                 )
 
+        if self.show_perf_hud and profiler.enabled:
+            self.ui_renderer.draw_perf_hud(frame, profiler.summary(max_age=0.5))
+        profiler.mark("ui")
+
         cv2.imshow("Gesto Songs", frame)
 
         # Teclas
         key = cv2.waitKey(1) & 0xFF
+        profiler.mark("display")
+        profiler.end_frame()
+
+        if self.quality_controller is not None:
+            settings = self.quality_controller.observe(time.perf_counter() - work_start)
+            if settings is not None:
+                self.hand_tracking_service.configure(**settings)
+
+        self._handle_key(key)
+
+    def _handle_key(self, key: int) -> None:
+        """Trata as teclas do frame."""
         if key == ord("q"):
             logger.info("Exit requested by user.")
             raise SystemExit
@@ -227,11 +476,78 @@ class GestoSongs:
             if self.challenge_manager:
                 self.challenge_manager.current_challenge = None
             logger.info(f"Switched to {self.game_mode} mode")
+        elif key == ord("p"):
+            # Alterna HUD de desempenho (liga a coleta junto, se preciso)
+            self.show_perf_hud = not self.show_perf_hud
+            if self.show_perf_hud and not self.profiler.enabled:
+                self.profiler.toggle()
+
+    def _idle_frame(self, captured: np.ndarray) -> bool:
+        """
+        Processa um frame no modo ocioso.
+
+        Só roda o detector de movimento na imagem reduzida e exibe o frame
+        da câmera, sem inferência nem painéis.
+
+        Returns:
+            True se o frame foi tratado (continua ocioso); False se houve
+            movimento e o frame deve seguir o processamento completo
+        """
+        if self.motion_detector.update(captured):
+            self.idle_monitor.wake()
+            self._set_target_fps(CONFIG["fps"])
+            mode = self.camera_mode
+            if mode is not None:
+                self.camera_service.set_capture_mode(mode.width, mode.height, mode.fps)
+            logger.info(
+                f"Motion detected (score {self.motion_detector.score:.3f}), "
+                f"leaving idle mode"
+            )
+            return False
+
+        frame, _ = self.frame_preprocessor.process(captured, need_rgb=False)
+        cv2.imshow("Gesto Songs", frame)
+        self._handle_key(cv2.waitKey(1) & 0xFF)
+        return True
+
+    def _enter_idle(self) -> None:
+        """Entra no modo ocioso: câmera e loop mais lentos, só detecção de movimento."""
+        self.motion_detector.reset()
+        idle_fps = CONFIG.get("idle_fps", 5)
+        self._set_target_fps(idle_fps)
+        # A câmera também desacelera: sem isso, a fila do driver seguiria
+        # cheia de frames antigos na resolução e taxa completas
+        if self.camera_mode is not None:
+            width, height = CONFIG.get("idle_capture_size", (320, 240))
+            self.camera_service.set_capture_mode(width, height, idle_fps)
+        logger.info(
+            f"No hands for {self.idle_monitor.idle_after:g} s, entering idle "
+            f"mode at {idle_fps} FPS"
+        )
+
+    def _set_target_fps(self, fps: float) -> None:
+        """Repassa o FPS alvo ao agendador, se houver um conectado."""
+        if self.on_target_fps is not None:
+            self.on_target_fps(fps)
 
     def cleanup(self) -> None:
         """Libera recursos."""
         self.camera_service.cleanup()
         cv2.destroyAllWindows()
         self.hand_tracking_service.cleanup()
+        if self.inference_skipper is not None:
+            self.inference_skipper.log_summary()
+        if self.idle_monitor is not None:
+            self.idle_monitor.log_summary()
+        self.audio_dispatcher.stop()
         self.sound_service.cleanup()
+        if self.gesture_service.predictive:
+            logger.info(
+                f"Predictive onsets: {self.gesture_service.predictions} fired, "
+                f"{self.gesture_service.cancellations} cancelled"
+            )
+        if self.recorder is not None:
+            self.recorder.save(CONFIG["recording_path"])
+        if CONFIG.get("profile_output"):
+            self.profiler.export_json(CONFIG["profile_output"])
         logger.info("Resources cleaned up.")
@@ -0,0 +1,163 @@
+"""Instrumentação de tempo por estágio do loop principal."""
+
+import json
+import logging
+import time
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STAGES = (
+    "capture",
+    "preprocess",
+    "inference",
+    "smoothing",
+    "gestures",
+    "sound",
+    "ui",
+    "display",
+)
+
+
+class FrameProfiler:
+    """
+    Mede o tempo de cada estágio do frame com timers monotônicos em ns.
+
+    Cada frame grava uma coluna em um buffer circular (estágios x janela),
+    de onde saem os percentis p50/p95/p99. Desabilitado, cada chamada é
+    apenas um teste de flag.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        window: int = 300,
+        stages: Sequence[str] = DEFAULT_STAGES,
+    ):
+        """
+        Inicializa o profiler.
+
+        Args:
+            enabled: Se True, coleta tempos desde o início
+            window: Número de frames mantidos para os percentis
+            stages: Nomes dos estágios, na ordem em que ocorrem no frame
+        """
+        self.enabled = enabled
+        self.window = window
+        self.stages = tuple(stages) + ("total",)
+        self._stage_index = {name: i for i, name in enumerate(self.stages)}
+        self._total_index = len(self.stages) - 1
+
+        self._samples = np.zeros((len(self.stages), window), dtype=np.int64)
+        self._cursor = 0
+        self._count = 0
+        self.frames = 0
+        self._frame_start = 0
+        self._last_mark = 0
+
+        self._summary_cache: Optional[Dict[str, Dict[str, float]]] = None
+        self._summary_time = 0.0
+
+    def begin_frame(self) -> None:
+        """Marca o início de um frame."""
+        if not self.enabled:
+            return
+        self._samples[:, self._cursor] = 0
+        self._frame_start = self._last_mark = time.perf_counter_ns()
+
+    def mark(self, stage: str) -> None:
+        """
+        Registra o fim de um estágio (tempo desde a marca anterior).
+
+        Args:
+            stage: Nome do estágio que acabou de terminar
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        self._samples[self._stage_index[stage], self._cursor] += now - self._last_mark
+        self._last_mark = now
+
+    def end_frame(self) -> None:
+        """Fecha o frame atual e avança o buffer circular."""
+        if not self.enabled:
+            return
+        self._samples[self._total_index, self._cursor] = (
+            time.perf_counter_ns() - self._frame_start
+        )
+        self._cursor = (self._cursor + 1) % self.window
+        self._count = min(self._count + 1, self.window)
+        self.frames += 1
+
+    def toggle(self) -> bool:
+        """
+        Liga/desliga a coleta.
+
+        Returns:
+            Novo estado
+        """
+        self.enabled = not self.enabled
+        logger.info(f"Profiler {'enabled' if self.enabled else 'disabled'}")
+        return self.enabled
+
+    def summary(self, max_age: float = 0.0) -> Dict[str, Dict[str, float]]:
+        """
+        Calcula p50/p95/p99 e média (em ms) de cada estágio na janela.
+
+        Args:
+            max_age: Reaproveita o último resumo se for mais novo que isso (s)
+
+        Returns:
+            {estágio: {"p50": ms, "p95": ms, "p99": ms, "mean": ms}}
+        """
+        now = time.monotonic()
+        if self._summary_cache is not None and now - self._summary_time < max_age:
+            return self._summary_cache
+
+        summary: Dict[str, Dict[str, float]] = {}
+        if self._count:
+            window = self._samples[:, : self._count] / 1e6
+            percentiles = np.percentile(window, self.PERCENTILES, axis=1)
+            means = window.mean(axis=1)
+            for i, stage in enumerate(self.stages):
+                summary[stage] = {
+                    f"p{p}": float(percentiles[j, i])
+                    for j, p in enumerate(self.PERCENTILES)
+                }
+                summary[stage]["mean"] = float(means[i])
+
+        self._summary_cache = summary
+        self._summary_time = now
+        return summary
+
+    def export_json(self, path: str) -> bool:
+        """
+        Salva o resumo dos tempos em JSON.
+
+        Args:
+            path: Caminho do arquivo de saída
+
+        Returns:
+            True se o arquivo foi salvo
+        """
+        if self.frames == 0:
+            return False
+
+        data = {
+            "frames": self.frames,
+            "window": self._count,
+            "unit": "ms",
+            "stages": self.summary(),
+        }
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            logger.info(f"Profile summary written to {path}")
+            return True
+        except OSError as e:
+            logger.error(f"Failed to write profile summary: {e}")
+            return False
@@ -0,0 +1,93 @@
+"""Agendador de frames baseado em deadline."""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FrameScheduler:
+    """
+    Mantém o loop principal na taxa alvo dormindo só o tempo que resta.
+
+    Cada frame tem um deadline (início + k * intervalo). Após o frame, o
+    scheduler dorme até o deadline; se ele já passou, conta um deadline
+    perdido e apenas cede o event loop. Funciona igual no Pyodide, pois só
+    usa asyncio.sleep.
+    """
+
+    def __init__(
+        self,
+        target_fps: float = 60,
+        uncapped: bool = False,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Inicializa o agendador.
+
+        Args:
+            target_fps: Taxa de frames alvo
+            uncapped: Se True, não dorme (modo benchmark)
+            clock: Relógio monotônico em segundos
+        """
+        self.frame_interval = 1.0 / target_fps
+        self.uncapped = uncapped
+        self.clock = clock
+
+        self.frames = 0
+        self.missed_deadlines = 0
+        self._start_time: Optional[float] = None
+        self._next_deadline: Optional[float] = None
+
+    def set_target_fps(self, target_fps: float) -> None:
+        """
+        Altera a taxa alvo a partir do próximo frame.
+
+        Args:
+            target_fps: Nova taxa de frames alvo
+        """
+        self.frame_interval = 1.0 / target_fps
+        self._next_deadline = None
+
+    async def wait(self) -> None:
+        """Aguarda até o deadline do próximo frame."""
+        now = self.clock()
+        self.frames += 1
+
+        if self._next_deadline is None:
+            self._next_deadline = now
+            if self._start_time is None:
+                self._start_time = now
+        self._next_deadline += self.frame_interval
+
+        if self.uncapped:
+            await asyncio.sleep(0)
+            return
+
+        remaining = self._next_deadline - now
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+            return
+
+        self.missed_deadlines += 1
+        if -remaining > self.frame_interval:
+            # Atraso de mais de um frame: realinha em vez de tentar compensar
+            self._next_deadline = now
+        await asyncio.sleep(0)
+
+    @property
+    def effective_fps(self) -> float:
+        """FPS médio desde o primeiro frame."""
+        if self._start_time is None or self.frames < 2:
+            return 0.0
+        elapsed = self.clock() - self._start_time
+        return (self.frames - 1) / elapsed if elapsed > 0 else 0.0
+
+    def log_summary(self) -> None:
+        """Registra FPS efetivo e deadlines perdidos."""
+        logger.info(
+            f"Frame pacing: {self.frames} frames, {self.effective_fps:.1f} FPS effective, "
+            f"{self.missed_deadlines} missed deadlines"
+        )
@@ -0,0 +1,121 @@
+"""Estado de ociosidade do loop principal e suas métricas."""
+
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class IdleMonitor:
+    """
+    Decide quando o loop entra e sai do modo ocioso.
+
+    O modo ocioso começa depois de ``idle_after`` segundos sem mãos e
+    termina quando o detector de movimento acusa algo (``wake``). O monitor
+    acumula o tempo ocioso e mede o tempo até acordar de fato: do movimento
+    detectado até o primeiro frame com mãos. Acordar e voltar a dormir sem
+    ver mãos conta como despertar falso.
+    """
+
+    def __init__(
+        self,
+        idle_after: float = 10.0,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Inicializa o monitor.
+
+        Args:
+            idle_after: Segundos sem mãos até entrar no modo ocioso
+            clock: Relógio monotônico em segundos
+        """
+        self.idle_after = idle_after
+        self.clock = clock
+
+        self.idle = False
+        self._start_time = clock()
+        self._last_hands = self._start_time
+        self._idle_since = 0.0
+        self._woke_at: Optional[float] = None
+
+        self.idle_seconds = 0.0
+        self.idle_entries = 0
+        self.wakes = 0
+        self.false_wakes = 0
+        self.wake_latencies: List[float] = []
+
+    def update(self, n_hands: int) -> bool:
+        """
+        Registra as mãos de um frame processado.
+
+        Args:
+            n_hands: Número de mãos detectadas no frame
+
+        Returns:
+            True se o loop deve entrar no modo ocioso agora
+        """
+        now = self.clock()
+        if n_hands:
+            self._last_hands = now
+            if self._woke_at is not None:
+                self.wake_latencies.append(now - self._woke_at)
+                self._woke_at = None
+            return False
+
+        if self.idle or now - self._last_hands < self.idle_after:
+            return False
+
+        if self._woke_at is not None:
+            self.false_wakes += 1
+            self._woke_at = None
+        self.idle = True
+        self._idle_since = now
+        self.idle_entries += 1
+        return True
+
+    def wake(self) -> None:
+        """Sai do modo ocioso (movimento detectado)."""
+        if not self.idle:
+            return
+        now = self.clock()
+        self.idle = False
+        self.idle_seconds += now - self._idle_since
+        self._woke_at = now
+        self._last_hands = now
+        self.wakes += 1
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Métricas de ociosidade.
+
+        Returns:
+            {"idle_seconds", "idle_fraction", "wakes", "false_wakes",
+            "wake_p50_ms", "wake_max_ms"}
+        """
+        now = self.clock()
+        idle_seconds = self.idle_seconds
+        if self.idle:
+            idle_seconds += now - self._idle_since
+        elapsed = max(now - self._start_time, 1e-9)
+        latencies = np.asarray(self.wake_latencies) * 1000
+        return {
+            "idle_seconds": idle_seconds,
+            "idle_fraction": idle_seconds / elapsed,
+            "wakes": self.wakes,
+            "false_wakes": self.false_wakes,
+            "wake_p50_ms": float(np.median(latencies)) if len(latencies) else 0.0,
+            "wake_max_ms": float(latencies.max()) if len(latencies) else 0.0,
+        }
+
+    def log_summary(self) -> None:
+        """Registra as métricas de ociosidade."""
+        stats = self.stats()
+        logger.info(
+            f"Idle mode: {stats['idle_seconds']:.1f} s idle "
+            f"({100 * stats['idle_fraction']:.0f}%), {stats['wakes']} wakes "
+            f"({stats['false_wakes']} false), time to hands after wake "
+            f"p50 {stats['wake_p50_ms']:.0f} ms, max {stats['wake_max_ms']:.0f} ms"
+        )
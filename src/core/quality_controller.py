@@ -0,0 +1,104 @@
+"""Controle adaptativo da qualidade da inferência."""
+
+import logging
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class QualityController:
+    """
+    Escolhe o nível de qualidade da inferência que sustenta o FPS alvo.
+
+    Os níveis vão do mais caro (índice 0) ao mais barato e definem os
+    parâmetros do HandTrackingService (escala da imagem, complexidade do
+    modelo e confianças). A mediana do tempo de processamento dos últimos
+    ``window`` frames é comparada ao orçamento do frame: acima dele o
+    controlador desce um nível; abaixo de ``headroom`` vezes o orçamento,
+    sobe um. Depois de cada troca, espera ``cooldown`` frames e uma janela
+    nova antes de decidir outra vez (subir exige o dobro), evitando
+    oscilação.
+    """
+
+    def __init__(
+        self,
+        levels: Sequence[Dict[str, float]],
+        target_fps: float = 30.0,
+        window: int = 30,
+        headroom: float = 0.6,
+        cooldown: int = 60,
+        start_level: int = 0,
+    ):
+        """
+        Inicializa o controlador.
+
+        Args:
+            levels: Parâmetros de cada nível, do mais caro ao mais barato
+            target_fps: FPS a sustentar
+            window: Frames usados na mediana do tempo de processamento
+            headroom: Fração do orçamento abaixo da qual a qualidade sobe
+            cooldown: Frames mínimos entre duas trocas de nível
+            start_level: Nível inicial
+        """
+        if not levels:
+            raise ValueError("At least one quality level is required")
+        self.levels: List[Dict[str, float]] = [dict(level) for level in levels]
+        self.budget = 1.0 / target_fps
+        self.headroom = headroom
+        self.cooldown = cooldown
+        self.level = min(max(start_level, 0), len(self.levels) - 1)
+
+        self._times = np.zeros(window, dtype=np.float64)
+        self._cursor = 0
+        self._count = 0
+        self._since_change = 0
+        self.changes = 0
+
+    @property
+    def settings(self) -> Dict[str, float]:
+        """Parâmetros do nível atual."""
+        return self.levels[self.level]
+
+    def observe(self, frame_time: float) -> Optional[Dict[str, float]]:
+        """
+        Registra o tempo de processamento de um frame.
+
+        Args:
+            frame_time: Tempo de processamento do frame em segundos
+
+        Returns:
+            Parâmetros do novo nível, se houve troca; None caso contrário
+        """
+        self._times[self._cursor] = frame_time
+        self._cursor = (self._cursor + 1) % len(self._times)
+        self._count = min(self._count + 1, len(self._times))
+        self._since_change += 1
+
+        if self._count < len(self._times) or self._since_change < self.cooldown:
+            return None
+
+        median = float(np.median(self._times))
+        if median > self.budget and self.level < len(self.levels) - 1:
+            return self._change(self.level + 1, median)
+        if (
+            median < self.headroom * self.budget
+            and self.level > 0
+            and self._since_change >= 2 * self.cooldown
+        ):
+            return self._change(self.level - 1, median)
+        return None
+
+    def _change(self, level: int, median: float) -> Dict[str, float]:
+        """Troca de nível e recomeça a janela de medição."""
+        logger.info(
+            f"Quality level {self.level} -> {level} (median frame "
+            f"{median * 1000:.1f} ms, budget {self.budget * 1000:.1f} ms): "
+            f"{self.levels[level]}"
+        )
+        self.level = level
+        self._count = 0
+        self._since_change = 0
+        self.changes += 1
+        return self.settings
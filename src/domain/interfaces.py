@@ -1,8 +1,10 @@
 """Interfaces e protocolos para o Gesto Songs."""
 
-from typing import Protocol, Dict, Set, Callable, Optional
+from typing import Any, Protocol, Dict, Set, Callable, Iterable, Optional, Tuple
 import numpy as np
 
+from src.domain.models import CameraMode, GestureEvents, HandFrame
+
 
 class SoundServiceProtocol(Protocol):
     """Protocolo para serviços de som."""
@@ -19,8 +21,16 @@ class SoundServiceProtocol(Protocol):
         """Carrega todos os sons das configurações."""
         ...
     
-    def play_sound(self, sound_path: str) -> bool:
-        """Reproduz um som."""
+    def play_sound(self, sound_path: str, velocity: float = 1.0) -> Optional[Any]:
+        """Reproduz um som e retorna o canal usado."""
+        ...
+    
+    def stop_sound(self, sound_path: str) -> bool:
+        """Para as vozes que estão tocando um som."""
+        ...
+    
+    def stop_voice(self, sound_path: str, channel: Any) -> bool:
+        """Para só a voz de um som que está no canal dado."""
         ...
     
     def set_volume(self, volume: float) -> None:
@@ -41,16 +51,18 @@ class GestureServiceProtocol(Protocol):
     
     def detect_finger_gestures(
         self,
-        hand_landmarks,
+        hand_frame: HandFrame,
         hand_idx: int,
         gesture_config: dict,
-        w: int,
-        h: int,
         on_gesture: Callable[[str, dict], None],
     ) -> Set[int]:
         """Detecta gestos de toque entre dedos."""
         ...
     
+    def detect_frame(self, hand_frame: HandFrame) -> GestureEvents:
+        """Detecta gestos de todas as mãos do frame de uma só vez."""
+        ...
+    
     def get_active_gestures(self, hand_idx: int) -> Set[int]:
         """Retorna os gestos ativos para uma mão."""
         ...
@@ -131,15 +143,27 @@ class UIRendererProtocol(Protocol):
     def draw_visual_feedback(
         self,
         frame: np.ndarray,
-        hand_landmarks,
+        hand_frame: HandFrame,
+        hand_idx: int,
         active_gestures,
         gesture_config: dict,
-        w: int,
-        h: int,
     ) -> None:
         """Desenha feedback visual colorido para os gestos ativos."""
         ...
     
+    def draw_hand(
+        self,
+        frame: np.ndarray,
+        hand_frame: HandFrame,
+        hand_idx: int,
+    ) -> None:
+        """Desenha o esqueleto e o rótulo da mão."""
+        ...
+    
+    def draw_perf_hud(self, frame: np.ndarray, summary: dict) -> None:
+        """Desenha o HUD de tempos por estágio."""
+        ...
+    
     def draw_footer(
         self,
         frame: np.ndarray,
@@ -158,8 +182,8 @@ class CameraServiceProtocol(Protocol):
         """Inicializa a captura de vídeo."""
         ...
     
-    def read_frame(self):
-        """Lê um frame da câmera."""
+    def read_frame(self, frame: Optional[np.ndarray] = None):
+        """Lê um frame da câmera, reutilizando o buffer se fornecido."""
         ...
     
     def get_frame_size(self):
@@ -170,6 +194,19 @@ class CameraServiceProtocol(Protocol):
         """Define a resolução da câmera."""
         ...
     
+    def negotiate_mode(
+        self,
+        candidates: Iterable[Tuple[str, int, int, float]],
+        target_fps: float,
+        probe_frames: int = 20,
+    ) -> Optional[CameraMode]:
+        """Negocia formato, resolução e FPS da câmera."""
+        ...
+    
+    def set_capture_mode(self, width: int, height: int, fps: float) -> Optional[CameraMode]:
+        """Troca resolução e FPS da captura, sem sondar."""
+        ...
+    
     def cleanup(self) -> None:
         """Libera os recursos da câmera."""
         ...
@@ -186,6 +223,10 @@ class HandTrackingServiceProtocol(Protocol):
         """Processa um frame para detectar mãos."""
         ...
     
+    def detect(self, frame: np.ndarray) -> HandFrame:
+        """Processa um frame e retorna as mãos como HandFrame."""
+        ...
+    
     def cleanup(self) -> None:
         """Libera os recursos do MediaPipe."""
         ...
@@ -1,6 +1,9 @@
 """Modelos de dados para o Gesto Songs."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import ClassVar, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 
 @dataclass
@@ -13,6 +16,163 @@ class Challenge:
     time_limit: float = 3.0  # segundos para completar
 
 
+@dataclass
+class CameraMode:
+    """Modo de captura da câmera (formato de pixel, resolução e taxa)."""
+    fourcc: str
+    width: int
+    height: int
+    fps: float
+    measured_fps: float = 0.0  # FPS realmente entregue, medido no probe
+
+
+@dataclass
+class HandFrame:
+    """
+    Landmarks de todas as mãos detectadas em um frame, em arrays NumPy.
+
+    Construído uma única vez por frame, logo após a inferência, e
+    compartilhado por todos os serviços e componentes de UI.
+    """
+    landmarks: np.ndarray  # (n_hands, 21, 3) float32, coordenadas normalizadas
+    handedness: np.ndarray  # (n_hands,) int8: 0 = Left, 1 = Right
+    scores: np.ndarray  # (n_hands,) float32, confiança da lateralidade
+    width: int
+    height: int
+    points: Optional[np.ndarray] = None  # (n_hands, 21, 2) float32, em pixels
+    pixels: Optional[np.ndarray] = None  # (n_hands, 21, 2) int32, em pixels (para desenho)
+    track_ids: Optional[np.ndarray] = None  # (n_hands,) int64, IDs persistentes (HandTracker)
+
+    HAND_LABELS: ClassVar[Tuple[str, str]] = ("Left", "Right")
+
+    def __post_init__(self):
+        if self.points is None or self.pixels is None:
+            self.project()
+
+    @classmethod
+    def empty(cls, width: int, height: int) -> "HandFrame":
+        """Cria um HandFrame sem mãos."""
+        return cls(
+            landmarks=np.empty((0, 21, 3), dtype=np.float32),
+            handedness=np.empty(0, dtype=np.int8),
+            scores=np.empty(0, dtype=np.float32),
+            width=width,
+            height=height,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        landmarks: np.ndarray,
+        labels: Sequence[str],
+        scores: Sequence[float],
+        width: int,
+        height: int,
+    ) -> "HandFrame":
+        """Cria um HandFrame a partir de landmarks e rótulos de lateralidade."""
+        return cls(
+            landmarks=np.asarray(landmarks, dtype=np.float32).reshape(-1, 21, 3),
+            handedness=np.array(
+                [cls.HAND_LABELS.index(label) for label in labels], dtype=np.int8
+            ),
+            scores=np.asarray(scores, dtype=np.float32),
+            width=width,
+            height=height,
+        )
+
+    @property
+    def n_hands(self) -> int:
+        """Número de mãos detectadas."""
+        return len(self.landmarks)
+
+    def label(self, hand_idx: int) -> str:
+        """Retorna "Left" ou "Right" para a mão dada."""
+        return self.HAND_LABELS[self.handedness[hand_idx]]
+
+    def project(self) -> None:
+        """Recalcula a projeção em pixels a partir dos landmarks normalizados."""
+        scale = np.array([self.width, self.height], dtype=np.float32)
+        self.points = self.landmarks[..., :2] * scale
+        # astype trunca em direção a zero, como int(lm.x * w)
+        self.pixels = self.points.astype(np.int32)
+
+    def mirror(self, mirror_x: bool = True) -> None:
+        """
+        Espelha horizontalmente, como se o frame tivesse sido espelhado.
+
+        Args:
+            mirror_x: Se True, reflete x dos landmarks (x -> 1 - x); a
+                lateralidade é sempre trocada
+        """
+        self.handedness = 1 - self.handedness
+        if mirror_x:
+            self.landmarks[..., 0] = 1.0 - self.landmarks[..., 0]
+            self.project()
+
+
+@dataclass
+class GestureEvents:
+    """
+    Resultado da detecção de gestos de todas as mãos de um frame.
+
+    Cada linha corresponde a uma mão do HandFrame e cada coluna a um gesto
+    mapeado para a lateralidade dela.
+    """
+    finger_ids: np.ndarray  # (n_hands, n_gestures) int, landmark do dedo
+    valid: np.ndarray  # (n_hands, n_gestures) bool, False nas colunas de padding
+    distances: np.ndarray  # (n_hands, n_gestures) float32, ponta-polegar / escala da mão
+    touching: np.ndarray  # (n_hands, n_gestures) bool, tocando neste frame
+    pressed: np.ndarray  # (n_hands, n_gestures) bool, toques iniciados neste frame
+    released: np.ndarray  # (n_hands, n_gestures) bool, toques encerrados neste frame
+    # (n_hands, n_gestures) float32 em [0, 1], velocidade de aproximação do dedo;
+    # view de um buffer do GestureService, válida até o próximo frame
+    velocity: np.ndarray
+    # Onset preditivo (todas as máscaras (n_hands, n_gestures) bool):
+    onsets: np.ndarray  # notas a iniciar neste frame (previstas ou toques não previstos)
+    predicted: np.ndarray  # notas disparadas antes do toque, por previsão
+    confirmed: np.ndarray  # toques que confirmaram uma previsão anterior
+    cancelled: np.ndarray  # previsões que não viraram toque (note-off)
+    # Previsões pendentes de mãos que sumiram ou foram substituídas, como
+    # (track_id, coluna, dados do gesto); também precisam de note-off
+    lost: List[Tuple[int, int, dict]] = field(default_factory=list)
+
+    def active(self, hand_idx: int) -> Set[int]:
+        """Retorna os IDs dos dedos tocando o polegar na mão dada."""
+        return set(self.finger_ids[hand_idx][self.touching[hand_idx]].tolist())
+
+
+@dataclass
+class Performance:
+    """
+    Eventos de nota de uma sessão gravada.
+
+    Os eventos ficam em arrays paralelos, ordenados pelo tempo; cada som é
+    referenciado pelo índice em ``sounds``.
+    """
+    NOTE_ON: ClassVar[int] = 0
+    NOTE_OFF: ClassVar[int] = 1
+
+    times: np.ndarray  # (n,) float64, segundos desde o início da gravação
+    kinds: np.ndarray  # (n,) uint8, NOTE_ON ou NOTE_OFF
+    sound_ids: np.ndarray  # (n,) uint16, índice em sounds
+    sounds: List[str]  # caminhos de som (arquivo ou "synth:<nota>")
+    velocities: Optional[np.ndarray] = None  # (n,) float32 em [0, 1]
+
+    def __post_init__(self):
+        if self.velocities is None:
+            self.velocities = np.ones(len(self.times), dtype=np.float32)
+
+    @property
+    def n_events(self) -> int:
+        """Número de eventos gravados."""
+        return len(self.times)
+
+    @property
+    def duration(self) -> float:
+        """Instante do último evento, em segundos."""
+        return float(self.times[-1]) if len(self.times) else 0.0
+
+
 class GameStats:
     """Estatísticas do jogo."""
     def __init__(self):
@@ -0,0 +1,211 @@
+"""Fila de comandos de áudio servida por uma thread dedicada."""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+
+from src.domain.interfaces import SoundServiceProtocol
+
+logger = logging.getLogger(__name__)
+
+# Opcodes dos comandos: (opcode, sound_path, value, voice, t_enqueue_ns);
+# value é a velocity no NOTE_ON e o volume no VOLUME; voice identifica uma
+# nota prevista, para o note-off parar só o canal dela
+NOTE_ON = 0
+NOTE_OFF = 1
+VOLUME = 2
+STOP_ALL = 3
+RELEASE_VOICE = 4
+_SHUTDOWN = 5
+
+
+class AudioDispatcher:
+    """
+    Executa comandos de áudio fora do loop de visão.
+
+    O loop principal apenas enfileira tuplas de tamanho fixo com o instante
+    de envio; a thread de áudio as executa no SoundService e registra a
+    latência fila→play em um buffer circular. Com ``threaded=False`` os
+    comandos rodam na hora (útil onde não há threads, como no Pyodide).
+    """
+
+    def __init__(
+        self,
+        sound_service: SoundServiceProtocol,
+        threaded: bool = True,
+        latency_window: int = 256,
+    ):
+        """
+        Inicializa o despachante.
+
+        Args:
+            sound_service: Serviço que efetivamente toca os sons
+            threaded: Se True, executa os comandos em uma thread dedicada
+            latency_window: Número de latências mantidas para estatísticas
+        """
+        self.sound_service = sound_service
+        self.threaded = threaded
+
+        self._queue: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        # Canal de cada voz identificada (só acessado pela thread de áudio)
+        self._voices: Dict[Hashable, Any] = {}
+
+        self._latencies = np.zeros(latency_window, dtype=np.int64)
+        self._latency_cursor = 0
+        self._latency_count = 0
+        self.enqueued = 0
+        self.processed = 0
+
+    def start(self) -> None:
+        """Inicia a thread de áudio (no modo threaded)."""
+        if not self.threaded or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="audio-dispatch", daemon=True
+        )
+        self._thread.start()
+        logger.info("Audio dispatch thread started")
+
+    def note_on(
+        self, sound_path: str, velocity: float = 1.0, voice: Optional[Hashable] = None
+    ) -> None:
+        """
+        Enfileira o início de uma nota com a velocity dada.
+
+        Args:
+            sound_path: Caminho do som
+            velocity: Intensidade da nota (0.0 a 1.0)
+            voice: Chave opcional da nota; o canal usado fica guardado para
+                um ``note_off`` com a mesma chave
+        """
+        self._submit(NOTE_ON, sound_path, velocity, voice)
+
+    def note_off(self, sound_path: str, voice: Optional[Hashable] = None) -> None:
+        """
+        Enfileira o fim de uma nota.
+
+        Args:
+            sound_path: Caminho do som
+            voice: Chave dada no ``note_on``; se None, para todas as vozes do som
+        """
+        self._submit(NOTE_OFF, sound_path, 0.0, voice)
+
+    def release_voice(self, voice: Hashable) -> None:
+        """Esquece o canal de uma voz que não terá note-off (nota confirmada)."""
+        self._submit(RELEASE_VOICE, "", 0.0, voice)
+
+    def set_volume(self, volume: float) -> None:
+        """Enfileira uma mudança de volume global."""
+        self._submit(VOLUME, "", volume)
+
+    def stop_all(self) -> None:
+        """Enfileira a parada de todos os sons."""
+        self._submit(STOP_ALL, "", 0.0)
+
+    def _submit(
+        self,
+        opcode: int,
+        sound_path: str,
+        value: float,
+        voice: Optional[Hashable] = None,
+    ) -> None:
+        """Enfileira (ou executa, sem thread) um comando."""
+        command = (opcode, sound_path, value, voice, time.perf_counter_ns())
+        self.enqueued += 1
+        if self._thread is None:
+            self._execute(command)
+        else:
+            self._queue.put(command)
+
+    def _run(self) -> None:
+        """Loop da thread de áudio."""
+        while True:
+            command = self._queue.get()
+            if command[0] == _SHUTDOWN:
+                break
+            self._execute(command)
+
+    def _execute(self, command: tuple) -> None:
+        """Executa um comando e registra sua latência."""
+        opcode, sound_path, value, voice, t_enqueue = command
+        try:
+            if opcode == NOTE_ON:
+                channel = self.sound_service.play_sound(sound_path, value)
+                if voice is not None and channel is not None:
+                    self._voices[voice] = channel
+            elif opcode == NOTE_OFF:
+                if voice is None:
+                    self.sound_service.stop_sound(sound_path)
+                else:
+                    channel = self._voices.pop(voice, None)
+                    if channel is not None:
+                        self.sound_service.stop_voice(sound_path, channel)
+            elif opcode == RELEASE_VOICE:
+                self._voices.pop(voice, None)
+            elif opcode == VOLUME:
+                self.sound_service.set_volume(value)
+            elif opcode == STOP_ALL:
+                self.sound_service.stop_all()
+                self._voices.clear()
+        except Exception as e:
+            logger.error(f"Audio command {opcode} failed: {e}")
+
+        self._latencies[self._latency_cursor] = time.perf_counter_ns() - t_enqueue
+        self._latency_cursor = (self._latency_cursor + 1) % len(self._latencies)
+        self._latency_count = min(self._latency_count + 1, len(self._latencies))
+        self.processed += 1
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        Aguarda a fila esvaziar.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos
+
+        Returns:
+            True se todos os comandos enfileirados foram executados
+        """
+        deadline = time.monotonic() + timeout
+        while self.processed < self.enqueued:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def latency_stats(self) -> Dict[str, float]:
+        """
+        Estatísticas da latência fila→play.
+
+        Returns:
+            {"count", "p50", "p95", "max"} com tempos em ms
+        """
+        if self._latency_count == 0:
+            return {"count": 0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        window = self._latencies[: self._latency_count] / 1e6
+        p50, p95 = np.percentile(window, (50, 95))
+        return {
+            "count": self.processed,
+            "p50": float(p50),
+            "p95": float(p95),
+            "max": float(window.max()),
+        }
+
+    def stop(self) -> None:
+        """Encerra a thread após executar os comandos pendentes."""
+        if self._thread is not None:
+            self._queue.put((_SHUTDOWN, "", 0.0, None, 0))
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+        stats = self.latency_stats()
+        if stats["count"]:
+            logger.info(
+                f"Audio dispatch: {stats['count']} commands, queue-to-play "
+                f"p50 {stats['p50']:.2f} ms, p95 {stats['p95']:.2f} ms, "
+                f"max {stats['max']:.2f} ms"
+            )
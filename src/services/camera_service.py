@@ -1,28 +1,80 @@
 """Serviço de gerenciamento de câmera."""
 
 import logging
-from typing import Optional, Tuple
+import threading
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
 
+from src.domain.models import CameraMode
+
 logger = logging.getLogger(__name__)
 
 
+def select_camera_mode(
+    modes: Sequence[CameraMode], target_fps: float, tolerance: float = 0.9
+) -> Optional[CameraMode]:
+    """
+    Escolhe o melhor modo sondado para a meta de latência.
+
+    Os modos estão em ordem de preferência: vence o primeiro cujo FPS medido
+    atinge a meta (com tolerância). Se nenhum atingir, vence o mais rápido.
+
+    Args:
+        modes: Modos sondados, em ordem de preferência
+        target_fps: FPS mínimo desejado
+        tolerance: Fração da meta aceita como suficiente
+
+    Returns:
+        Modo escolhido, ou None se a lista estiver vazia
+    """
+    for mode in modes:
+        if mode.measured_fps >= target_fps * tolerance:
+            return mode
+    if not modes:
+        return None
+    return max(modes, key=lambda mode: mode.measured_fps)
+
+
+def _decode_fourcc(value: float) -> str:
+    """Converte o código FOURCC numérico do OpenCV em texto."""
+    code = int(value)
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00")
+
+
 class CameraService:
     """Gerencia a captura de vídeo da câmera."""
 
-    def __init__(self, camera_index: int = 0):
+    def __init__(self, camera_index: int = 0, threaded: bool = False):
         """
         Inicializa o serviço de câmera.
         
         Args:
             camera_index: Índice da câmera a ser utilizada
+            threaded: Se True, captura em uma thread dedicada que mantém
+                apenas o frame mais recente
         """
         self.camera_index = camera_index
+        self.threaded = threaded
         self.cap: Optional[cv2.VideoCapture] = None
+        self.active_mode: Optional[CameraMode] = None
         self._initialized = False
 
+        # Estado da captura em background
+        self.dropped_frames = 0
+        # False quando read_frame devolveu de novo o último frame (modo threaded)
+        self.frame_is_new = True
+        self.last_frame_timestamp: Optional[float] = None
+        self._cap_lock = threading.Lock()
+        self._frame_ready = threading.Condition()
+        self._reader: Optional[threading.Thread] = None
+        self._running = False
+        self._latest_frame: Optional[np.ndarray] = None
+        self._latest_timestamp: Optional[float] = None
+        self._latest_consumed = True
+
     def initialize(self) -> bool:
         """
         Inicializa a captura de vídeo.
@@ -45,26 +97,127 @@ class CameraService:
             logger.error(f"Error initializing camera: {e}")
             return False
 
-    def read_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
+    def read_frame(
+        self, frame: Optional[np.ndarray] = None
+    ) -> Tuple[bool, Optional[np.ndarray]]:
         """
         Lê um frame da câmera.
+
+        No modo threaded retorna imediatamente o frame mais recente
+        capturado pela thread de leitura. Se ele já foi lido, o próprio
+        ``frame`` volta e ``frame_is_new`` fica False.
         
+        Args:
+            frame: Buffer opcional reutilizado para evitar alocação por frame;
+                no modo threaded, o frame retornado na leitura anterior, que
+                passa a ser da thread de leitura
+            
         Returns:
             Tupla (sucesso, frame) onde sucesso indica se a leitura foi bem-sucedida
         """
         if not self._initialized or self.cap is None:
             logger.warning("Camera not initialized")
             return False, None
+
+        if self.threaded:
+            return self._read_latest_frame(frame)
         
         try:
-            success, frame = self.cap.read()
+            success, frame = self.cap.read(frame)
             if not success:
                 logger.warning("Failed to read frame from camera")
+            else:
+                self.last_frame_timestamp = time.perf_counter()
             return success, frame
         except Exception as e:
             logger.error(f"Error reading frame: {e}")
             return False, None
 
+    def _read_latest_frame(
+        self, frame: Optional[np.ndarray] = None
+    ) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Retorna o último frame capturado pela thread de leitura, sem esperar.
+
+        Três buffers circulam entre a thread e o chamador (escrita, último
+        publicado e o do chamador); sob o lock só trocam referências.
+        """
+        if self._reader is None:
+            self._start_reader()
+            # Só espera na primeira leitura, para não falhar antes do 1º frame
+            with self._frame_ready:
+                self._frame_ready.wait_for(self._has_new_frame, timeout=2.0)
+
+        with self._frame_ready:
+            if self._latest_consumed:
+                # Nenhum frame novo: devolve o mesmo, marcado como repetido
+                self.frame_is_new = False
+                return frame is not None, frame
+            latest = self._latest_frame
+            # O buffer do chamador vira o próximo buffer de escrita da thread
+            if frame is not None and frame.shape == latest.shape:
+                self._latest_frame = frame
+            else:
+                self._latest_frame = None
+            self.last_frame_timestamp = self._latest_timestamp
+            self._latest_consumed = True
+
+        self.frame_is_new = True
+        return True, latest
+
+    def _has_new_frame(self) -> bool:
+        """Indica se há um frame publicado que ainda não foi lido."""
+        return not self._latest_consumed
+
+    def _start_reader(self) -> None:
+        """Inicia a thread de captura em background."""
+        self._running = True
+        self._reader = threading.Thread(
+            target=self._reader_loop, name="camera-reader", daemon=True
+        )
+        self._reader.start()
+        logger.info("Camera background capture started")
+
+    def _reader_loop(self) -> None:
+        """Lê frames continuamente, mantendo apenas o mais recente."""
+        back_buffer: Optional[np.ndarray] = None
+        while self._running:
+            try:
+                with self._cap_lock:
+                    success, frame = self.cap.read(back_buffer)
+            except Exception as e:
+                logger.error(f"Error reading frame: {e}")
+                success, frame = False, None
+
+            if not success:
+                # Evita busy-loop se a câmera parar de entregar frames
+                time.sleep(0.005)
+                continue
+
+            timestamp = time.perf_counter()
+            with self._frame_ready:
+                if not self._latest_consumed:
+                    self.dropped_frames += 1
+                # Troca os buffers: o frame publicado anterior vira o de escrita
+                back_buffer = self._latest_frame
+                self._latest_frame = frame
+                self._latest_timestamp = timestamp
+                self._latest_consumed = False
+                self._frame_ready.notify_all()
+
+    def _stop_reader(self) -> None:
+        """Para a thread de captura em background."""
+        if self._reader is None:
+            return
+
+        self._running = False
+        self._reader.join(timeout=1.0)
+        self._reader = None
+        self._latest_consumed = True
+        logger.info(
+            f"Camera background capture stopped ({self.dropped_frames} frames dropped)"
+        )
+
     def get_frame_size(self) -> Tuple[int, int]:
         """
         Obtém as dimensões do frame.
@@ -95,16 +248,163 @@ class CameraService:
             return False
         
         try:
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            with self._cap_lock:
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            actual = self.get_frame_size()
+            if actual != (width, height):
+                logger.warning(
+                    f"Camera resolution {width}x{height} not applied "
+                    f"(driver reports {actual[0]}x{actual[1]})"
+                )
+                return False
             logger.info(f"Camera resolution set to {width}x{height}")
             return True
         except Exception as e:
             logger.error(f"Error setting resolution: {e}")
             return False
 
+    def negotiate_mode(
+        self,
+        candidates: Iterable[Tuple[str, int, int, float]],
+        target_fps: float,
+        probe_frames: int = 20,
+    ) -> Optional[CameraMode]:
+        """
+        Negocia formato, resolução e FPS com o driver da câmera.
+
+        Tenta cada combinação (FOURCC, largura, altura, FPS) em ordem de
+        preferência, lê de volta os valores aplicados pelo driver e mede o
+        FPS realmente entregue. Para no primeiro modo que atinge a meta.
+
+        Args:
+            candidates: Combinações (fourcc, largura, altura, fps) em ordem
+            target_fps: FPS mínimo desejado
+            probe_frames: Número de frames lidos para medir o FPS
+
+        Returns:
+            Modo escolhido (também salvo em active_mode), ou None em caso de falha
+        """
+        if not self._initialized or self.cap is None:
+            logger.warning("Camera not initialized")
+            return None
+
+        probed: List[CameraMode] = []
+        candidates = list(candidates)
+        with self._cap_lock:
+            for candidate in candidates:
+                mode = self._probe_mode(*candidate, probe_frames=probe_frames)
+                if mode is None:
+                    continue
+                probed.append(mode)
+                if select_camera_mode([mode], target_fps) is not None:
+                    break
+
+            chosen = select_camera_mode(probed, target_fps)
+            if chosen is None:
+                logger.error("Camera mode negotiation failed")
+                return None
+
+            if chosen is not probed[-1]:
+                self._apply_mode(chosen.fourcc, chosen.width, chosen.height, chosen.fps)
+
+        self.active_mode = chosen
+        logger.info(
+            f"Camera mode selected: {chosen.fourcc} {chosen.width}x{chosen.height} "
+            f"@ {chosen.fps:.0f} FPS (measured {chosen.measured_fps:.1f} FPS)"
+        )
+        return chosen
+
+    def set_capture_mode(self, width: int, height: int, fps: float) -> Optional[CameraMode]:
+        """
+        Troca resolução e FPS da captura, sem sondar (ex.: modo ocioso).
+
+        O formato de pixel e o modo negociado (``active_mode``) são mantidos;
+        para voltar, basta chamar de novo com os valores de ``active_mode``.
+
+        Args:
+            width: Largura desejada
+            height: Altura desejada
+            fps: FPS pedido ao driver
+
+        Returns:
+            Modo lido de volta do driver, ou None em caso de falha
+        """
+        if not self._initialized or self.cap is None:
+            logger.warning("Camera not initialized")
+            return None
+
+        try:
+            with self._cap_lock:
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+                self.cap.set(cv2.CAP_PROP_FPS, fps)
+                mode = self._read_mode()
+        except Exception as e:
+            logger.error(f"Error setting capture mode {width}x{height}@{fps:.0f}: {e}")
+            return None
+
+        logger.info(
+            f"Camera capture set to {mode.width}x{mode.height} @ {mode.fps:.0f} FPS "
+            f"(requested {width}x{height} @ {fps:.0f})"
+        )
+        return mode
+
+    def _apply_mode(self, fourcc: str, width: int, height: int, fps: float) -> CameraMode:
+        """Aplica um modo e retorna os valores lidos de volta do driver."""
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.cap.set(cv2.CAP_PROP_FPS, fps)
+        return self._read_mode()
+
+    def _read_mode(self) -> CameraMode:
+        """Lê do driver o modo atualmente aplicado."""
+        return CameraMode(
+            fourcc=_decode_fourcc(self.cap.get(cv2.CAP_PROP_FOURCC)),
+            width=int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            fps=self.cap.get(cv2.CAP_PROP_FPS),
+        )
+
+    def _probe_mode(
+        self, fourcc: str, width: int, height: int, fps: float, probe_frames: int
+    ) -> Optional[CameraMode]:
+        """Aplica um modo candidato e mede o FPS entregue."""
+        try:
+            mode = self._apply_mode(fourcc, width, height, fps)
+
+            # Descarta os primeiros frames (ajuste de exposição / buffers antigos)
+            for _ in range(3):
+                self.cap.grab()
+
+            buffer: Optional[np.ndarray] = None
+            start = time.perf_counter()
+            delivered = 0
+            for _ in range(probe_frames):
+                success, buffer = self.cap.read(buffer)
+                if success:
+                    delivered += 1
+            elapsed = time.perf_counter() - start
+
+            if delivered == 0:
+                logger.warning(f"Camera mode {fourcc} {width}x{height} delivered no frames")
+                return None
+
+            mode.measured_fps = delivered / elapsed if elapsed > 0 else 0.0
+            logger.info(
+                f"Camera probe {fourcc} {width}x{height}@{fps:.0f}: driver applied "
+                f"{mode.fourcc} {mode.width}x{mode.height}@{mode.fps:.0f}, "
+                f"measured {mode.measured_fps:.1f} FPS"
+            )
+            return mode
+        except Exception as e:
+            logger.error(f"Error probing camera mode {fourcc} {width}x{height}: {e}")
+            return None
+
     def cleanup(self) -> None:
         """Libera os recursos da câmera."""
+        self._stop_reader()
         if self.cap is not None:
             self.cap.release()
             self._initialized = False
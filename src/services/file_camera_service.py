@@ -0,0 +1,299 @@
+"""Fonte de vídeo a partir de arquivo ou sequência de frames."""
+
+import logging
+import os
+import time
+from typing import Iterable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from src.domain.models import CameraMode
+
+logger = logging.getLogger(__name__)
+
+
+class FileCameraService:
+    """
+    Substitui a câmera por um arquivo de vídeo ou diretório de imagens.
+
+    Segue a mesma interface do CameraService, permitindo execuções
+    determinísticas e sem webcam (ex.: medir throughput em máquinas de build).
+    """
+
+    FRAME_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+    def __init__(
+        self,
+        source: str,
+        realtime: bool = False,
+        fps: float = 30.0,
+        loop: bool = True,
+    ):
+        """
+        Inicializa a fonte de vídeo.
+
+        Args:
+            source: Caminho de um arquivo de vídeo ou diretório de frames
+            realtime: Se True, reproduz na taxa gravada; senão, o mais rápido possível
+            fps: Taxa usada para diretórios (ou vídeos sem FPS nos metadados)
+            loop: Se True, volta ao início ao chegar no fim da sequência
+        """
+        self.source = source
+        self.realtime = realtime
+        self.fps = fps
+        self.loop = loop
+        self.cap: Optional[cv2.VideoCapture] = None
+        self._frame_paths: List[str] = []
+        self._initialized = False
+
+        self._next_index = 0
+        self._start_time: Optional[float] = None
+        self._output_size: Optional[Tuple[int, int]] = None
+        self._decode_buffer: Optional[np.ndarray] = None
+        self._frame_size: Tuple[int, int] = (0, 0)
+
+        self.dropped_frames = 0
+        self.last_frame_timestamp: Optional[float] = None
+        self.frame_is_new = True  # Toda leitura entrega um frame novo
+
+    def initialize(self) -> bool:
+        """
+        Abre a fonte de vídeo.
+
+        Returns:
+            True se a fonte foi aberta com sucesso
+        """
+        try:
+            if os.path.isdir(self.source):
+                self._frame_paths = sorted(
+                    os.path.join(self.source, name)
+                    for name in os.listdir(self.source)
+                    if name.lower().endswith(self.FRAME_EXTENSIONS)
+                )
+                if not self._frame_paths:
+                    logger.error(f"No frames found in {self.source}")
+                    return False
+                first = cv2.imread(self._frame_paths[0])
+                if first is None:
+                    logger.error(f"Failed to read frame {self._frame_paths[0]}")
+                    return False
+                self._frame_size = (first.shape[1], first.shape[0])
+            else:
+                self.cap = cv2.VideoCapture(self.source)
+                if not self.cap.isOpened():
+                    logger.error(f"Failed to open video file {self.source}")
+                    return False
+                recorded_fps = self.cap.get(cv2.CAP_PROP_FPS)
+                if recorded_fps and recorded_fps > 0:
+                    self.fps = recorded_fps
+                self._frame_size = (
+                    int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                    int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                )
+
+            self._initialized = True
+            mode = "realtime" if self.realtime else "as fast as possible"
+            logger.info(f"File source initialized: {self.source} ({mode}, {self.fps:.1f} FPS)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error initializing file source: {e}")
+            return False
+
+    def read_frame(
+        self, frame: Optional[np.ndarray] = None
+    ) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Lê o próximo frame da fonte.
+
+        No modo realtime espera até o instante gravado do frame e descarta
+        frames atrasados, como uma câmera ao vivo faria.
+
+        Args:
+            frame: Buffer opcional reutilizado para evitar alocação por frame
+
+        Returns:
+            Tupla (sucesso, frame) onde sucesso indica se a leitura foi bem-sucedida
+        """
+        if not self._initialized:
+            logger.warning("File source not initialized")
+            return False, None
+
+        try:
+            if self.realtime:
+                self._wait_for_next_frame()
+
+            # Com redimensionamento, decodifica num buffer interno reutilizado
+            buffer = frame if self._output_size is None else self._decode_buffer
+            success, frame_read = self._read_next(buffer)
+            if not success and self.loop:
+                self._rewind()
+                success, frame_read = self._read_next(buffer)
+
+            if not success:
+                return False, None
+
+            if self._output_size is not None:
+                self._decode_buffer = frame_read
+
+            if self._output_size is not None and self._output_size != (
+                frame_read.shape[1],
+                frame_read.shape[0],
+            ):
+                width, height = self._output_size
+                if frame is None or frame.shape != (height, width, 3):
+                    frame = None
+                frame = cv2.resize(frame_read, self._output_size, dst=frame)
+            else:
+                frame = frame_read
+
+            self.last_frame_timestamp = time.perf_counter()
+            return True, frame
+        except Exception as e:
+            logger.error(f"Error reading frame: {e}")
+            return False, None
+
+    def _wait_for_next_frame(self) -> None:
+        """Sincroniza o índice do próximo frame com o relógio de parede."""
+        now = time.perf_counter()
+        if self._start_time is None:
+            self._start_time = now - self._next_index / self.fps
+            return
+
+        due_index = int((now - self._start_time) * self.fps)
+        if due_index < self._next_index:
+            # Adiantado: espera o instante do próximo frame
+            time.sleep(self._start_time + self._next_index / self.fps - now)
+            return
+
+        # Atrasado: descarta os frames que já passaram
+        while self._next_index < due_index:
+            if not self._skip_frame():
+                break
+            self.dropped_frames += 1
+
+    def _read_next(
+        self, buffer: Optional[np.ndarray] = None
+    ) -> Tuple[bool, Optional[np.ndarray]]:
+        """Lê o próximo frame da sequência sem controle de tempo."""
+        if self.cap is not None:
+            success, frame = self.cap.read(buffer)
+        elif self._next_index < len(self._frame_paths):
+            frame = cv2.imread(self._frame_paths[self._next_index])
+            success = frame is not None
+            if success and buffer is not None and buffer.shape == frame.shape:
+                np.copyto(buffer, frame)
+                frame = buffer
+        else:
+            success, frame = False, None
+
+        if success:
+            self._next_index += 1
+        return success, frame
+
+    def _skip_frame(self) -> bool:
+        """Avança um frame sem decodificá-lo quando possível."""
+        if self.cap is not None:
+            if not self.cap.grab():
+                return False
+        elif self._next_index >= len(self._frame_paths):
+            return False
+
+        self._next_index += 1
+        return True
+
+    def _rewind(self) -> None:
+        """Volta ao início da sequência."""
+        if self.cap is not None:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self._next_index = 0
+        self._start_time = None
+
+    def get_frame_size(self) -> Tuple[int, int]:
+        """
+        Obtém as dimensões do frame.
+
+        Returns:
+            Tupla (largura, altura)
+        """
+        if not self._initialized:
+            return (0, 0)
+        return self._output_size or self._frame_size
+
+    def set_resolution(self, width: int, height: int) -> bool:
+        """
+        Define a resolução de saída; frames de outro tamanho são redimensionados.
+
+        Args:
+            width: Largura desejada
+            height: Altura desejada
+
+        Returns:
+            True se a resolução foi configurada com sucesso
+        """
+        if not self._initialized:
+            logger.warning("File source not initialized")
+            return False
+
+        if (width, height) == self._frame_size:
+            self._output_size = None
+        else:
+            self._output_size = (width, height)
+        logger.info(f"File source resolution set to {width}x{height}")
+        return True
+
+    def negotiate_mode(
+        self,
+        candidates: Iterable[Tuple[str, int, int, float]],
+        target_fps: float,
+        probe_frames: int = 20,
+    ) -> Optional[CameraMode]:
+        """
+        Mantém o tamanho nativo da fonte, sem sondar (a fonte é fixa).
+
+        Aplicar a resolução dos candidatos esticaria gravações de outra
+        proporção e somaria um resize por frame às medições de throughput;
+        quem precisar de outro tamanho usa set_resolution.
+
+        Args:
+            candidates: Combinações (fourcc, largura, altura, fps) (ignoradas)
+            target_fps: FPS mínimo desejado (ignorado)
+            probe_frames: Número de frames do probe (ignorado)
+
+        Returns:
+            Modo efetivo da fonte, ou None se não inicializada
+        """
+        if not self._initialized:
+            logger.warning("File source not initialized")
+            return None
+
+        width, height = self.get_frame_size()
+        return CameraMode("FILE", width, height, self.fps, self.fps)
+
+    def set_capture_mode(self, width: int, height: int, fps: float) -> Optional[CameraMode]:
+        """
+        Não altera a fonte: a taxa e o tamanho de um arquivo são fixos.
+
+        Args:
+            width: Largura desejada (ignorada)
+            height: Altura desejada (ignorada)
+            fps: FPS desejado (ignorado)
+
+        Returns:
+            Modo efetivo da fonte, ou None se não inicializada
+        """
+        if not self._initialized:
+            logger.warning("File source not initialized")
+            return None
+
+        width, height = self.get_frame_size()
+        return CameraMode("FILE", width, height, self.fps, self.fps)
+
+    def cleanup(self) -> None:
+        """Libera os recursos da fonte de vídeo."""
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+        self._initialized = False
+        logger.info("File source resources released")
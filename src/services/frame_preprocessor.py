@@ -0,0 +1,95 @@
+"""Pré-processamento de frames com buffers pré-alocados."""
+
+import logging
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class FramePreprocessor:
+    """
+    Espelha o frame e converte para RGB sem alocar memória por frame.
+
+    Os buffers de captura, exibição (BGR espelhado) e inferência (RGB) são
+    reutilizados entre frames e só são realocados quando a resolução muda.
+
+    Modos de espelhamento:
+        - "image": espelha o frame antes da inferência (comportamento original)
+        - "landmarks": a inferência usa o frame original e os landmarks são
+          espelhados depois; o frame só é espelhado para exibição
+    """
+
+    MIRROR_MODES = ("image", "landmarks")
+
+    def __init__(self, mirror_mode: str = "image", mirror_display: bool = True):
+        """
+        Inicializa o pré-processador sem buffers (alocados no 1º frame).
+
+        Args:
+            mirror_mode: "image" ou "landmarks"
+            mirror_display: Se False no modo "landmarks", exibe o frame sem espelhar
+        """
+        if mirror_mode not in self.MIRROR_MODES:
+            raise ValueError(f"Invalid mirror mode: {mirror_mode}")
+
+        self.mirror_mode = mirror_mode
+        self.mirror_display = mirror_display or mirror_mode == "image"
+        self._capture: Optional[np.ndarray] = None
+        self._display: Optional[np.ndarray] = None
+        self._rgb: Optional[np.ndarray] = None
+        self.reallocations = 0
+
+    @property
+    def mirrors_landmarks(self) -> bool:
+        """Indica se os resultados da inferência precisam ser espelhados."""
+        return self.mirror_mode == "landmarks"
+
+    @property
+    def capture_buffer(self) -> Optional[np.ndarray]:
+        """Buffer a ser reutilizado pela câmera na próxima leitura."""
+        return self._capture
+
+    def process(
+        self, frame: np.ndarray, need_rgb: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Prepara o frame capturado para exibição e inferência.
+
+        Args:
+            frame: Frame BGR lido da câmera
+            need_rgb: Se False (frame sem inferência), pula a conversão para
+                RGB; o buffer RGB retornado fica com o conteúdo anterior
+
+        Returns:
+            Tupla (display, rgb) com o frame BGR de exibição e o RGB de inferência
+        """
+        if self._rgb is None or self._rgb.shape != frame.shape:
+            self._allocate(frame.shape)
+
+        # Adota o frame como buffer de captura para a próxima leitura
+        self._capture = frame
+
+        if self.mirror_mode == "image":
+            cv2.flip(frame, 1, dst=self._display)
+            if need_rgb:
+                cv2.cvtColor(self._display, cv2.COLOR_BGR2RGB, dst=self._rgb)
+            return self._display, self._rgb
+
+        if need_rgb:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        if not self.mirror_display:
+            # Sem espelhamento: desenha direto sobre o frame capturado
+            return frame, self._rgb
+        cv2.flip(frame, 1, dst=self._display)
+        return self._display, self._rgb
+
+    def _allocate(self, shape: Tuple[int, ...]) -> None:
+        """Aloca os buffers para uma nova resolução."""
+        if self.mirror_display:
+            self._display = np.empty(shape, dtype=np.uint8)
+        self._rgb = np.empty(shape, dtype=np.uint8)
+        self.reallocations += 1
+        logger.info(f"Frame buffers allocated for {shape[1]}x{shape[0]}")
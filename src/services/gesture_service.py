@@ -2,90 +2,574 @@
 
 import logging
 import time
-from typing import Callable, Dict, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import numpy as np
 
+from src.domain.models import GestureEvents, HandFrame
+
 logger = logging.getLogger(__name__)
 
+# Landmark da ponta do polegar
+THUMB_TIP = 4
+
+# Punho e MCP do médio: o comprimento entre eles é a escala da mão
+WRIST = 0
+MIDDLE_MCP = 9
+
 
 class GestureService:
     """Detecta e processa gestos de toque entre dedos."""
 
-    def __init__(self, touch_threshold: float = 40):
+    def __init__(
+        self,
+        press_threshold: float = 0.3,
+        release_threshold: float = 0.42,
+        min_hold: float = 0.08,
+        left_hand_gestures: Optional[dict] = None,
+        right_hand_gestures: Optional[dict] = None,
+        max_hands: int = 2,
+        velocity_speed_range: Tuple[float, float] = (1.0, 10.0),
+        velocity_smoothing: float = 0.5,
+        default_velocity: float = 0.7,
+        clock: Callable[[], float] = time.perf_counter,
+        predictive: bool = False,
+        predictive_margin: float = 0.04,
+        predictive_max_frames: int = 3,
+    ):
         """
         Inicializa o serviço de detecção de gestos.
         
         Args:
-            touch_threshold: Distância em pixels para considerar um toque
+            press_threshold: Distância ponta-polegar, em comprimentos de mão
+                (punho -> MCP do médio), abaixo da qual o toque começa
+            release_threshold: Distância (mesma unidade) acima da qual o
+                toque termina; maior que press_threshold (histerese)
+            min_hold: Duração mínima de um toque em segundos; evita
+                retriggers quando o dedo oscila perto do limiar
+            left_hand_gestures: Configuração de gestos da mão esquerda
+            right_hand_gestures: Configuração de gestos da mão direita
+            max_hands: Número de mãos para o qual o estado é pré-alocado
+            velocity_speed_range: Velocidades de aproximação (comprimentos de
+                mão por segundo) mapeadas para velocity 0 e 1
+            velocity_smoothing: Peso da velocidade instantânea na média móvel
+                exponencial (1 = só o último frame)
+            default_velocity: Velocity de mãos sem histórico (recém-detectadas)
+            clock: Relógio monotônico em segundos
+            predictive: Dispara a nota quando o toque é previsto para o
+                próximo intervalo de frame, antes de acontecer
+            predictive_margin: Margem de confiança (comprimentos de mão): a
+                distância prevista precisa ficar essa folga abaixo do limiar
+            predictive_max_frames: Frames que uma previsão espera pelo toque
+                antes de ser cancelada
         """
-        self.touch_threshold = touch_threshold
-        self.active_gestures: Dict[int, Set[int]] = {}
+        if release_threshold < press_threshold:
+            raise ValueError("release_threshold must be >= press_threshold")
+        self.press_threshold = press_threshold
+        self.release_threshold = release_threshold
+        self.min_hold = min_hold
         self.active_notes: Dict[str, float] = {}  # {note_name: timestamp}
+        self.velocity_speed_range = velocity_speed_range
+        self.velocity_smoothing = velocity_smoothing
+        self.default_velocity = default_velocity
+        self.clock = clock
+        self.predictive = predictive
+        self.predictive_margin = predictive_margin
+        self.predictive_max_frames = predictive_max_frames
+        self.predictions = 0
+        self.cancellations = 0
+        self.reorders = 0
+
+        # Estado de toque por mão e coluna de gesto, pré-alocado
+        self._row_ids = np.empty(0, dtype=np.int64)
+        # Previsões descartadas com a linha da mão (sumiu ou teve o ID trocado)
+        self._lost: List[Tuple[int, int, dict]] = []
+        self._allocate_state(max_hands, 0)
+
+        # Gestos por lateralidade (0 = Left, 1 = Right), com padding
+        self._finger_ids = np.full((2, 0), THUMB_TIP, dtype=np.intp)
+        self._valid = np.zeros((2, 0), dtype=bool)
+        self._gesture_data: List[List[dict]] = [[], []]
+        self._config_cache: Dict[int, Tuple[dict, np.ndarray, np.ndarray]] = {}
+
+        if left_hand_gestures is not None and right_hand_gestures is not None:
+            self.configure(left_hand_gestures, right_hand_gestures)
+
+    def configure(self, left_hand_gestures: dict, right_hand_gestures: dict) -> None:
+        """
+        Define os gestos mapeados para cada mão.
+
+        Args:
+            left_hand_gestures: Configuração de gestos da mão esquerda
+            right_hand_gestures: Configuração de gestos da mão direita
+        """
+        configs = (left_hand_gestures, right_hand_gestures)
+        n_gestures = max(len(config) for config in configs)
+
+        self._finger_ids = np.full((2, n_gestures), THUMB_TIP, dtype=np.intp)
+        self._valid = np.zeros((2, n_gestures), dtype=bool)
+        for hand, config in enumerate(configs):
+            self._finger_ids[hand, : len(config)] = list(config.keys())
+            self._valid[hand, : len(config)] = True
+        self._gesture_data = [list(config.values()) for config in configs]
+        self._config_cache.clear()
+        self._resize_state(len(self._touching), n_gestures)
+
+    def gesture_data(self, handedness: int, column: int) -> dict:
+        """
+        Retorna os dados do gesto de uma coluna de GestureEvents.
+
+        Args:
+            handedness: 0 para mão esquerda, 1 para direita
+            column: Coluna do gesto
+
+        Returns:
+            Dicionário do gesto ({"sound": ..., "name": ...})
+        """
+        return self._gesture_data[handedness][column]
+
+    def detect_frame(self, hand_frame: HandFrame) -> GestureEvents:
+        """
+        Detecta gestos de todas as mãos do frame de uma só vez.
+
+        Todas as distâncias ponta-polegar são calculadas em uma única
+        operação vetorizada; transições de toque saem como máscaras. Se o
+        frame tiver ``track_ids`` (HandTracker), o estado de cada mão segue
+        o seu ID, mesmo que o MediaPipe mude a ordem das mãos.
+
+        Args:
+            hand_frame: Landmarks de todas as mãos do frame
+
+        Returns:
+            Eventos de toque (estado, pressionados e soltos) do frame
+        """
+        if hand_frame.track_ids is not None:
+            self._align_rows(hand_frame.track_ids)
+        events = self._detect_batch(
+            hand_frame.points,
+            self._finger_ids[hand_frame.handedness],
+            self._valid[hand_frame.handedness],
+        )
+        self._row_handedness[: hand_frame.n_hands] = hand_frame.handedness
+        # Mãos ausentes perdem o histórico de velocidade (o toque é mantido)
+        if hand_frame.n_hands < len(self._fresh):
+            self._reset_velocity(slice(hand_frame.n_hands, None))
+        # Inclui o que reset() enfileirou entre frames
+        events.lost = self._lost
+        self._lost = []
+
+        if events.pressed.any():
+            now = time.time()
+            for hand_idx, column in zip(*np.nonzero(events.pressed)):
+                gesture = self._gesture_data[hand_frame.handedness[hand_idx]][column]
+                self.active_notes[gesture["name"]] = now
+                logger.info(f"Gesture detected: {gesture['name']}")
+
+        return events
+
+    def _align_rows(self, track_ids: np.ndarray) -> None:
+        """
+        Reordena as linhas de estado para que a linha i seja a mão i do frame.
+
+        No caso comum (mesmas mãos, mesma ordem) custa uma comparação. Mãos
+        ausentes mantêm suas linhas depois das presentes, para retomar o
+        estado se voltarem; um ID novo ocupa uma linha livre (ou a de uma
+        mão ausente) com o estado zerado.
+
+        Args:
+            track_ids: (n,) IDs persistentes das mãos do frame
+        """
+        n_hands = len(track_ids)
+        if n_hands > len(self._row_ids):
+            self._resize_state(n_hands, self._touching.shape[1])
+        row_ids = self._row_ids
+        if np.array_equal(row_ids[:n_hands], track_ids):
+            return
+
+        order = np.full(len(row_ids), -1, dtype=np.intp)
+        taken = np.zeros(len(row_ids), dtype=bool)
+        for hand, track_id in enumerate(track_ids.tolist()):
+            match = np.flatnonzero(row_ids == track_id)
+            if len(match):
+                order[hand] = match[0]
+                taken[match[0]] = True
+
+        # Linhas livres primeiro: o estado de mãos ausentes é o último a ser descartado
+        spare = np.flatnonzero(~taken)
+        spare = spare[np.argsort(row_ids[spare] >= 0, kind="stable")]
+        new_rows = np.flatnonzero(order[:n_hands] < 0)
+        order[new_rows] = spare[: len(new_rows)]
+        order[n_hands:] = spare[len(new_rows):]
+
+        for state in (*self._row_state(), row_ids):
+            state[:] = state[order]
+
+        # Reseta antes de trocar o ID, para previsões perdidas levarem o ID antigo
+        self._touching[new_rows] = False
+        self._reset_velocity(new_rows)
+        row_ids[new_rows] = track_ids[new_rows]
+        self.reorders += 1
+
+    def _detect_batch(
+        self,
+        points: np.ndarray,
+        finger_ids: np.ndarray,
+        valid: np.ndarray,
+        first_hand: int = 0,
+    ) -> GestureEvents:
+        """
+        Núcleo vetorizado: distâncias, limiares e transições de estado.
+
+        As distâncias são divididas pela escala de cada mão (punho -> MCP
+        do médio), então os limiares valem para qualquer resolução e
+        distância da câmera. Um toque começa abaixo de press_threshold e só
+        termina acima de release_threshold, depois de durar min_hold.
+
+        Args:
+            points: (n, 21, 2) pontos em pixels das mãos first_hand..first_hand+n
+            finger_ids: (n, g) landmark do dedo de cada gesto
+            valid: (n, g) máscara das colunas de gesto válidas
+            first_hand: Índice da primeira mão (linha do estado)
+        """
+        n_hands, n_gestures = finger_ids.shape
+        last_hand = first_hand + n_hands
+        if last_hand > len(self._touching) or n_gestures != self._touching.shape[1]:
+            self._resize_state(max(last_hand, len(self._touching)), n_gestures)
+
+        # Um único gather de todas as pontas de dedo, via índice plano
+        flat_index = finger_ids + self._row_offsets[:n_hands]
+        offsets = points.reshape(-1, 2)[flat_index] - points[:, THUMB_TIP : THUMB_TIP + 1]
+        distances = np.hypot(offsets[..., 0], offsets[..., 1])
+
+        axis = points[:, MIDDLE_MCP] - points[:, WRIST]
+        scale = np.hypot(axis[:, 0], axis[:, 1])
+        np.maximum(scale, 1.0, out=scale)
+        distances /= scale[:, None]
+
+        now = self.clock()
+        rows = slice(first_hand, last_hand)
+        previous = self._touching[rows]
+        hold_until = self._hold_until[rows]
+
+        # Histerese: continua tocando até passar do limiar de soltura e do hold mínimo
+        touching = distances < self.press_threshold
+        sustained = distances < self.release_threshold
+        sustained |= hold_until > now
+        sustained &= previous
+        touching |= sustained
+        touching &= valid
+        pressed = touching & ~previous
+        released = previous & ~touching
+        previous[:] = touching
+        np.copyto(hold_until, now + self.min_hold, where=pressed)
+        self._state_fingers[rows] = finger_ids
+
+        velocity = self._update_velocity(distances, first_hand, last_hand, now)
+        if self.predictive:
+            predicted, confirmed, cancelled = self._predict_onsets(
+                distances, touching, valid, first_hand, last_hand
+            )
+            onsets = predicted | (pressed & ~confirmed)
+        else:
+            predicted = confirmed = cancelled = self._no_events[first_hand:last_hand]
+            onsets = pressed
+
+        return GestureEvents(
+            finger_ids=finger_ids,
+            valid=valid,
+            distances=distances,
+            touching=touching,
+            pressed=pressed,
+            released=released,
+            velocity=velocity,
+            onsets=onsets,
+            predicted=predicted,
+            confirmed=confirmed,
+            cancelled=cancelled,
+        )
+
+    def _predict_onsets(
+        self,
+        distances: np.ndarray,
+        touching: np.ndarray,
+        valid: np.ndarray,
+        first_hand: int,
+        last_hand: int,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Prevê toques do próximo intervalo de frame e resolve previsões pendentes.
+
+        A distância é extrapolada com a velocidade e a aceleração de
+        aproximação (d - v*h - a*h²/2, com h = último intervalo de frame).
+        Uma previsão pendente é confirmada quando o toque chega, ou
+        cancelada se o dedo parar/se afastar ou o toque não vier em
+        ``predictive_max_frames`` frames.
+
+        Args:
+            distances: (n, g) distâncias ponta-polegar do frame
+            touching: (n, g) toques reais deste frame
+            valid: (n, g) colunas de gesto válidas
+            first_hand: Primeira linha do estado
+            last_hand: Linha após a última
+
+        Returns:
+            Máscaras (predicted, confirmed, cancelled)
+        """
+        rows = slice(first_hand, last_hand)
+        n_hands = last_hand - first_hand
+        speed = self._speed[rows]
+
+        # _instant guarda a variação da velocidade neste frame (ver _update_velocity)
+        horizon = np.minimum(self._dt[:n_hands], 0.1)[:, None]
+        acceleration = self._instant[:n_hands] / horizon
+        projected = distances - speed * horizon - 0.5 * acceleration * horizon**2
+
+        pending = self._pending[rows]
+        age = self._pending_age[rows]
+        age += pending
+
+        confirmed = pending & touching
+        cancelled = pending & ~touching
+        cancelled &= (speed <= 0) | (age > self.predictive_max_frames)
+        pending &= ~(confirmed | cancelled)
+
+        predicted = projected < self.press_threshold - self.predictive_margin
+        predicted &= valid & ~touching & ~pending & (speed > 0)
+        # Aceleração exige três amostras de distância da mesma mão
+        predicted &= (self._history_frames[rows] >= 3)[:, None]
+        pending |= predicted
+        age[~pending] = 0
+
+        self.predictions += int(np.count_nonzero(predicted))
+        self.cancellations += int(np.count_nonzero(cancelled))
+        return predicted, confirmed, cancelled
+
+    def _update_velocity(
+        self, distances: np.ndarray, first_hand: int, last_hand: int, now: float
+    ) -> np.ndarray:
+        """
+        Atualiza a velocidade de aproximação e a converte em velocity [0, 1].
+
+        A velocidade é a queda da distância normalizada por segundo,
+        suavizada por média móvel exponencial. Todas as operações escrevem
+        em buffers pré-alocados (``out=``), sem alocar arrays por frame.
+
+        Args:
+            distances: (n, g) distâncias ponta-polegar normalizadas do frame
+            first_hand: Primeira linha do estado
+            last_hand: Linha após a última
+            now: Instante do frame (s)
+
+        Returns:
+            View (n, g) com a velocity de cada gesto
+        """
+        rows = slice(first_hand, last_hand)
+        n_hands = last_hand - first_hand
+
+        # Linhas sem histórico têm _prev_time = -inf: dt infinito, velocidade 0
+        dt = self._dt[:n_hands]
+        np.subtract(now, self._prev_time[rows], out=dt)
+        np.maximum(dt, 1e-3, out=dt)
+
+        # EMA: speed += a * (instantânea - speed)
+        instant = self._instant[:n_hands]
+        np.subtract(self._prev_distance[rows], distances, out=instant)
+        np.divide(instant, dt[:, None], out=instant)
+        speed = self._speed[rows]
+        np.subtract(instant, speed, out=instant)
+        instant *= self.velocity_smoothing
+        speed += instant
+
+        self._prev_distance[rows] = distances
+        self._prev_time[rows] = now
+        self._history_frames[rows] += 1
+
+        low, high = self.velocity_speed_range
+        scale = 1.0 / (high - low)
+        velocity = self._velocity[rows]
+        np.multiply(speed, scale, out=velocity)
+        velocity -= low * scale
+        np.maximum(velocity, 0.0, out=velocity)
+        np.minimum(velocity, 1.0, out=velocity)
+
+        fresh = self._fresh[rows]
+        np.copyto(velocity, self.default_velocity, where=fresh[:, None])
+        fresh[:] = False
+        return velocity
+
+    def _row_state(self) -> Tuple[np.ndarray, ...]:
+        """Arrays de estado que pertencem a uma mão (uma linha por mão)."""
+        return (
+            self._touching,
+            self._hold_until,
+            self._state_fingers,
+            self._prev_distance,
+            self._prev_time,
+            self._fresh,
+            self._history_frames,
+            self._speed,
+            self._pending,
+            self._pending_age,
+            self._row_handedness,
+        )
+
+    def _resize_state(self, n_hands: int, n_gestures: int) -> None:
+        """
+        Realoca o estado para outro número de mãos/gestos.
+
+        O bloco comum (mãos e colunas que já existiam) é preservado: toques
+        em andamento não são soltos nem disparados de novo. Linhas e colunas
+        novas começam zeradas.
+        """
+        previous = self._row_state()
+        self._allocate_state(n_hands, n_gestures)
+        columns = min(previous[0].shape[1], n_gestures)
+        for old, new in zip(previous, self._row_state()):
+            rows = min(len(old), n_hands)
+            if old.ndim == 1:
+                new[:rows] = old[:rows]
+            else:
+                new[:rows, :columns] = old[:rows, :columns]
+
+    def _allocate_state(self, n_hands: int, n_gestures: int) -> None:
+        """Aloca o estado zerado para n_hands mãos e n_gestures gestos."""
+        self._touching = np.zeros((n_hands, n_gestures), dtype=bool)
+        # ID de mão de cada linha; sem tracker, o próprio índice
+        row_ids = np.arange(n_hands, dtype=np.int64)
+        kept = min(n_hands, len(self._row_ids))
+        row_ids[:kept] = self._row_ids[:kept]
+        self._row_ids = row_ids
+        self._row_handedness = np.zeros(n_hands, dtype=np.intp)
+        self._hold_until = np.zeros((n_hands, n_gestures), dtype=np.float64)
+        self._state_fingers = np.full((n_hands, n_gestures), THUMB_TIP, dtype=np.intp)
+        self._row_offsets = (np.arange(n_hands, dtype=np.intp) * 21)[:, None]
+
+        # Histórico de velocidade
+        self._prev_distance = np.zeros((n_hands, n_gestures), dtype=np.float32)
+        self._prev_time = np.zeros(n_hands, dtype=np.float64)
+        self._fresh = np.zeros(n_hands, dtype=bool)
+        self._history_frames = np.zeros(n_hands, dtype=np.int32)
+        self._speed = np.zeros((n_hands, n_gestures), dtype=np.float32)
+        self._instant = np.zeros((n_hands, n_gestures), dtype=np.float32)
+        self._dt = np.zeros(n_hands, dtype=np.float64)
+        self._velocity = np.zeros((n_hands, n_gestures), dtype=np.float32)
+
+        # Previsões de toque aguardando confirmação
+        self._pending = np.zeros((n_hands, n_gestures), dtype=bool)
+        self._pending_age = np.zeros((n_hands, n_gestures), dtype=np.int32)
+        self._no_events = np.zeros((n_hands, n_gestures), dtype=bool)
+        self._reset_velocity(slice(None))
+
+    def _reset_velocity(self, rows) -> None:
+        """
+        Descarta o histórico de velocidade (e previsões) das linhas dadas.
+
+        Previsões pendentes já dispararam nota: em vez de sumirem, entram em
+        ``_lost`` como canceladas, para o note-off sair no próximo
+        GestureEvents.
+        """
+        pending = self._pending[rows]
+        if pending.any():
+            handedness = self._row_handedness[rows]
+            row_ids = self._row_ids[rows]
+            for row, column in zip(*np.nonzero(pending)):
+                gestures = self._gesture_data[handedness[row]]
+                if column < len(gestures):
+                    self._lost.append((int(row_ids[row]), int(column), gestures[column]))
+            self.cancellations += int(np.count_nonzero(pending))
+        self._prev_time[rows] = -np.inf
+        self._speed[rows] = 0.0
+        self._fresh[rows] = True
+        self._history_frames[rows] = 0
+        self._pending[rows] = False
+
+    def _config_arrays(self, gesture_config: dict) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converte (com cache) uma configuração de gestos em arrays (1, g).
+
+        Todas as configurações usam a mesma largura g do estado; uma
+        configuração maior alarga o estado sem perder os toques em andamento.
+        """
+        if len(gesture_config) > self._touching.shape[1]:
+            self._grow_gestures(len(gesture_config))
+        n_gestures = self._touching.shape[1]
+        cached = self._config_cache.get(id(gesture_config))
+        if (
+            cached is None
+            or cached[0] is not gesture_config
+            or cached[1].shape[1] != n_gestures
+        ):
+            finger_ids = np.full((1, n_gestures), THUMB_TIP, dtype=np.intp)
+            finger_ids[0, : len(gesture_config)] = list(gesture_config.keys())
+            valid = finger_ids != THUMB_TIP
+            cached = (gesture_config, finger_ids, valid)
+            self._config_cache[id(gesture_config)] = cached
+        return cached[1], cached[2]
+
+    def _grow_gestures(self, n_gestures: int) -> None:
+        """Alarga o estado e os gestos configurados para n_gestures colunas."""
+        finger_ids = np.full((2, n_gestures), THUMB_TIP, dtype=np.intp)
+        valid = np.zeros((2, n_gestures), dtype=bool)
+        finger_ids[:, : self._finger_ids.shape[1]] = self._finger_ids
+        valid[:, : self._valid.shape[1]] = self._valid
+        self._finger_ids = finger_ids
+        self._valid = valid
+        self._resize_state(len(self._touching), n_gestures)
 
     def detect_finger_gestures(
         self,
-        hand_landmarks,
+        hand_frame: HandFrame,
         hand_idx: int,
         gesture_config: dict,
-        w: int,
-        h: int,
         on_gesture: Callable[[str, dict], None],
     ) -> Set[int]:
         """
-        Detecta gestos de toque entre dedos e polegar.
+        Detecta gestos de toque entre dedos e polegar de uma única mão.
+
+        Wrapper do detector vetorizado para quem processa mão por mão.
         
         Args:
-            hand_landmarks: Landmarks da mão do MediaPipe
+            hand_frame: Landmarks de todas as mãos do frame
             hand_idx: Índice da mão
             gesture_config: Configuração de gestos para esta mão
-            w: Largura do frame
-            h: Altura do frame
             on_gesture: Callback chamado quando um gesto é detectado
             
         Returns:
             Conjunto de IDs de dedos atualmente tocando o polegar
         """
-        thumb_tip = hand_landmarks.landmark[4]
-        thumb_pos = np.array([thumb_tip.x * w, thumb_tip.y * h])
+        finger_ids, valid = self._config_arrays(gesture_config)
+        events = self._detect_batch(
+            hand_frame.points[hand_idx : hand_idx + 1], finger_ids, valid, hand_idx
+        )
 
-        if hand_idx not in self.active_gestures:
-            self.active_gestures[hand_idx] = set()
+        for finger_id in events.finger_ids[events.pressed].tolist():
+            gesture_data = gesture_config[finger_id]
+            note_name = gesture_data["name"]
+            self.active_notes[note_name] = time.time()
 
-        current_touches = set()
+            # Chama callback
+            on_gesture(note_name, gesture_data)
 
-        for finger_id, gesture_data in gesture_config.items():
-            finger_tip = hand_landmarks.landmark[finger_id]
-            finger_pos = np.array([finger_tip.x * w, finger_tip.y * h])
-            distance = np.linalg.norm(finger_pos - thumb_pos)
+            logger.info(f"Gesture detected: {note_name}")
 
-            if distance < self.touch_threshold:
-                current_touches.add(finger_id)
+        return events.active(0)
 
-                # Gesto novo (não estava tocando antes)
-                if finger_id not in self.active_gestures[hand_idx]:
-                    note_name = gesture_data["name"]
-                    self.active_notes[note_name] = time.time()
-                    
-                    # Chama callback
-                    on_gesture(note_name, gesture_data)
-                    
-                    logger.info(f"Gesture detected: {note_name}")
-
-        self.active_gestures[hand_idx] = current_touches
-        return current_touches
-
-    def get_active_gestures(self, hand_idx: int) -> Set[int]:
+    def get_active_gestures(self, hand_id: int) -> Set[int]:
         """
         Retorna os gestos ativos para uma mão.
         
         Args:
-            hand_idx: Índice da mão
+            hand_id: ID persistente da mão (``HandFrame.track_ids``) ou,
+                sem tracker, o índice da mão
             
         Returns:
             Conjunto de IDs de dedos atualmente ativos
         """
-        return self.active_gestures.get(hand_idx, set())
+        rows = np.flatnonzero(self._row_ids == hand_id)
+        if not len(rows):
+            return set()
+        row = rows[0]
+        return set(self._state_fingers[row][self._touching[row]].tolist())
 
     def clear_old_notes(self, max_age: float = 0.5) -> None:
         """
@@ -106,5 +590,6 @@ class GestureService:
 
     def reset(self) -> None:
         """Reseta todos os gestos ativos."""
-        self.active_gestures.clear()
+        self._touching[:] = False
+        self._reset_velocity(slice(None))
         self.active_notes.clear()
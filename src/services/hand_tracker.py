@@ -0,0 +1,121 @@
+"""Identidade persistente das mãos entre frames."""
+
+import logging
+import math
+from typing import Dict, List
+
+import numpy as np
+
+from src.domain.models import HandFrame
+
+logger = logging.getLogger(__name__)
+
+# Landmark do punho, usado para casar mãos entre frames
+WRIST = 0
+
+
+class HandTracker:
+    """
+    Atribui IDs persistentes às mãos de cada frame.
+
+    O MediaPipe não garante a ordem das mãos na lista: quando elas se
+    cruzam ou uma some por um frame, o índice 0 pode passar a ser a outra
+    mão. O tracker casa cada mão com a trilha mais próxima do frame
+    anterior pela posição do punho (em coordenadas normalizadas), com uma
+    penalidade quando a lateralidade difere. Com no máximo algumas mãos, o
+    casamento guloso pelo menor custo basta e custa poucos microssegundos.
+    """
+
+    def __init__(
+        self,
+        max_tracks: int = 4,
+        max_distance: float = 0.2,
+        handedness_penalty: float = 0.1,
+        max_missing_frames: int = 15,
+    ):
+        """
+        Inicializa o tracker.
+
+        Args:
+            max_tracks: Número máximo de trilhas mantidas (mãos visíveis e
+                mãos recém-perdidas)
+            max_distance: Deslocamento máximo do punho entre frames, em
+                fração da largura/altura da imagem
+            handedness_penalty: Custo extra (mesma unidade) ao casar mãos de
+                lateralidade diferente; absorve trocas esporádicas do MediaPipe
+            max_missing_frames: Frames que uma trilha sobrevive sem ser vista
+        """
+        self.max_tracks = max_tracks
+        self.max_distance = max_distance
+        self.handedness_penalty = handedness_penalty
+        self.max_missing_frames = max_missing_frames
+
+        # Trilhas vivas: {id: [x, y, lateralidade, frames sem ser vista]}.
+        # São poucas, então escalares Python saem mais baratos que arrays.
+        self._tracks: Dict[int, List[float]] = {}
+        self._next_id = 0
+
+    @property
+    def n_tracks(self) -> int:
+        """Número de trilhas vivas (vistas ou recém-perdidas)."""
+        return len(self._tracks)
+
+    def update(self, hand_frame: HandFrame) -> np.ndarray:
+        """
+        Casa as mãos do frame com as trilhas e preenche ``hand_frame.track_ids``.
+
+        Args:
+            hand_frame: Landmarks de todas as mãos do frame
+
+        Returns:
+            (n_hands,) int64 com o ID persistente de cada mão
+        """
+        wrists = hand_frame.landmarks[:, WRIST, :2].tolist()
+        handedness = hand_frame.handedness.tolist()
+        ids: List[int] = [-1] * len(wrists)
+
+        # Pares (custo, mão, trilha) plausíveis, do mais barato ao mais caro
+        candidates = []
+        for track_id, (tx, ty, track_hand, _) in self._tracks.items():
+            for hand, (x, y) in enumerate(wrists):
+                cost = math.hypot(x - tx, y - ty)
+                if handedness[hand] != track_hand:
+                    cost += self.handedness_penalty
+                if cost <= self.max_distance:
+                    candidates.append((cost, hand, track_id))
+        candidates.sort()
+
+        claimed = set()
+        for _, hand, track_id in candidates:
+            if ids[hand] < 0 and track_id not in claimed:
+                ids[hand] = track_id
+                claimed.add(track_id)
+
+        for track_id, track in list(self._tracks.items()):
+            if track_id not in claimed:
+                track[3] += 1
+                if track[3] > self.max_missing_frames:
+                    del self._tracks[track_id]
+
+        for hand, (x, y) in enumerate(wrists):
+            if ids[hand] < 0:
+                ids[hand] = self._open_track()
+            self._tracks[ids[hand]] = [x, y, handedness[hand], 0]
+
+        track_ids = np.array(ids, dtype=np.int64)
+        hand_frame.track_ids = track_ids
+        return track_ids
+
+    def _open_track(self) -> int:
+        """Reserva um ID novo, descartando a trilha ausente há mais tempo se cheio."""
+        if len(self._tracks) >= self.max_tracks:
+            oldest = max(self._tracks, key=lambda track_id: self._tracks[track_id][3])
+            del self._tracks[oldest]
+        track_id = self._next_id
+        self._next_id += 1
+        logger.debug(f"New hand track {track_id}")
+        return track_id
+
+    def reset(self) -> None:
+        """Descarta todas as trilhas."""
+        self._tracks.clear()
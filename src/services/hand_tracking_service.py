@@ -1,10 +1,23 @@
 """Serviço de rastreamento de mãos usando MediaPipe."""
 
 import logging
-from typing import Optional, Any
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
 
+import cv2
+import numpy as np
 from mediapipe.python.solutions.hands import Hands
 
+from src.domain.models import HandFrame
+from src.services.hand_tracking_worker import (
+    HandTrackingWorker,
+    PackedResults,
+    pack_results,
+    runs_palm_detection,
+    unpack_results,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +29,14 @@ class HandTrackingService:
         max_num_hands: int = 2,
         min_detection_confidence: float = 0.7,
         min_tracking_confidence: float = 0.7,
+        model_complexity: int = 1,
+        inference_scale: float = 1.0,
+        pipelined: bool = False,
+        roi: bool = False,
+        roi_padding: float = 0.35,
+        roi_working_size: int = 320,
+        roi_max_coverage: float = 0.6,
+        roi_refresh_frames: int = 15,
     ):
         """
         Inicializa o serviço de rastreamento de mãos.
@@ -24,13 +45,59 @@ class HandTrackingService:
             max_num_hands: Número máximo de mãos a detectar
             min_detection_confidence: Confiança mínima para detecção
             min_tracking_confidence: Confiança mínima para rastreamento
+            model_complexity: Complexidade do modelo de landmarks (0 ou 1)
+            inference_scale: Escala da imagem enviada à inferência (<= 1);
+                os landmarks continuam nas coordenadas do frame exibido
+            pipelined: Se True, a inferência roda em um processo worker e
+                process_frame retorna o resultado do frame anterior
+            roi: Se True (só no modo inline), a inferência recebe apenas a
+                região ao redor das mãos do frame anterior
+            roi_padding: Margem da região, em fração do tamanho da caixa das mãos
+            roi_working_size: Maior lado da região enviada à inferência (px);
+                regiões maiores são reduzidas
+            roi_max_coverage: Fração da área do frame acima da qual a região
+                não compensa e o frame inteiro é usado
+            roi_refresh_frames: Frames seguidos de região antes de um frame
+                inteiro, para encontrar mãos que entraram fora dela
         """
         self.max_num_hands = max_num_hands
         self.min_detection_confidence = min_detection_confidence
         self.min_tracking_confidence = min_tracking_confidence
+        self.model_complexity = model_complexity
+        self.inference_scale = inference_scale
+        self._scaled: Optional[np.ndarray] = None
+        self.pipelined = pipelined
+        self.roi = roi
+        self.roi_padding = roi_padding
+        self.roi_working_size = roi_working_size
+        self.roi_max_coverage = roi_max_coverage
+        self.roi_refresh_frames = roi_refresh_frames
+        self._roi_crop: Optional[np.ndarray] = None
         self.hands: Optional[Hands] = None
+        self.worker: Optional[HandTrackingWorker] = None
         self._initialized = False
 
+        # Worker com a nova configuração, iniciado em segundo plano
+        self._rebuild_thread: Optional[threading.Thread] = None
+        self._next_worker: Optional[HandTrackingWorker] = None
+
+        # Região (x0, y0, x1, y1) em pixels para o próximo frame; None = frame inteiro
+        self._roi_box: Optional[Tuple[int, int, int, int]] = None
+        self._roi_streak = 0
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.roi_fallbacks = 0
+
+        # Frames em que o MediaPipe só rastreou vs. rodou o detector de palma,
+        # apurados a cada Hands.process (região, frame inteiro ou worker)
+        self._previous_hands = 0  # Mãos da última chamada da instância inline
+        self._frame_detection: Optional[bool] = None
+        self._frame_inference_time = 0.0
+        self.tracking_frames = 0
+        self.detection_frames = 0
+        self._tracking_time = 0.0
+        self._detection_time = 0.0
+
     def initialize(self) -> bool:
         """
         Inicializa o MediaPipe Hands.
@@ -38,12 +105,18 @@ class HandTrackingService:
         Returns:
             True se foi inicializado com sucesso
         """
+        if self.pipelined:
+            self.worker = HandTrackingWorker(self._hands_config())
+            if self.worker.start():
+                self._initialized = True
+                logger.info("Hand tracking service initialized in pipelined mode")
+                return True
+            logger.warning("Falling back to inline hand tracking")
+            self.worker = None
+            self.pipelined = False
+
         try:
-            self.hands = Hands(
-                max_num_hands=self.max_num_hands,
-                min_detection_confidence=self.min_detection_confidence,
-                min_tracking_confidence=self.min_tracking_confidence,
-            )
+            self.hands = Hands(**self._hands_config())
             self._initialized = True
             logger.info("Hand tracking service initialized successfully")
             return True
@@ -51,9 +124,137 @@ class HandTrackingService:
             logger.error(f"Failed to initialize MediaPipe Hands: {e}")
             return False
 
+    def _hands_config(self) -> dict:
+        """Parâmetros repassados ao MediaPipe Hands."""
+        return {
+            "max_num_hands": self.max_num_hands,
+            "min_detection_confidence": self.min_detection_confidence,
+            "min_tracking_confidence": self.min_tracking_confidence,
+            "model_complexity": self.model_complexity,
+        }
+
+    def configure(
+        self,
+        inference_scale: Optional[float] = None,
+        model_complexity: Optional[int] = None,
+        min_detection_confidence: Optional[float] = None,
+        min_tracking_confidence: Optional[float] = None,
+    ) -> None:
+        """
+        Altera a qualidade da inferência em tempo de execução.
+
+        A escala vale a partir do próximo frame; mudanças no modelo ou nas
+        confianças recriam o MediaPipe Hands, o que custa algumas dezenas de
+        ms uma única vez. No modo pipelined, o worker novo é iniciado em
+        segundo plano e o atual segue processando até o novo ficar pronto.
+
+        Args:
+            inference_scale: Escala da imagem enviada à inferência
+            model_complexity: Complexidade do modelo de landmarks
+            min_detection_confidence: Confiança mínima para detecção
+            min_tracking_confidence: Confiança mínima para rastreamento
+        """
+        if inference_scale is not None:
+            self.inference_scale = inference_scale
+
+        previous = self._hands_config()
+        if model_complexity is not None:
+            self.model_complexity = model_complexity
+        if min_detection_confidence is not None:
+            self.min_detection_confidence = min_detection_confidence
+        if min_tracking_confidence is not None:
+            self.min_tracking_confidence = min_tracking_confidence
+        if self._hands_config() == previous or not self._initialized:
+            return
+
+        if self.worker is not None:
+            # Uma troca já em andamento confere a configuração ao terminar
+            if self._rebuild_thread is None:
+                self._start_rebuild()
+        elif self.hands is not None:
+            self.hands.close()
+            self._previous_hands = 0
+            try:
+                self.hands = Hands(**self._hands_config())
+            except Exception as e:
+                logger.error(f"Failed to reconfigure MediaPipe Hands: {e}")
+                self.hands = None
+                self._initialized = False
+        self._roi_box = None
+
+    def _start_rebuild(self) -> None:
+        """Inicia, em uma thread, um worker com a configuração atual."""
+        worker = HandTrackingWorker(self._hands_config())
+
+        def start() -> None:
+            if worker.start():
+                self._next_worker = worker
+            else:
+                logger.error("Failed to restart hand tracking worker, keeping the current one")
+
+        self._rebuild_thread = threading.Thread(
+            target=start, name="hand-tracking-rebuild", daemon=True
+        )
+        self._rebuild_thread.start()
+
+    def _submit(self, frame: np.ndarray) -> Optional[PackedResults]:
+        """
+        Envia um frame ao worker, trocando para o worker novo quando pronto.
+
+        Na troca, o resultado em voo do worker antigo é coletado e retornado,
+        então a latência de um frame se mantém sem um frame vazio.
+        """
+        thread = self._rebuild_thread
+        if thread is None or thread.is_alive():
+            return self._record_worker(self.worker, self.worker.submit(frame))
+
+        self._rebuild_thread = None
+        worker, self._next_worker = self._next_worker, None
+        if worker is None:
+            return self._record_worker(self.worker, self.worker.submit(frame))
+
+        previous = self._record_worker(self.worker, self.worker.finish())
+        self.worker.stop()
+        self.worker = worker
+        self.worker.submit(frame)
+        logger.info(f"Hand tracking worker reconfigured: {worker.hands_config}")
+        if worker.hands_config != self._hands_config():
+            self._start_rebuild()
+        return previous
+
+    def _record_worker(
+        self, worker: HandTrackingWorker, packed: Optional[PackedResults]
+    ) -> Optional[PackedResults]:
+        """Registra o caminho da inferência do resultado vindo do worker."""
+        if packed is not None and worker.last_palm_detection is not None:
+            self._record_inference(worker.last_palm_detection, worker.last_inference_time)
+        return packed
+
+    def _record_inference(self, detection: bool, elapsed: float) -> None:
+        """Acumula uma chamada ao MediaPipe no frame em andamento."""
+        self._frame_detection = bool(self._frame_detection) or detection
+        self._frame_inference_time += elapsed
+
+    def _inference_input(self, frame: np.ndarray) -> np.ndarray:
+        """Reduz o frame pela escala de inferência, em um buffer reutilizado."""
+        if self.inference_scale >= 1.0:
+            return frame
+        height, width = frame.shape[:2]
+        size = (
+            max(1, int(width * self.inference_scale)),
+            max(1, int(height * self.inference_scale)),
+        )
+        if self._scaled is None or self._scaled.shape[1::-1] != size:
+            self._scaled = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        cv2.resize(frame, size, dst=self._scaled, interpolation=cv2.INTER_LINEAR)
+        return self._scaled
+
     def process_frame(self, frame) -> Any:
         """
         Processa um frame para detectar mãos.
+
+        No modo pipelined o frame é enviado ao worker e o resultado retornado
+        é o do frame anterior (vazio na primeira chamada).
         
         Args:
             frame: Frame RGB a ser processado
@@ -61,18 +262,221 @@ class HandTrackingService:
         Returns:
             Resultados do processamento do MediaPipe
         """
-        if not self._initialized or self.hands is None:
+        if not self._initialized:
+            logger.warning("Hand tracking service not initialized")
+            return None
+
+        if self.worker is not None:
+            packed = self._submit(frame)
+            return unpack_results(*packed) if packed is not None else None
+
+        if self.hands is None:
             logger.warning("Hand tracking service not initialized")
             return None
         
+        detection = runs_palm_detection(self._previous_hands, self.max_num_hands)
+        start = time.perf_counter()
         try:
-            return self.hands.process(frame)
+            results = self.hands.process(frame)
         except Exception as e:
             logger.error(f"Error processing frame: {e}")
+            self._previous_hands = 0
             return None
+        self._record_inference(detection, time.perf_counter() - start)
+        self._previous_hands = len(getattr(results, "multi_hand_landmarks", None) or [])
+        return results
+
+    def detect(self, frame: np.ndarray) -> HandFrame:
+        """
+        Processa um frame e retorna as mãos como HandFrame.
+
+        Os landmarks são convertidos para arrays uma única vez aqui; no modo
+        pipelined o resultado compacto do worker é usado diretamente.
+
+        Args:
+            frame: Frame RGB a ser processado
+
+        Returns:
+            HandFrame projetado nas dimensões do frame (vazio em caso de erro)
+        """
+        self._frame_detection = None
+        self._frame_inference_time = 0.0
+        hand_frame = self._detect(frame)
+
+        # Um frame conta como detecção se qualquer chamada dele (ex.: região
+        # vazia + frame inteiro) rodou o detector; sem inferência, não conta
+        if self._frame_detection is True:
+            self.detection_frames += 1
+            self._detection_time += self._frame_inference_time
+        elif self._frame_detection is False:
+            self.tracking_frames += 1
+            self._tracking_time += self._frame_inference_time
+        return hand_frame
+
+    def tracking_stats(self) -> Dict[str, float]:
+        """
+        Frames rastreados vs. com detector de palma, e o tempo médio de cada.
+
+        O caminho vem de cada chamada real ao MediaPipe (região, frame
+        inteiro ou worker); o tempo é o da inferência, medido no worker no
+        modo pipelined. Frames sem inferência não entram.
+
+        Returns:
+            {"tracking_frames", "detection_frames", "tracking_ms", "detection_ms"}
+        """
+        return {
+            "tracking_frames": self.tracking_frames,
+            "detection_frames": self.detection_frames,
+            "tracking_ms": 1000 * self._tracking_time / max(self.tracking_frames, 1),
+            "detection_ms": 1000 * self._detection_time / max(self.detection_frames, 1),
+        }
+
+    def _detect(self, frame: np.ndarray) -> HandFrame:
+        """Roda a inferência no modo configurado (worker, região ou inline)."""
+        height, width = frame.shape[:2]
+
+        if self._initialized and self.worker is not None:
+            packed = self._submit(self._inference_input(frame))
+        elif self.roi:
+            return self._detect_roi(frame)
+        else:
+            results = self.process_frame(self._inference_input(frame))
+            packed = pack_results(results) if results is not None else None
+
+        if packed is None:
+            return HandFrame.empty(width, height)
+        return HandFrame.from_arrays(*packed, width, height)
+
+    def _detect_roi(self, frame: np.ndarray) -> HandFrame:
+        """
+        Detecta na região das mãos do frame anterior, com fallback para o frame inteiro.
+
+        A região é recortada (view), reduzida para ``roi_working_size`` e os
+        landmarks voltam para coordenadas normalizadas do frame inteiro.
+        Sem mãos na região, o mesmo frame é processado inteiro.
+        """
+        height, width = frame.shape[:2]
+        box = self._roi_box
+        if box is not None and self._roi_streak < self.roi_refresh_frames:
+            hand_frame = self._detect_in_box(frame, box)
+            if hand_frame.n_hands:
+                self.roi_frames += 1
+                self._roi_streak += 1
+                self._update_roi(hand_frame)
+                return hand_frame
+            self.roi_fallbacks += 1
+
+        results = self.process_frame(self._inference_input(frame))
+        packed = pack_results(results) if results is not None else None
+        if packed is None:
+            hand_frame = HandFrame.empty(width, height)
+        else:
+            hand_frame = HandFrame.from_arrays(*packed, width, height)
+        self.full_frames += 1
+        self._roi_streak = 0
+        self._update_roi(hand_frame)
+        return hand_frame
+
+    def _detect_in_box(
+        self, frame: np.ndarray, box: Tuple[int, int, int, int]
+    ) -> HandFrame:
+        """Roda a inferência na região e projeta os landmarks no frame inteiro."""
+        height, width = frame.shape[:2]
+        x0, y0, x1, y1 = box
+        crop = frame[y0:y1, x0:x1]
+        crop_h, crop_w = crop.shape[:2]
+        working_size = self.roi_working_size * min(self.inference_scale, 1.0)
+        scale = working_size / max(crop_h, crop_w)
+        if scale < 1.0:
+            size = (max(1, round(crop_w * scale)), max(1, round(crop_h * scale)))
+        else:
+            size = (crop_w, crop_h)
+
+        # Buffer reutilizado enquanto a região mantém o tamanho (caso comum)
+        if self._roi_crop is None or self._roi_crop.shape[1::-1] != size:
+            self._roi_crop = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        if scale < 1.0:
+            cv2.resize(crop, size, dst=self._roi_crop, interpolation=cv2.INTER_LINEAR)
+        else:
+            np.copyto(self._roi_crop, crop)
+        crop = self._roi_crop
+
+        results = self.process_frame(crop)
+        if results is None:
+            return HandFrame.empty(width, height)
+        landmarks, labels, scores = pack_results(results)
+        if len(landmarks) == 0:
+            return HandFrame.empty(width, height)
+
+        # z do MediaPipe tem a escala de x (largura da imagem de entrada)
+        landmarks[..., 0] = (landmarks[..., 0] * crop_w + x0) / width
+        landmarks[..., 1] = (landmarks[..., 1] * crop_h + y0) / height
+        landmarks[..., 2] *= crop_w / width
+        return HandFrame.from_arrays(landmarks, labels, scores, width, height)
+
+    def _update_roi(self, hand_frame: HandFrame) -> None:
+        """
+        Calcula a região do próximo frame a partir das mãos deste.
+
+        A região só muda quando as mãos se aproximam da borda da atual;
+        regiões estáveis mantêm o rastreamento do MediaPipe entre frames.
+        """
+        if hand_frame.n_hands == 0:
+            self._roi_box = None
+            return
+
+        width, height = hand_frame.width, hand_frame.height
+        points = hand_frame.landmarks[..., :2].reshape(-1, 2)
+        low = points.min(axis=0) * (width, height)
+        high = points.max(axis=0) * (width, height)
+        pad = (high - low).max() * self.roi_padding + 0.02 * max(width, height)
+
+        box = self._roi_box
+        if box is not None:
+            x0, y0, x1, y1 = box
+            margin = pad / 2
+            if (
+                low[0] - margin >= x0
+                and low[1] - margin >= y0
+                and high[0] + margin <= x1
+                and high[1] + margin <= y1
+            ):
+                return
+
+        x0, y0 = np.maximum(low - pad, 0).astype(int)
+        x1 = int(min(high[0] + pad, width))
+        y1 = int(min(high[1] + pad, height))
+        if (x1 - x0) * (y1 - y0) > self.roi_max_coverage * width * height:
+            self._roi_box = None
+        else:
+            self._roi_box = (int(x0), int(y0), x1, y1)
 
     def cleanup(self) -> None:
         """Libera os recursos do MediaPipe."""
+        total = self.tracking_frames + self.detection_frames
+        if total:
+            stats = self.tracking_stats()
+            logger.info(
+                f"Hand tracking: {stats['tracking_frames']} of {total} frames tracked "
+                f"({stats['tracking_ms']:.1f} ms avg), {stats['detection_frames']} "
+                f"ran palm detection ({stats['detection_ms']:.1f} ms avg)"
+            )
+        if self.roi and self.roi_frames + self.full_frames:
+            logger.info(
+                f"ROI inference: {self.roi_frames} cropped frames, "
+                f"{self.full_frames} full frames, {self.roi_fallbacks} fallbacks"
+            )
+        if self._rebuild_thread is not None:
+            self._rebuild_thread.join()
+            self._rebuild_thread = None
+        if self._next_worker is not None:
+            self._next_worker.stop()
+            self._next_worker = None
+        if self.worker is not None:
+            self.worker.stop()
+            self.worker = None
+            self._initialized = False
+            logger.info("Hand tracking worker stopped")
         if self.hands is not None:
             self.hands.close()
             self._initialized = False
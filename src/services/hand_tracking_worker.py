@@ -0,0 +1,306 @@
+"""Processo dedicado para inferência do MediaPipe Hands em pipeline."""
+
+import logging
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Número de slots de memória compartilhada (um em inferência, um sendo escrito)
+_NUM_SLOTS = 2
+
+
+# Resultado compacto: (landmarks (n, 21, 3) float32, rótulos, scores)
+PackedResults = Tuple[np.ndarray, List[str], List[float]]
+
+_EMPTY_RESULTS: PackedResults = (np.empty((0, 21, 3), dtype=np.float32), [], [])
+
+
+class WorkerResults(NamedTuple):
+    """Resultado reconstruído no processo principal, compatível com o MediaPipe."""
+    multi_hand_landmarks: Optional[List[Any]]
+    multi_handedness: Optional[List[Any]]
+
+
+def pack_results(results: Any) -> PackedResults:
+    """Compacta os resultados do MediaPipe em arrays."""
+    multi_hand_landmarks = getattr(results, "multi_hand_landmarks", None) or []
+    multi_handedness = getattr(results, "multi_handedness", None) or []
+
+    landmarks = np.array(
+        [
+            [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
+            for hand_landmarks in multi_hand_landmarks
+        ],
+        dtype=np.float32,
+    ).reshape(-1, 21, 3)
+
+    labels = [h.classification[0].label for h in multi_handedness]
+    scores = [h.classification[0].score for h in multi_handedness]
+    return landmarks, labels, scores
+
+
+def runs_palm_detection(previous_hands: int, max_num_hands: int) -> bool:
+    """
+    Indica se o próximo ``Hands.process`` roda o detector de palma.
+
+    O grafo do MediaPipe só pula o detector quando a chamada anterior, na
+    mesma instância, terminou com ``max_num_hands`` mãos rastreadas.
+
+    Args:
+        previous_hands: Mãos retornadas pela chamada anterior da instância
+        max_num_hands: Configuração da instância
+
+    Returns:
+        True se o detector de palma roda
+    """
+    return previous_hands < max_num_hands
+
+
+def unpack_results(
+    landmarks: np.ndarray, labels: List[str], scores: List[float]
+) -> WorkerResults:
+    """Reconstrói resultados no formato do MediaPipe a partir dos arrays."""
+    if len(landmarks) == 0:
+        return WorkerResults(None, None)
+
+    from mediapipe.framework.formats import classification_pb2, landmark_pb2
+
+    multi_hand_landmarks = []
+    multi_handedness = []
+    for hand, label, score in zip(landmarks, labels, scores):
+        landmark_list = landmark_pb2.NormalizedLandmarkList()
+        for x, y, z in hand.tolist():
+            landmark_list.landmark.add(x=x, y=y, z=z)
+        multi_hand_landmarks.append(landmark_list)
+
+        classification_list = classification_pb2.ClassificationList()
+        classification_list.classification.add(label=label, score=score)
+        multi_handedness.append(classification_list)
+
+    return WorkerResults(multi_hand_landmarks, multi_handedness)
+
+
+def _worker_main(
+    hands_config: Dict[str, Any],
+    requests: multiprocessing.Queue,
+    responses: multiprocessing.Queue,
+) -> None:
+    """Loop do processo worker: lê frames da memória compartilhada e infere."""
+    try:
+        from mediapipe.python.solutions.hands import Hands
+
+        hands = Hands(**hands_config)
+    except Exception as e:
+        responses.put(("error", str(e)))
+        return
+
+    responses.put(("ready", None))
+    attached: Dict[str, shared_memory.SharedMemory] = {}
+    max_num_hands = hands_config.get("max_num_hands", 2)
+    previous_hands = 0
+
+    try:
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+
+            seq, shm_name, shape = request
+            if shm_name not in attached:
+                if len(attached) >= _NUM_SLOTS:
+                    # Slots de uma resolução anterior: solta antes de anexar os novos
+                    for shm in attached.values():
+                        shm.close()
+                    attached.clear()
+                attached[shm_name] = shared_memory.SharedMemory(name=shm_name)
+            frame = np.ndarray(shape, dtype=np.uint8, buffer=attached[shm_name].buf)
+
+            detection = runs_palm_detection(previous_hands, max_num_hands)
+            start = time.perf_counter()
+            try:
+                packed = pack_results(hands.process(frame))
+            except Exception as e:
+                previous_hands = 0
+                responses.put(("error", str(e)))
+                continue
+            elapsed = time.perf_counter() - start
+            previous_hands = len(packed[0])
+            responses.put((seq, (packed, detection, elapsed)))
+    finally:
+        hands.close()
+        for shm in attached.values():
+            shm.close()
+
+
+class HandTrackingWorker:
+    """
+    Executa o MediaPipe Hands em outro processo, em pipeline com o loop.
+
+    Os frames são passados por memória compartilhada e os landmarks voltam
+    em forma compacta. Enquanto o frame N está em inferência, o processo
+    principal captura N+1 e desenha o resultado de N-1, então cada chamada
+    a submit() retorna o resultado do frame anterior.
+    """
+
+    def __init__(self, hands_config: Dict[str, Any], timeout: float = 1.0):
+        """
+        Inicializa o cliente do worker.
+
+        Args:
+            hands_config: Parâmetros repassados ao MediaPipe Hands
+            timeout: Tempo máximo de espera por um resultado, em segundos
+        """
+        self.hands_config = hands_config
+        self.timeout = timeout
+        self._process: Optional[multiprocessing.Process] = None
+        self._requests: Optional[multiprocessing.Queue] = None
+        self._responses: Optional[multiprocessing.Queue] = None
+        self._slots: List[shared_memory.SharedMemory] = []
+        self._slot_shape: Optional[Tuple[int, ...]] = None
+        self._seq = 0
+        self._in_flight: Optional[int] = None
+        self._first_result_pending = True
+        # Caminho da inferência do último resultado coletado (None = sem inferência)
+        self.last_palm_detection: Optional[bool] = None
+        self.last_inference_time = 0.0
+
+    def start(self, startup_timeout: float = 30.0) -> bool:
+        """
+        Inicia o processo worker e aguarda o MediaPipe carregar.
+
+        Returns:
+            True se o worker está pronto
+        """
+        context = multiprocessing.get_context("spawn")
+        self._requests = context.Queue()
+        self._responses = context.Queue()
+        self._process = context.Process(
+            target=_worker_main,
+            args=(self.hands_config, self._requests, self._responses),
+            name="hand-tracking-worker",
+            daemon=True,
+        )
+        self._process.start()
+
+        try:
+            status, detail = self._responses.get(timeout=startup_timeout)
+        except queue.Empty:
+            status, detail = "error", "startup timeout"
+
+        if status != "ready":
+            logger.error(f"Hand tracking worker failed to start: {detail}")
+            self.stop()
+            return False
+
+        logger.info(f"Hand tracking worker started (pid {self._process.pid})")
+        return True
+
+    def submit(self, frame: np.ndarray) -> Optional[PackedResults]:
+        """
+        Envia um frame para inferência e retorna o resultado do anterior.
+
+        Args:
+            frame: Frame RGB a ser processado
+
+        Returns:
+            Resultado compacto do frame enviado na chamada anterior (vazio na
+            primeira), ou None em caso de erro no worker
+        """
+        if self._slot_shape != frame.shape:
+            # Nova resolução: espera o frame em voo antes de trocar os slots
+            previous = self._collect()
+            self._allocate_slots(frame.shape)
+            slot_name = self._write_slot(frame)
+        else:
+            # Copia para o slot livre enquanto o worker ainda processa o anterior
+            slot_name = self._write_slot(frame)
+            previous = self._collect()
+
+        self._requests.put((self._seq, slot_name, frame.shape))
+        self._in_flight = self._seq
+        self._seq += 1
+
+        if self._first_result_pending:
+            self._first_result_pending = False
+            self.last_palm_detection = None
+            return _EMPTY_RESULTS
+        return previous
+
+    def finish(self) -> Optional[PackedResults]:
+        """
+        Aguarda o frame em voo e retorna o resultado dele.
+
+        Returns:
+            Resultado compacto do último frame enviado, ou None se não houver
+            frame em voo (ou em caso de erro)
+        """
+        return self._collect()
+
+    def _write_slot(self, frame: np.ndarray) -> str:
+        """Copia o frame para o próximo slot livre e retorna o nome dele."""
+        slot = self._slots[self._seq % _NUM_SLOTS]
+        np.copyto(np.ndarray(frame.shape, dtype=np.uint8, buffer=slot.buf), frame)
+        return slot.name
+
+    def _collect(self) -> Optional[PackedResults]:
+        """
+        Aguarda o resultado do frame em voo, se houver.
+
+        Também guarda em ``last_palm_detection`` e ``last_inference_time``
+        se o worker rodou o detector de palma nesse frame e quanto demorou.
+        """
+        self.last_palm_detection = None
+        if self._in_flight is None:
+            return None
+
+        expected, self._in_flight = self._in_flight, None
+        while True:
+            try:
+                seq, payload = self._responses.get(timeout=self.timeout)
+            except queue.Empty:
+                logger.error("Hand tracking worker timed out")
+                return None
+
+            if seq == "error":
+                logger.error(f"Error processing frame in worker: {payload}")
+                return None
+            if seq == expected:
+                packed, self.last_palm_detection, self.last_inference_time = payload
+                return packed
+
+    def _allocate_slots(self, shape: Tuple[int, ...]) -> None:
+        """(Re)cria os slots de memória compartilhada para a resolução dada."""
+        self._release_slots()
+        size = int(np.prod(shape))
+        self._slots = [
+            shared_memory.SharedMemory(create=True, size=size) for _ in range(_NUM_SLOTS)
+        ]
+        self._slot_shape = shape
+        logger.info(f"Hand tracking worker buffers allocated for {shape[1]}x{shape[0]}")
+
+    def _release_slots(self) -> None:
+        """Libera os slots de memória compartilhada."""
+        for shm in self._slots:
+            shm.close()
+            shm.unlink()
+        self._slots = []
+        self._slot_shape = None
+
+    def stop(self) -> None:
+        """Encerra o processo worker e libera a memória compartilhada."""
+        if self._process is not None:
+            if self._process.is_alive():
+                self._requests.put(None)
+                self._process.join(timeout=2.0)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+        self._in_flight = None
+        self._first_result_pending = True
+        self._release_slots()
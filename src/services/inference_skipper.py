@@ -0,0 +1,159 @@
+"""Inferência intermitente com extrapolação dos landmarks entre frames."""
+
+import logging
+import time
+from typing import Callable, Optional
+
+import numpy as np
+
+from src.domain.models import HandFrame
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceSkipper:
+    """
+    Decide em quais frames rodar o MediaPipe e extrapola os demais.
+
+    Depois de cada inferência, a velocidade de cada landmark é estimada
+    contra a inferência anterior da mesma mão (``track_ids``). Nos frames
+    pulados, os landmarks são a última posição somada a velocidade vezes o
+    tempo decorrido, de modo que gestos e desenho seguem na taxa da câmera.
+    O intervalo N entre inferências se adapta à mão mais rápida: o maior
+    deslocamento extrapolado por frame fica abaixo de ``max_step``, e mãos
+    rápidas voltam a ter inferência em todo frame.
+    """
+
+    def __init__(
+        self,
+        max_skip: int = 3,
+        max_step: float = 0.01,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Inicializa o skipper.
+
+        Args:
+            max_skip: Maior intervalo N entre inferências (1 = todo frame)
+            max_step: Deslocamento máximo tolerado por frame extrapolado, em
+                fração da imagem (coordenadas normalizadas)
+            clock: Relógio monotônico em segundos
+        """
+        self.max_skip = max(1, max_skip)
+        self.max_step = max_step
+        self.clock = clock
+
+        self.interval = 1
+        self._since_inference = 0
+        self._last: Optional[HandFrame] = None
+        self._last_time = 0.0
+        self._velocity = np.zeros((0, 21, 3), dtype=np.float32)
+        self._frame_dt = 1 / 30
+        self._frame_time: Optional[float] = None
+
+        self.inferred = 0
+        self.extrapolated = 0
+
+    def should_infer(self) -> bool:
+        """
+        Indica se o frame atual deve passar pela inferência.
+
+        Chamado uma vez por frame; também mede o intervalo entre frames.
+        """
+        now = self.clock()
+        if self._frame_time is not None:
+            self._frame_dt += 0.1 * (now - self._frame_time - self._frame_dt)
+        self._frame_time = now
+
+        if self._last is None or self._last.n_hands == 0:
+            return True
+        return self._since_inference + 1 >= self.interval
+
+    def observe(self, hand_frame: HandFrame) -> None:
+        """
+        Registra o resultado de uma inferência (já com ``track_ids``).
+
+        Deve ser chamado antes de filtros que alteram os landmarks no lugar.
+
+        Args:
+            hand_frame: Mãos detectadas neste frame
+        """
+        now = self.clock()
+        landmarks = hand_frame.landmarks.copy()
+        velocity = np.zeros_like(landmarks)
+
+        # Mãos sem inferência anterior não têm velocidade: N volta a 1
+        matched = 0
+        last = self._last
+        if last is not None and last.n_hands and hand_frame.n_hands:
+            dt = max(now - self._last_time, 1e-3)
+            previous = {
+                track_id: hand for hand, track_id in enumerate(last.track_ids.tolist())
+            }
+            for hand, track_id in enumerate(hand_frame.track_ids.tolist()):
+                match = previous.get(track_id)
+                if match is not None:
+                    np.subtract(landmarks[hand], last.landmarks[match], out=velocity[hand])
+                    matched += 1
+            velocity /= dt
+
+        self._last = HandFrame(
+            landmarks=landmarks,
+            handedness=hand_frame.handedness.copy(),
+            scores=hand_frame.scores,
+            width=hand_frame.width,
+            height=hand_frame.height,
+            track_ids=hand_frame.track_ids,
+        )
+        self._last_time = now
+        self._velocity = velocity
+        self._since_inference = 0
+        self.inferred += 1
+        self._adapt_interval(matched == hand_frame.n_hands)
+
+    def _adapt_interval(self, has_velocity: bool) -> None:
+        """Escolhe N pela velocidade da mão mais rápida."""
+        if self._last.n_hands == 0 or not has_velocity:
+            self.interval = 1
+            return
+        speed = float(np.abs(self._velocity[..., :2]).max())
+        step = speed * self._frame_dt
+        if step <= 0:
+            interval = self.max_skip
+        else:
+            interval = int(self.max_step / step)
+        interval = min(max(interval, 1), self.max_skip)
+        if interval != self.interval:
+            logger.debug(f"Inference interval {self.interval} -> {interval}")
+            self.interval = interval
+
+    def extrapolate(self) -> HandFrame:
+        """
+        Gera o HandFrame de um frame pulado a partir da última inferência.
+
+        Returns:
+            Mãos da última inferência movidas pela velocidade estimada
+        """
+        last = self._last
+        elapsed = self.clock() - self._last_time
+        landmarks = last.landmarks + self._velocity * np.float32(elapsed)
+        self._since_inference += 1
+        self.extrapolated += 1
+        return HandFrame(
+            landmarks=landmarks,
+            handedness=last.handedness.copy(),
+            scores=last.scores,
+            width=last.width,
+            height=last.height,
+            track_ids=last.track_ids,
+        )
+
+    def log_summary(self) -> None:
+        """Registra a fração de frames que passou pela inferência."""
+        total = self.inferred + self.extrapolated
+        if total:
+            logger.info(
+                f"Inference ran on {self.inferred} of {total} frames "
+                f"({100.0 * self.inferred / total:.0f}%), "
+                f"{self.extrapolated} extrapolated"
+            )
@@ -0,0 +1,171 @@
+"""Suavização adaptativa (One-Euro) dos landmarks das mãos."""
+
+import logging
+import math
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from src.domain.models import HandFrame
+
+logger = logging.getLogger(__name__)
+
+
+class LandmarkFilter:
+    """
+    Filtro One-Euro aplicado aos 21x3 landmarks de cada mão rastreada.
+
+    Um passa-baixas cuja frequência de corte cresce com a velocidade: parado,
+    o corte é ``min_cutoff`` e o tremor de poucos pixels some; em movimento
+    rápido, o corte sobe com ``beta`` e o atraso fica pequeno. O estado de
+    cada mão fica em uma linha de arrays pré-alocados, associada ao seu ID
+    persistente (``HandFrame.track_ids``), e todas as mãos são filtradas em
+    um único passo vetorizado.
+    """
+
+    def __init__(
+        self,
+        min_cutoff: float = 1.0,
+        beta: float = 10.0,
+        d_cutoff: float = 1.0,
+        max_hands: int = 2,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Inicializa o filtro.
+
+        Args:
+            min_cutoff: Frequência de corte com a mão parada (Hz)
+            beta: Ganho da frequência de corte com a velocidade (por unidade
+                de imagem/s, em coordenadas normalizadas)
+            d_cutoff: Frequência de corte da estimativa de velocidade (Hz)
+            max_hands: Número de mãos para o qual o estado é pré-alocado
+            clock: Relógio monotônico em segundos
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.clock = clock
+
+        self._row_of: Dict[int, int] = {}  # {ID da mão: linha do estado}
+        self._allocate(max_hands)
+
+    def _allocate(self, n_rows: int) -> None:
+        """Pré-aloca estado e buffers de trabalho para n_rows mãos."""
+        self._x = np.zeros((n_rows, 21, 3), dtype=np.float32)
+        self._dx = np.zeros((n_rows, 21, 3), dtype=np.float32)
+        # -inf = sem histórico: dt infinito faz o filtro devolver a entrada
+        self._t = np.full(n_rows, -np.inf, dtype=np.float64)
+        self._delta = np.zeros((n_rows, 21, 3), dtype=np.float32)
+        self._alpha = np.zeros((n_rows, 21, 3), dtype=np.float32)
+        self._dt = np.zeros((n_rows, 1, 1), dtype=np.float32)
+        self._d_alpha = np.zeros((n_rows, 1, 1), dtype=np.float32)
+        # Cópias do estado das linhas quando as mãos estão fora de ordem
+        self._x_rows = np.zeros((n_rows, 21, 3), dtype=np.float32)
+        self._dx_rows = np.zeros((n_rows, 21, 3), dtype=np.float32)
+        self._t_rows = np.zeros(n_rows, dtype=np.float64)
+        self._contiguous: List[int] = list(range(n_rows))
+        self._row_of.clear()
+
+    def _rows_for(self, track_ids: List[int]) -> List[int]:
+        """Associa cada ID a uma linha; IDs novos herdam a linha de um ausente."""
+        if len(track_ids) > len(self._t):
+            self._allocate(len(track_ids))
+
+        present = set(track_ids)
+        rows = [self._row_of.get(track_id, -1) for track_id in track_ids]
+        if -1 in rows:
+            used = {row for track_id, row in self._row_of.items() if track_id in present}
+            free = [row for row in self._contiguous if row not in used]
+            for i, track_id in enumerate(track_ids):
+                if rows[i] < 0:
+                    row = free.pop(0)
+                    for stale in [k for k, v in self._row_of.items() if v == row]:
+                        del self._row_of[stale]
+                    self._row_of[track_id] = row
+                    self._t[row] = -np.inf
+                    rows[i] = row
+        return rows
+
+    def apply(self, hand_frame: HandFrame) -> None:
+        """
+        Filtra os landmarks do frame no lugar e refaz a projeção em pixels.
+
+        Args:
+            hand_frame: Frame com ``track_ids`` (sem tracker, usa o índice)
+        """
+        n_hands = hand_frame.n_hands
+        if n_hands == 0:
+            return
+        if hand_frame.track_ids is not None:
+            track_ids = hand_frame.track_ids.tolist()
+        else:
+            track_ids = list(range(n_hands))
+        rows = self._rows_for(track_ids)
+
+        # No caso comum (mão i na linha i) tudo opera em views do estado;
+        # fora de ordem, as linhas são copiadas para buffers de trabalho
+        contiguous = rows == self._contiguous[:n_hands]
+        if contiguous:
+            index = slice(0, n_hands)
+            x_prev = self._x[index]
+            dx_prev = self._dx[index]
+            t_prev = self._t[index]
+        else:
+            index = rows
+            x_prev = np.take(self._x, rows, axis=0, out=self._x_rows[:n_hands])
+            dx_prev = np.take(self._dx, rows, axis=0, out=self._dx_rows[:n_hands])
+            t_prev = np.take(self._t, rows, out=self._t_rows[:n_hands])
+        x = hand_frame.landmarks
+        now = self.clock()
+        dt = self._dt[:n_hands]
+        np.subtract(now, t_prev, out=dt[:, 0, 0], casting="unsafe")
+        np.maximum(dt, 1e-3, out=dt)
+
+        # Velocidade suavizada: dx_hat = dx_prev + a_d * (dx - dx_prev)
+        delta = self._delta[:n_hands]
+        np.subtract(x, x_prev, out=delta)
+        correction = self._alpha[:n_hands]
+        np.divide(delta, dt, out=correction)
+        correction -= dx_prev
+        correction *= self._smoothing(self.d_cutoff, dt, out=self._d_alpha[:n_hands])
+        dx_prev += correction
+
+        # Corte adaptativo fc = min_cutoff + beta * |dx_hat|, no mesmo buffer
+        alpha = correction
+        np.abs(dx_prev, out=alpha)
+        alpha *= self.beta
+        alpha += self.min_cutoff
+        self._smoothing(alpha, dt, out=alpha)
+
+        # x_hat = x_prev + a * (x - x_prev), escrito de volta nos landmarks
+        delta *= alpha
+        np.add(x_prev, delta, out=x)
+        self._t[index] = now
+        if contiguous:
+            x_prev[:] = x
+        else:
+            self._x[index] = x
+            self._dx[index] = dx_prev
+        hand_frame.project()
+
+    @staticmethod
+    def _smoothing(cutoff, dt: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Fator de suavização de um passa-baixas de primeira ordem.
+
+        a = 1 / (1 + 1 / (2*pi*fc*dt)), calculado no buffer ``out`` (que
+        pode ser o próprio ``cutoff``) sem alocar temporários.
+        """
+        np.multiply(cutoff, dt, out=out)
+        out *= 2 * math.pi
+        np.reciprocal(out, out=out)
+        out += 1.0
+        np.reciprocal(out, out=out)
+        return out
+
+    def reset(self) -> None:
+        """Descarta o histórico de todas as mãos."""
+        self._t[:] = -np.inf
+        self._row_of.clear()
@@ -0,0 +1,109 @@
+"""Correção de iluminação por gamma automático via LUT."""
+
+import logging
+import math
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bins do histograma de luminância (de 8 níveis cada)
+_BINS = 32
+_BIN_CENTERS = (np.arange(_BINS, dtype=np.float64) + 0.5) * (256 / _BINS) / 255.0
+
+
+class LightingNormalizer:
+    """
+    Clareia frames escuros antes da inferência com uma LUT de 256 entradas.
+
+    A cada frame, uma amostra esparsa do canal verde (aproximação da
+    luminância) alimenta um histograma móvel. A LUT de gamma só é refeita
+    quando esse histograma se afasta (distância L1) do usado na última
+    construção; aplicá-la é um único ``cv2.LUT`` no buffer RGB da
+    inferência, que não é o exibido. Com cena bem iluminada o gamma fica
+    em 1 e a LUT nem é aplicada.
+    """
+
+    def __init__(
+        self,
+        target: float = 0.45,
+        min_gamma: float = 0.4,
+        max_gamma: float = 1.0,
+        drift: float = 0.15,
+        smoothing: float = 0.1,
+        sample_step: int = 16,
+    ):
+        """
+        Inicializa o normalizador.
+
+        Args:
+            target: Luminância média desejada (0 a 1)
+            min_gamma: Menor gamma (maior clareamento) permitido
+            max_gamma: Maior gamma permitido (1 = nunca escurece)
+            drift: Distância L1 entre histogramas que dispara uma nova LUT
+            smoothing: Peso de cada frame no histograma móvel
+            sample_step: Passo (em pixels) da amostragem do frame
+        """
+        self.target = target
+        self.min_gamma = min_gamma
+        self.max_gamma = max_gamma
+        self.drift = drift
+        self.smoothing = smoothing
+        self.sample_step = sample_step
+
+        self.gamma = 1.0
+        self.rebuilds = 0
+        self._lut = np.arange(256, dtype=np.uint8)
+        self._hist = np.zeros(_BINS, dtype=np.float64)
+        self._lut_hist = np.zeros(_BINS, dtype=np.float64)
+        self._has_hist = False
+
+    @property
+    def mean_luminance(self) -> float:
+        """Luminância média (0 a 1) do histograma móvel."""
+        return float(self._hist @ _BIN_CENTERS)
+
+    def apply(self, rgb: np.ndarray) -> np.ndarray:
+        """
+        Atualiza o histograma e corrige o frame no lugar, se necessário.
+
+        Args:
+            rgb: Frame RGB da inferência (modificado no lugar)
+
+        Returns:
+            O próprio frame
+        """
+        sample = rgb[:: self.sample_step, :: self.sample_step, 1]
+        counts = np.bincount((sample >> 3).ravel(), minlength=_BINS)
+        hist = counts / max(sample.size, 1)
+        if self._has_hist:
+            self._hist += self.smoothing * (hist - self._hist)
+        else:
+            self._hist[:] = hist
+            self._has_hist = True
+
+        if self.rebuilds == 0 or np.abs(self._hist - self._lut_hist).sum() > self.drift:
+            self._rebuild()
+
+        if self.gamma != 1.0:
+            cv2.LUT(rgb, self._lut, dst=rgb)
+        return rgb
+
+    def _rebuild(self) -> None:
+        """Recalcula o gamma e a LUT a partir do histograma móvel."""
+        mean = min(max(self.mean_luminance, 1e-3), 0.999)
+        gamma = math.log(self.target) / math.log(mean)
+        gamma = min(max(gamma, self.min_gamma), self.max_gamma)
+
+        self._lut_hist[:] = self._hist
+        self.rebuilds += 1
+        if abs(gamma - self.gamma) < 0.02 and self.rebuilds > 1:
+            return
+
+        self.gamma = 1.0 if abs(gamma - 1.0) < 0.02 else gamma
+        levels = np.arange(256, dtype=np.float64) / 255.0
+        self._lut = np.rint(255.0 * levels**self.gamma).astype(np.uint8)
+        logger.info(
+            f"Lighting LUT rebuilt: mean luminance {mean:.2f}, gamma {self.gamma:.2f}"
+        )
@@ -0,0 +1,78 @@
+"""Detector de movimento barato por diferença de frames."""
+
+import logging
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class MotionDetector:
+    """
+    Compara frames consecutivos reduzidos e em tons de cinza.
+
+    O frame é reduzido para ``size`` antes de qualquer outra operação, de
+    modo que o custo independe da resolução da câmera. Há movimento quando
+    a fração de pixels que mudaram mais que ``pixel_threshold`` passa de
+    ``motion_threshold``. Todos os buffers são reutilizados entre frames.
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int] = (160, 90),
+        pixel_threshold: int = 25,
+        motion_threshold: float = 0.02,
+    ):
+        """
+        Inicializa o detector.
+
+        Args:
+            size: (largura, altura) da imagem comparada
+            pixel_threshold: Variação mínima de cinza (0-255) de um pixel
+            motion_threshold: Fração de pixels alterados que indica movimento
+        """
+        self.size = size
+        self.pixel_threshold = pixel_threshold
+        self.motion_threshold = motion_threshold
+
+        width, height = size
+        self._small = np.empty((height, width, 3), dtype=np.uint8)
+        self._gray = np.empty((height, width), dtype=np.uint8)
+        self._reference = np.empty((height, width), dtype=np.uint8)
+        self._diff = np.empty((height, width), dtype=np.uint8)
+        self._has_reference = False
+        self.score = 0.0
+
+    def reset(self) -> None:
+        """Descarta o frame de referência (o próximo frame vira a referência)."""
+        self._has_reference = False
+        self.score = 0.0
+
+    def update(self, frame: np.ndarray) -> bool:
+        """
+        Compara o frame com o anterior.
+
+        Args:
+            frame: Frame BGR da câmera, em qualquer resolução
+
+        Returns:
+            True se houve movimento desde o frame anterior
+        """
+        cv2.resize(frame, self.size, dst=self._small, interpolation=cv2.INTER_LINEAR)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        motion = False
+        if self._has_reference:
+            cv2.absdiff(self._gray, self._reference, dst=self._diff)
+            cv2.threshold(
+                self._diff, self.pixel_threshold, 255, cv2.THRESH_BINARY, dst=self._diff
+            )
+            self.score = cv2.countNonZero(self._diff) / self._diff.size
+            motion = self.score >= self.motion_threshold
+
+        # O frame atual vira a referência do próximo
+        self._gray, self._reference = self._reference, self._gray
+        self._has_reference = True
+        return motion
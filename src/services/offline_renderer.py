@@ -0,0 +1,155 @@
+"""Renderização offline de uma sessão gravada para WAV."""
+
+import logging
+import os
+import wave
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.models import Performance
+
+logger = logging.getLogger(__name__)
+
+SampleLoader = Callable[[str], Optional[np.ndarray]]
+GainMapping = Callable[[np.ndarray], np.ndarray]
+
+
+def _to_float(samples: np.ndarray, channels: int) -> np.ndarray:
+    """Converte amostras do mixer para float32 (n, canais) em [-1, 1]."""
+    data = samples.astype(np.float32)
+    if np.issubdtype(samples.dtype, np.integer):
+        data /= float(np.iinfo(samples.dtype).max)
+    if data.ndim == 1:
+        data = data[:, None]
+    if data.shape[1] != channels:
+        data = np.repeat(data[:, :1], channels, axis=1)
+    return data
+
+
+def _note_spans(
+    performance: Performance, starts: np.ndarray, lengths: np.ndarray
+) -> List[Tuple[int, int, int, bool, int]]:
+    """
+    Calcula (início, fim, som, cortada, evento) de cada nota em amostras.
+
+    Um note-off (previsão cancelada) corta só a voz mais recente do mesmo
+    som, como o cancelamento ao vivo; notas anteriores continuam soando.
+    """
+    spans = []
+    sounding: Dict[int, List[int]] = {}
+    for i in range(performance.n_events):
+        sound_id = int(performance.sound_ids[i])
+        start = int(starts[i])
+        if performance.kinds[i] == Performance.NOTE_ON:
+            sounding.setdefault(sound_id, []).append(len(spans))
+            spans.append((start, start + int(lengths[sound_id]), sound_id, False, i))
+        elif sounding.get(sound_id):
+            j = sounding[sound_id].pop()
+            note_start, note_end, _, _, event = spans[j]
+            if start < note_end:
+                end = max(start, note_start)
+                spans[j] = (note_start, end, sound_id, True, event)
+    return spans
+
+
+def render_performance(
+    performance: Performance,
+    load_samples: SampleLoader,
+    sample_rate: int,
+    channels: int = 2,
+    volume: float = 1.0,
+    fade: float = 0.005,
+    velocity_gain: Optional[GainMapping] = None,
+) -> np.ndarray:
+    """
+    Mixa os eventos gravados em um buffer float32.
+
+    Cada nota começa na amostra exata do seu timestamp e é somada ao buffer
+    por fatiamento; notas cortadas por note-off recebem um fade curto para
+    não estalar.
+
+    Args:
+        performance: Eventos gravados
+        load_samples: Retorna as amostras (formato do mixer) de um caminho de som
+        sample_rate: Taxa de amostragem das amostras e da saída
+        channels: Número de canais da saída
+        volume: Ganho aplicado a todas as notas
+        fade: Duração do fade de um note-off (s)
+        velocity_gain: Converte as velocities gravadas em ganho por nota
+            (o mesmo mapeamento do SoundService); None ignora a velocity
+
+    Returns:
+        Mix (n, canais) float32, sem limitação de pico
+    """
+    voices = []
+    for sound_path in performance.sounds:
+        samples = load_samples(sound_path)
+        if samples is None:
+            logger.warning(f"No samples for {sound_path}; its notes are skipped")
+            voices.append(np.zeros((0, channels), dtype=np.float32))
+        else:
+            voices.append(_to_float(samples, channels) * np.float32(volume))
+
+    lengths = np.array([len(v) for v in voices], dtype=np.int64)
+    starts = np.rint(performance.times * sample_rate).astype(np.int64)
+    spans = _note_spans(performance, starts, lengths)
+    if velocity_gain is not None:
+        gains = np.asarray(velocity_gain(performance.velocities), dtype=np.float32)
+    else:
+        gains = np.ones(performance.n_events, dtype=np.float32)
+
+    total = max((end for _, end, _, _, _ in spans), default=0)
+    mix = np.zeros((total, channels), dtype=np.float32)
+
+    fade_len = max(1, int(fade * sample_rate))
+    fade_ramp = np.linspace(1.0, 0.0, fade_len, dtype=np.float32)[:, None]
+
+    for start, end, sound_id, cut, event in spans:
+        n = end - start
+        if n <= 0:
+            continue
+        segment = voices[sound_id][:n] * gains[event]
+        if cut:
+            k = min(fade_len, n)
+            mix[start:end - k] += segment[: n - k]
+            mix[end - k:end] += segment[n - k:] * fade_ramp[fade_len - k:]
+        else:
+            mix[start:end] += segment
+    return mix
+
+
+def to_pcm16(mix: np.ndarray) -> np.ndarray:
+    """
+    Converte o mix para int16, reduzindo o ganho se ele passar do fundo de escala.
+
+    Args:
+        mix: Buffer float32 em [-1, 1] (pode exceder nos picos)
+
+    Returns:
+        Amostras int16 (n, canais)
+    """
+    peak = float(np.max(np.abs(mix))) if mix.size else 0.0
+    if peak > 1.0:
+        logger.info(f"Render peak {peak:.2f} above full scale; scaling down")
+        mix = mix / peak
+    return (mix * 32767.0).astype(np.int16)
+
+
+def write_wav(path: str, pcm: np.ndarray, sample_rate: int) -> None:
+    """
+    Grava amostras int16 em um WAV.
+
+    Args:
+        path: Caminho do arquivo de saída
+        pcm: Amostras int16 (n, canais)
+        sample_rate: Taxa de amostragem
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(pcm.shape[1] if pcm.ndim > 1 else 1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(np.ascontiguousarray(pcm, dtype="<i2").tobytes())
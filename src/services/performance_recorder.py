@@ -0,0 +1,129 @@
+"""Gravação dos eventos de nota de uma sessão."""
+
+import logging
+import os
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from src.domain.models import Performance
+
+logger = logging.getLogger(__name__)
+
+
+class PerformanceRecorder:
+    """
+    Registra note-on/note-off com timestamp monotônico.
+
+    Cada evento custa só três appends; os arrays são montados ao salvar.
+    O arquivo é um ``.npz`` compactado com os arrays de ``Performance``.
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns):
+        """
+        Inicializa o gravador.
+
+        Args:
+            clock: Relógio monotônico em nanossegundos
+        """
+        self.clock = clock
+        self._start_ns = clock()
+        self._times: List[int] = []
+        self._kinds: List[int] = []
+        self._sound_ids: List[int] = []
+        self._velocities: List[float] = []
+        self._sound_index: Dict[str, int] = {}
+
+    def note_on(self, sound_path: str, velocity: float = 1.0) -> None:
+        """Registra o início de uma nota."""
+        self._record(Performance.NOTE_ON, sound_path, velocity)
+
+    def note_off(self, sound_path: str) -> None:
+        """Registra o fim de uma nota."""
+        self._record(Performance.NOTE_OFF, sound_path, 0.0)
+
+    def _record(self, kind: int, sound_path: str, velocity: float) -> None:
+        sound_id = self._sound_index.setdefault(sound_path, len(self._sound_index))
+        self._times.append(self.clock() - self._start_ns)
+        self._kinds.append(kind)
+        self._sound_ids.append(sound_id)
+        self._velocities.append(velocity)
+
+    @property
+    def n_events(self) -> int:
+        """Número de eventos gravados até agora."""
+        return len(self._times)
+
+    def to_performance(self) -> Performance:
+        """Monta a gravação como arrays."""
+        return Performance(
+            times=np.asarray(self._times, dtype=np.float64) / 1e9,
+            kinds=np.asarray(self._kinds, dtype=np.uint8),
+            sound_ids=np.asarray(self._sound_ids, dtype=np.uint16),
+            sounds=list(self._sound_index),
+            velocities=np.asarray(self._velocities, dtype=np.float32),
+        )
+
+    def save(self, path: str) -> bool:
+        """
+        Salva a gravação em ``.npz``.
+
+        Args:
+            path: Caminho do arquivo de saída
+
+        Returns:
+            True se o arquivo foi salvo
+        """
+        if not self._times:
+            return False
+        try:
+            save_performance(self.to_performance(), path)
+            logger.info(f"Recorded {self.n_events} note events to {path}")
+            return True
+        except OSError as e:
+            logger.error(f"Failed to save recording: {e}")
+            return False
+
+
+def save_performance(performance: Performance, path: str) -> None:
+    """
+    Grava uma Performance em ``.npz`` compactado.
+
+    Args:
+        performance: Eventos a gravar
+        path: Caminho do arquivo de saída
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as f:
+        np.savez_compressed(
+            f,
+            times=performance.times,
+            kinds=performance.kinds,
+            sound_ids=performance.sound_ids,
+            sounds=np.asarray(performance.sounds, dtype=np.str_),
+            velocities=performance.velocities,
+        )
+
+
+def load_performance(path: str) -> Performance:
+    """
+    Carrega uma Performance de um ``.npz``.
+
+    Args:
+        path: Caminho do arquivo gravado
+
+    Returns:
+        Eventos da sessão
+    """
+    with np.load(path, allow_pickle=False) as data:
+        return Performance(
+            times=data["times"],
+            kinds=data["kinds"],
+            sound_ids=data["sound_ids"],
+            sounds=[str(s) for s in data["sounds"]],
+            # Gravações antigas não têm velocity
+            velocities=data["velocities"] if "velocities" in data else None,
+        )
@@ -0,0 +1,170 @@
+"""Cache em disco de amostras PCM já decodificadas."""
+
+import hashlib
+import logging
+import os
+import re
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Decoder = Callable[[str], np.ndarray]
+
+
+def decode_with_mixer(path: str) -> np.ndarray:
+    """
+    Decodifica um arquivo de áudio no formato atual do mixer.
+
+    Args:
+        path: Caminho do arquivo de som
+
+    Returns:
+        Amostras (n,) ou (n, canais) na taxa e formato do mixer
+    """
+    from pygame import mixer, sndarray
+
+    return sndarray.array(mixer.Sound(path))
+
+
+def normalize_loudness(samples: np.ndarray, target_rms: Optional[float]) -> np.ndarray:
+    """
+    Ajusta o ganho das amostras para o RMS alvo sem deixar o pico saturar.
+
+    Usada tanto pelo cache quanto no carregamento sem cache e na síntese,
+    para que o volume percebido não dependa do caminho de carregamento.
+
+    Args:
+        samples: Amostras inteiras com sinal ou float (fundo de escala 1.0)
+        target_rms: RMS alvo (fração do fundo de escala); None não altera
+
+    Returns:
+        Novo array no mesmo dtype, ou ``samples`` se não houver ajuste
+    """
+    if target_rms is None or samples.size == 0:
+        return samples
+    if np.issubdtype(samples.dtype, np.signedinteger):
+        full_scale = float(np.iinfo(samples.dtype).max)
+    elif np.issubdtype(samples.dtype, np.floating):
+        full_scale = 1.0
+    else:
+        return samples
+
+    data = samples.astype(np.float32) / full_scale
+    rms = float(np.sqrt(np.mean(np.square(data))))
+    if rms == 0.0:
+        return samples
+    peak = float(np.max(np.abs(data)))
+
+    gain = min(target_rms / rms, 0.99 / peak)
+    data *= gain * full_scale
+    return data.astype(samples.dtype)
+
+
+class SampleCache:
+    """
+    Guarda PCM decodificado como ``.npy`` mapeável em memória.
+
+    A chave de cada entrada é o hash do arquivo de origem mais as
+    configurações do mixer (frequência, formato, canais); se qualquer um
+    mudar, a entrada antiga do mesmo arquivo é removida e o som é
+    decodificado de novo. No cache quente, carregar um som é só ler o
+    arquivo e mapear o ``.npy``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        mixer_settings: Tuple[int, int, int],
+        target_rms: Optional[float] = 0.1,
+        decoder: Decoder = decode_with_mixer,
+    ):
+        """
+        Inicializa o cache.
+
+        Args:
+            cache_dir: Diretório das entradas ``.npy``
+            mixer_settings: (frequência, formato, canais) do mixer
+            target_rms: RMS alvo (fração do fundo de escala); None desliga
+                a normalização de volume
+            decoder: Função que decodifica um arquivo no formato do mixer
+        """
+        self.cache_dir = cache_dir
+        self.mixer_settings = tuple(mixer_settings)
+        self.target_rms = target_rms
+        self.decoder = decoder
+
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def load(self, path: str, name: Optional[str] = None) -> np.ndarray:
+        """
+        Retorna as amostras de um arquivo, decodificando só se preciso.
+
+        Args:
+            path: Caminho do arquivo de som
+            name: Nome estável da origem (ex.: caminho da configuração),
+                usado para achar entradas antigas; padrão é ``path``
+
+        Returns:
+            Amostras prontas para ``mixer.Sound(buffer=...)``
+        """
+        prefix = self._entry_prefix(name or path)
+        entry = os.path.join(self.cache_dir, f"{prefix}-{self._entry_key(path)}.npy")
+
+        if os.path.exists(entry):
+            try:
+                samples = np.load(entry, mmap_mode="r")
+                self.hits += 1
+                return samples
+            except (OSError, ValueError) as e:
+                logger.warning(f"Corrupt sample cache entry {entry}: {e}")
+
+        samples = self._normalize(self.decoder(path))
+        self._prune(prefix)
+        self._write(entry, samples)
+        self.misses += 1
+        logger.info(f"Cached decoded samples for {path}")
+        return samples
+
+    def _entry_prefix(self, name: str) -> str:
+        """Nome da origem como prefixo seguro de arquivo."""
+        return re.sub(r"[^A-Za-z0-9_.]+", "_", name).strip("_")
+
+    def _entry_key(self, path: str) -> str:
+        """Hash do conteúdo do arquivo + configurações do mixer."""
+        digest = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(repr((self.mixer_settings, self.target_rms)).encode())
+        return digest.hexdigest()[:16]
+
+    def _normalize(self, samples: np.ndarray) -> np.ndarray:
+        """Ajusta o ganho para o RMS alvo sem deixar o pico saturar."""
+        return normalize_loudness(samples, self.target_rms)
+
+    def _prune(self, prefix: str) -> None:
+        """Remove entradas antigas do mesmo arquivo de origem."""
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(f"{prefix}-") and name.endswith(".npy"):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    logger.info(f"Removed stale sample cache entry {name}")
+                except OSError:
+                    pass
+
+    def _write(self, entry: str, samples: np.ndarray) -> None:
+        """Grava a entrada de forma atômica (arquivo temporário + rename)."""
+        tmp_path = f"{entry}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.ascontiguousarray(samples))
+            os.replace(tmp_path, entry)
+        except OSError as e:
+            logger.warning(f"Could not write sample cache entry {entry}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
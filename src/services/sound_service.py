@@ -3,25 +3,77 @@
 import logging
 import os
 import sys
-from typing import Dict, Set
+import time
+from typing import Any, Dict, List, Optional, Set
 
-from pygame import mixer
+import numpy as np
+from pygame import mixer, sndarray
+
+from config.sounds import (
+    MIXER_CONFIG,
+    OVERFLOW_VOICES,
+    SAMPLE_CACHE_DIR,
+    SAMPLE_TARGET_RMS,
+    SYNTH_CONFIG,
+    VELOCITY_CURVE,
+    VELOCITY_MIN_GAIN,
+)
+from src.services.sample_cache import SampleCache, normalize_loudness
+from src.services.synth_bank import (
+    SYNTH_PREFIX,
+    SynthBank,
+    is_synth_spec,
+    note_to_midi,
+)
+from src.services.voice_pool import VoicePool, velocity_to_gain
 
 logger = logging.getLogger(__name__)
 
+# Formato do mixer (get_init()[1]) -> dtype das amostras sintetizadas
+_MIXER_DTYPES = {-8: np.int8, -16: np.int16, 32: np.float32}
+
 
 class SoundService:
     """Gerencia o carregamento e reprodução de sons."""
 
-    def __init__(self, volume: float = 0.7):
+    def __init__(
+        self,
+        volume: float = 0.7,
+        mixer_config: Optional[dict] = None,
+        overflow_voices: int = OVERFLOW_VOICES,
+        sample_cache_dir: Optional[str] = SAMPLE_CACHE_DIR,
+        sample_target_rms: Optional[float] = SAMPLE_TARGET_RMS,
+        synth_config: Optional[dict] = None,
+        velocity_min_gain: float = VELOCITY_MIN_GAIN,
+        velocity_curve: float = VELOCITY_CURVE,
+    ):
         """
         Inicializa o serviço de sons.
         
         Args:
             volume: Volume inicial (0.0 a 1.0)
+            mixer_config: Parâmetros do mixer (frequency, size, channels, buffer)
+            overflow_voices: Canais extras para notas sobrepostas
+            sample_cache_dir: Diretório do cache de PCM; None decodifica sempre
+            sample_target_rms: RMS alvo da normalização das amostras
+            synth_config: Parâmetros do banco de síntese ("synth:<nota>")
+            velocity_min_gain: Ganho de uma nota com velocity 0
+            velocity_curve: Expoente da curva velocity -> ganho
         """
         self.volume = volume
+        self.mixer_config = dict(mixer_config or MIXER_CONFIG)
+        self.overflow_voices = overflow_voices
         self.loaded_sounds: Dict[str, mixer.Sound] = {}
+        self.voice_pool: Optional[VoicePool] = None
+        self.sample_cache_dir = sample_cache_dir
+        self.sample_target_rms = sample_target_rms
+        self.sample_cache: Optional[SampleCache] = None
+        self.synth_config = dict(SYNTH_CONFIG if synth_config is None else synth_config)
+        self.synth_bank: Optional[SynthBank] = None
+        self.velocity_min_gain = velocity_min_gain
+        self.velocity_curve = velocity_curve
+        self.estimated_buffer_latency_ms = 0.0
+        self.measured_mixer_latency_ms: Optional[float] = None
         self._initialized = False
         # Determina o caminho base para arquivos de dados
         if hasattr(sys, "_MEIPASS"):
@@ -32,14 +84,84 @@ class SoundService:
     def initialize(self) -> None:
         """Inicializa o mixer do pygame."""
         try:
-            mixer.init()
+            mixer.init(**self.mixer_config)
             mixer.music.set_volume(self.volume)
             self._initialized = True
-            logger.info("Sound service initialized successfully")
+
+            # Estimativa (não medida): duração do buffer de saída na frequência
+            # obtida; não inclui a latência do driver nem do hardware
+            frequency, _, channels = mixer.get_init()
+            self.estimated_buffer_latency_ms = (
+                1000.0 * self.mixer_config["buffer"] / frequency
+            )
+            self.measured_mixer_latency_ms = self.measure_mixer_latency()
+            measured = (
+                "not measured"
+                if self.measured_mixer_latency_ms is None
+                else f"{self.measured_mixer_latency_ms:.1f} ms measured"
+            )
+            logger.info(
+                f"Sound service initialized successfully ({frequency} Hz, "
+                f"{channels} ch, buffer {self.mixer_config['buffer']}, "
+                f"~{self.estimated_buffer_latency_ms:.1f} ms estimated buffer latency, "
+                f"mixer latency {measured})"
+            )
+
+            if self.sample_cache_dir:
+                try:
+                    self.sample_cache = SampleCache(
+                        self.sample_cache_dir,
+                        mixer_settings=mixer.get_init(),
+                        target_rms=self.sample_target_rms,
+                    )
+                except OSError as e:
+                    logger.warning(f"Sample cache disabled: {e}")
+
+            self._create_synth_bank()
         except Exception as e:
             logger.error(f"Failed to initialize pygame mixer: {e}")
             raise
 
+    def measure_mixer_latency(
+        self, trials: int = 5, timeout: float = 0.5
+    ) -> Optional[float]:
+        """
+        Mede quanto o mixer demora para consumir um som após ``play()``.
+
+        Toca um som silencioso de poucas amostras e espera o canal ficar
+        livre, o que só acontece quando o callback de áudio o mixou. A
+        mediana das tentativas (após uma de aquecimento) é o atraso entre
+        disparar uma nota e ela entrar no buffer de saída. A latência do
+        driver e do hardware depois disso não é medida.
+
+        Args:
+            trials: Número de medições
+            timeout: Espera máxima por medição, em segundos
+
+        Returns:
+            Latência mediana em ms, ou None se o mixer não consumiu o som
+        """
+        _, size, channels = mixer.get_init()
+        dtype = _MIXER_DTYPES.get(size, np.int16)
+        shape = (16, channels) if channels > 1 else (16,)
+        probe = mixer.Sound(buffer=np.zeros(shape, dtype=dtype))
+        channel = mixer.Channel(0)
+
+        samples = []
+        for _ in range(trials + 1):
+            start = time.perf_counter()
+            channel.play(probe)
+            while channel.get_busy():
+                if time.perf_counter() - start > timeout:
+                    channel.stop()
+                    logger.warning("Mixer latency measurement timed out")
+                    return None
+                time.sleep(0.0005)
+            samples.append(1000.0 * (time.perf_counter() - start))
+
+        # A primeira medição pode cair no meio de um callback já em curso
+        return float(np.median(samples[1:]))
+
     def load_sounds_from_config(
         self,
         left_hand_config: dict,
@@ -62,37 +184,202 @@ class SoundService:
             for finger_id, gesture in gesture_config.items():
                 all_sounds.add(gesture["sound"])
 
+        # Notas sintetizadas são geradas em segundo plano (ou no primeiro uso)
+        synth_notes = sorted(p for p in all_sounds if is_synth_spec(p))
+        self._warmup_synth(synth_notes)
+
         # Carrega cada som
-        for sound_path in all_sounds:
+        for sound_path in all_sounds - set(synth_notes):
             try:
                 full_path = os.path.join(self.base_path, sound_path)
-                sound = mixer.Sound(full_path)
+                if self.sample_cache is not None:
+                    samples = self.sample_cache.load(full_path, name=sound_path)
+                    sound = mixer.Sound(buffer=samples)
+                else:
+                    # Mesma normalização do cache, para o volume não mudar
+                    # ao ligar ou desligar o cache
+                    samples = sndarray.array(mixer.Sound(full_path))
+                    samples = normalize_loudness(samples, self.sample_target_rms)
+                    sound = mixer.Sound(buffer=np.ascontiguousarray(samples))
                 sound.set_volume(self.volume)
                 self.loaded_sounds[sound_path] = sound
                 logger.info(f"Loaded sound: {sound_path}")
             except Exception as e:
                 logger.error(f"Failed to load sound {sound_path}: {e}")
 
-    def play_sound(self, sound_path: str) -> bool:
+        self._allocate_voices(sorted(self.loaded_sounds) + synth_notes)
+
+    def _create_synth_bank(self) -> None:
+        """Cria o banco de síntese no formato realmente obtido do mixer."""
+        frequency, size, channels = mixer.get_init()
+        dtype = _MIXER_DTYPES.get(size)
+        if dtype is None:
+            logger.warning(f"Synthesis disabled: unsupported mixer format {size}")
+            return
+
+        params = dict(self.synth_config)
+        capacity = params.pop("cache_size", 48)
+        self.synth_bank = SynthBank(
+            sample_rate=frequency,
+            channels=channels,
+            capacity=capacity,
+            build=self._build_sound,
+            dtype=dtype,
+            **params,
+        )
+
+    def _build_sound(self, samples: np.ndarray) -> mixer.Sound:
+        """Cria um Sound a partir de amostras já no formato do mixer."""
+        samples = normalize_loudness(samples, self.sample_target_rms)
+        sound = mixer.Sound(buffer=np.ascontiguousarray(samples))
+        sound.set_volume(self.volume)
+        return sound
+
+    def _warmup_synth(self, synth_notes: List[str]) -> None:
+        """Pré-gera as notas sintetizadas em uma thread de fundo."""
+        if not synth_notes:
+            return
+        if self.synth_bank is None:
+            logger.error(f"Synthesis unavailable for: {', '.join(synth_notes)}")
+            return
+
+        midis = []
+        for spec in synth_notes:
+            try:
+                midis.append(note_to_midi(spec[len(SYNTH_PREFIX):]))
+            except ValueError as e:
+                logger.error(f"Failed to load sound {spec}: {e}")
+        self.synth_bank.warmup(midis)
+        logger.info(f"Synthesizing {len(midis)} notes in background")
+
+    def _get_sound(self, sound_path: str) -> Optional[Any]:
+        """Retorna o Sound carregado ou sintetizado de um caminho."""
+        sound = self.loaded_sounds.get(sound_path)
+        if sound is not None or not is_synth_spec(sound_path):
+            return sound
+        if self.synth_bank is None:
+            return None
+        try:
+            return self.synth_bank.get_note(sound_path[len(SYNTH_PREFIX):])
+        except ValueError as e:
+            logger.error(f"Invalid synth note {sound_path}: {e}")
+            return None
+
+    def _allocate_voices(self, sound_paths: Optional[List[str]] = None) -> None:
+        """
+        Reserva um canal por som mais o pool de overflow.
+
+        Args:
+            sound_paths: Sons com canal dedicado (padrão: os carregados)
+        """
+        if sound_paths is None:
+            sound_paths = sorted(self.loaded_sounds)
+        total = len(sound_paths) + self.overflow_voices
+        mixer.set_num_channels(total)
+        # Reservados não são usados pelo Sound.play() automático do pygame
+        mixer.set_reserved(total)
+
+        channels = [mixer.Channel(i) for i in range(total)]
+        self.voice_pool = VoicePool(
+            dedicated=dict(zip(sound_paths, channels)),
+            overflow=channels[len(sound_paths):],
+        )
+        logger.info(
+            f"Voices allocated: {len(sound_paths)} dedicated, "
+            f"{self.overflow_voices} overflow"
+        )
+
+    def velocity_gain(self, velocity):
+        """
+        Ganho da voz para uma velocity (escalar ou array).
+
+        Args:
+            velocity: Velocity em [0, 1]
+
+        Returns:
+            Ganho em [velocity_min_gain, 1]
+        """
+        return velocity_to_gain(velocity, self.velocity_min_gain, self.velocity_curve)
+
+    def play_sound(self, sound_path: str, velocity: float = 1.0) -> Optional[Any]:
         """
         Reproduz um som.
         
         Args:
             sound_path: Caminho do arquivo de som
+            velocity: Intensidade da nota (0.0 a 1.0), convertida em ganho da voz
             
         Returns:
-            True se o som foi reproduzido com sucesso
+            Canal em que o som está tocando, ou None se não foi reproduzido
         """
-        if sound_path not in self.loaded_sounds:
+        sound = self._get_sound(sound_path)
+        if sound is None:
             logger.warning(f"Sound not loaded: {sound_path}")
-            return False
+            return None
+
+        if self.voice_pool is None:
+            self._allocate_voices()
 
         try:
-            self.loaded_sounds[sound_path].play()
-            return True
+            gain = float(self.velocity_gain(velocity))
+            return self.voice_pool.play(sound_path, sound, gain)
         except Exception as e:
             logger.error(f"Error playing sound {sound_path}: {e}")
+            return None
+
+    @property
+    def sample_rate(self) -> int:
+        """Frequência realmente obtida do mixer."""
+        return mixer.get_init()[0]
+
+    @property
+    def channels(self) -> int:
+        """Número de canais realmente obtido do mixer."""
+        return mixer.get_init()[2]
+
+    def get_samples(self, sound_path: str) -> Optional[np.ndarray]:
+        """
+        Retorna as amostras de um som no formato do mixer.
+
+        Args:
+            sound_path: Caminho do arquivo de som (ou "synth:<nota>")
+
+        Returns:
+            Cópia das amostras, ou None se o som não estiver disponível
+        """
+        sound = self._get_sound(sound_path)
+        if sound is None:
+            return None
+        return sndarray.array(sound)
+
+    def stop_sound(self, sound_path: str) -> bool:
+        """
+        Para as vozes que estão tocando um som (note-off).
+
+        Args:
+            sound_path: Caminho do arquivo de som
+
+        Returns:
+            True se alguma voz foi parada
+        """
+        if self.voice_pool is None:
+            return False
+        return self.voice_pool.stop(sound_path) > 0
+
+    def stop_voice(self, sound_path: str, channel: Any) -> bool:
+        """
+        Para só a voz de um som que está no canal dado.
+
+        Args:
+            sound_path: Caminho do arquivo de som
+            channel: Canal retornado por ``play_sound``
+
+        Returns:
+            True se a voz foi parada
+        """
+        if self.voice_pool is None:
             return False
+        return self.voice_pool.stop_channel(sound_path, channel)
 
     def set_volume(self, volume: float) -> None:
         """
@@ -108,6 +395,9 @@ class SoundService:
             
             for sound in self.loaded_sounds.values():
                 sound.set_volume(self.volume)
+            if self.synth_bank is not None:
+                for sound in self.synth_bank.values():
+                    sound.set_volume(self.volume)
         
         logger.info(f"Volume set to {self.volume}")
 
@@ -117,9 +407,30 @@ class SoundService:
             mixer.stop()
             logger.info("All sounds stopped")
 
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas de áudio.
+
+        Returns:
+            Dicionário com a latência medida do mixer, a estimada do buffer
+            de saída e as vozes roubadas/descartadas
+        """
+        pool = self.voice_pool
+        return {
+            "measured_mixer_latency_ms": self.measured_mixer_latency_ms,
+            "estimated_buffer_latency_ms": self.estimated_buffer_latency_ms,
+            "stolen_voices": pool.stolen_voices if pool else 0,
+            "dropped_voices": pool.dropped_voices if pool else 0,
+        }
+
     def cleanup(self) -> None:
         """Libera recursos do mixer."""
         if self._initialized:
+            stats = self.get_stats()
+            logger.info(
+                f"Audio voices: {stats['stolen_voices']} stolen, "
+                f"{stats['dropped_voices']} dropped"
+            )
             mixer.quit()
             self._initialized = False
             logger.info("Sound service cleaned up")
@@ -0,0 +1,247 @@
+"""Síntese procedural de notas com cache LRU."""
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SYNTH_PREFIX = "synth:"
+
+_NOTE_OFFSETS = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+_NOTE_PATTERN = re.compile(r"^([A-Ga-g])([#b]?)(-?\d+)$")
+
+
+def note_to_midi(note_name: str) -> int:
+    """
+    Converte um nome de nota (ex.: "C4", "C#4", "Bb3") em número MIDI.
+
+    Args:
+        note_name: Nome da nota em notação científica
+
+    Returns:
+        Número MIDI (C4 = 60)
+
+    Raises:
+        ValueError: Se o nome não for uma nota válida
+    """
+    match = _NOTE_PATTERN.match(note_name.strip())
+    if not match:
+        raise ValueError(f"Invalid note name: {note_name!r}")
+    letter, accidental, octave = match.groups()
+    midi = (int(octave) + 1) * 12 + _NOTE_OFFSETS[letter.upper()]
+    midi += {"#": 1, "b": -1}.get(accidental, 0)
+    if not 0 <= midi <= 127:
+        raise ValueError(f"Note out of MIDI range: {note_name!r}")
+    return midi
+
+
+def midi_to_frequency(midi: int) -> float:
+    """Frequência em Hz de uma nota MIDI (A4 = 69 = 440 Hz)."""
+    return 440.0 * 2.0 ** ((midi - 69) / 12.0)
+
+
+def is_synth_spec(sound_path: str) -> bool:
+    """Indica se o caminho de som é uma nota sintetizada ("synth:<nota>")."""
+    return sound_path.startswith(SYNTH_PREFIX)
+
+
+def synthesize_note(
+    midi: int,
+    sample_rate: int = 44100,
+    channels: int = 2,
+    duration: float = 1.5,
+    harmonics: Sequence[float] = (1.0, 0.5, 0.3, 0.15, 0.08, 0.04),
+    attack: float = 0.005,
+    decay: float = 0.15,
+    sustain: float = 0.5,
+    release: float = 0.4,
+    dtype: Any = np.int16,
+) -> np.ndarray:
+    """
+    Gera uma nota por síntese aditiva com envelope ADSR.
+
+    Todas as parciais são calculadas de uma vez: uma matriz (parciais x
+    amostras) de senoides, cada uma com seu decaimento exponencial, somada
+    por um produto com o vetor de amplitudes.
+
+    Args:
+        midi: Número MIDI da nota
+        sample_rate: Taxa de amostragem do mixer
+        channels: Número de canais do mixer
+        duration: Duração total em segundos (inclui o release)
+        harmonics: Amplitude relativa de cada harmônico
+        attack: Tempo de ataque (s)
+        decay: Tempo de decaimento até o sustain (s)
+        sustain: Nível de sustain (0 a 1)
+        release: Tempo de release no fim da nota (s)
+        dtype: Tipo das amostras (int16 para o mixer padrão)
+
+    Returns:
+        Amostras (n, canais) contíguas, prontas para ``mixer.Sound(buffer=...)``
+    """
+    n_samples = int(duration * sample_rate)
+    t = np.arange(n_samples, dtype=np.float32) / np.float32(sample_rate)
+    fundamental = midi_to_frequency(midi)
+
+    # Descarta parciais acima de Nyquist
+    ranks = np.arange(1, len(harmonics) + 1, dtype=np.float32)
+    audible = ranks * fundamental < sample_rate / 2
+    ranks = ranks[audible]
+    amplitudes = np.asarray(harmonics, dtype=np.float32)[audible]
+
+    # Parciais mais altas decaem mais rápido, como em cordas percutidas
+    phases = np.outer(ranks * np.float32(2 * np.pi * fundamental), t)
+    partials = np.sin(phases) * np.exp(np.outer(-(1.0 + 0.8 * ranks), t))
+    wave = amplitudes @ partials
+
+    release_start = max(duration - release, attack + decay)
+    envelope = np.interp(
+        t,
+        [0.0, attack, attack + decay, release_start, duration],
+        [0.0, 1.0, sustain, sustain, 0.0],
+    ).astype(np.float32)
+    wave *= envelope
+
+    peak = float(np.max(np.abs(wave)))
+    if peak > 0:
+        wave *= 0.8 / peak
+
+    if np.issubdtype(dtype, np.integer):
+        wave *= np.iinfo(dtype).max
+    samples = wave.astype(dtype)
+    return np.ascontiguousarray(np.repeat(samples[:, None], channels, axis=1))
+
+
+class SynthBank:
+    """
+    Banco LRU de notas sintetizadas, geradas sob demanda.
+
+    ``get`` gera a nota na primeira vez (fora do loop de vídeo, na thread
+    de áudio) e ``warmup`` pré-gera uma lista em uma thread de fundo. O
+    ``build`` opcional transforma as amostras no objeto guardado (ex.:
+    ``mixer.Sound``), de modo que o limite do LRU vale para ele.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 44100,
+        channels: int = 2,
+        capacity: int = 48,
+        build: Optional[Callable[[np.ndarray], Any]] = None,
+        dtype: Any = np.int16,
+        **synth_params,
+    ):
+        """
+        Inicializa o banco.
+
+        Args:
+            sample_rate: Taxa de amostragem do mixer
+            channels: Número de canais do mixer
+            capacity: Número máximo de notas mantidas
+            build: Converte as amostras no objeto guardado (padrão: as amostras)
+            dtype: Tipo das amostras geradas
+            **synth_params: Parâmetros extras de ``synthesize_note``
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.capacity = capacity
+        self.build = build
+        self.dtype = dtype
+        self.synth_params = synth_params
+
+        self._notes: "OrderedDict[int, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._warmup_thread: Optional[threading.Thread] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, midi: int) -> Any:
+        """
+        Retorna a nota, gerando-a se ainda não estiver no banco.
+
+        Args:
+            midi: Número MIDI da nota
+
+        Returns:
+            Objeto da nota (amostras ou o resultado de ``build``)
+        """
+        with self._lock:
+            note = self._notes.get(midi)
+            if note is not None:
+                self._notes.move_to_end(midi)
+                self.hits += 1
+                return note
+
+        # Gera fora do lock para não bloquear notas já prontas
+        samples = synthesize_note(
+            midi,
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+            dtype=self.dtype,
+            **self.synth_params,
+        )
+        note = self.build(samples) if self.build else samples
+
+        with self._lock:
+            existing = self._notes.get(midi)
+            if existing is not None:
+                return existing
+            self._notes[midi] = note
+            self.misses += 1
+            while len(self._notes) > self.capacity:
+                self._notes.popitem(last=False)
+                self.evictions += 1
+        return note
+
+    def get_note(self, note_name: str) -> Any:
+        """Atalho de ``get`` a partir do nome da nota (ex.: "C#4")."""
+        return self.get(note_to_midi(note_name))
+
+    def warmup(self, midis: Iterable[int]) -> None:
+        """
+        Gera notas em uma thread de fundo.
+
+        Args:
+            midis: Notas MIDI a pré-gerar
+        """
+        pending = list(midis)[: self.capacity]
+        if not pending:
+            return
+
+        def _run():
+            for midi in pending:
+                try:
+                    self.get(midi)
+                except Exception as e:
+                    logger.error(f"Failed to synthesize MIDI note {midi}: {e}")
+            logger.info(f"Synth warmup done ({len(pending)} notes)")
+
+        self._warmup_thread = threading.Thread(
+            target=_run, name="synth-warmup", daemon=True
+        )
+        self._warmup_thread.start()
+
+    def wait_warmup(self, timeout: Optional[float] = None) -> None:
+        """Aguarda a thread de warmup terminar."""
+        if self._warmup_thread is not None:
+            self._warmup_thread.join(timeout)
+
+    def values(self) -> list:
+        """Cópia dos objetos atualmente no banco."""
+        with self._lock:
+            return list(self._notes.values())
+
+    def __contains__(self, midi: int) -> bool:
+        with self._lock:
+            return midi in self._notes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._notes)
@@ -0,0 +1,165 @@
+"""Alocação de vozes (canais do mixer) para reprodução de notas."""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def velocity_to_gain(
+    velocity: Union[float, np.ndarray],
+    min_gain: float = 0.35,
+    curve: float = 0.6,
+) -> Union[float, np.ndarray]:
+    """
+    Converte velocity [0, 1] no ganho da voz.
+
+    Args:
+        velocity: Velocity da nota (escalar ou array)
+        min_gain: Ganho da nota mais suave (velocity 0)
+        curve: Expoente da curva; < 1 realça toques leves
+
+    Returns:
+        Ganho em [min_gain, 1]
+    """
+    velocity = np.clip(velocity, 0.0, 1.0)
+    return min_gain + (1.0 - min_gain) * np.power(velocity, curve)
+
+
+class VoicePool:
+    """
+    Distribui notas entre canais dedicados e um pool de overflow.
+
+    Cada nota mapeada tem um canal próprio. Se ele estiver ocupado (nota
+    repetida ainda soando), a nota vai para um canal livre do overflow; com
+    o overflow cheio, a voz mais antiga dele é roubada. Nada é descartado
+    em silêncio: roubos e descartes são contados.
+    """
+
+    def __init__(
+        self,
+        dedicated: Dict[str, Any],
+        overflow: Sequence[Any],
+        clock=time.perf_counter,
+    ):
+        """
+        Inicializa o pool de vozes.
+
+        Args:
+            dedicated: Canal dedicado por chave de som
+            overflow: Canais compartilhados para notas sobrepostas
+            clock: Relógio usado para achar a voz mais antiga
+        """
+        self.dedicated = dict(dedicated)
+        self.overflow: List[Any] = list(overflow)
+        self.clock = clock
+        self._overflow_started = [0.0] * len(self.overflow)
+        self._overflow_keys: List[Optional[str]] = [None] * len(self.overflow)
+
+        self.stolen_voices = 0
+        self.dropped_voices = 0
+
+    def play(self, key: str, sound: Any, volume: float = 1.0) -> Optional[Any]:
+        """
+        Toca um som no melhor canal disponível.
+
+        Args:
+            key: Chave do som (caminho do arquivo)
+            sound: Objeto de som a tocar
+            volume: Ganho da voz (0.0 a 1.0), aplicado ao canal
+
+        Returns:
+            Canal usado, ou None se a nota foi descartada
+        """
+        channel = self.dedicated.get(key)
+        if channel is not None and not channel.get_busy():
+            return self._start(channel, sound, volume)
+
+        # Canal dedicado ocupado (ou som sem canal): procura voz livre no overflow
+        for i, candidate in enumerate(self.overflow):
+            if not candidate.get_busy():
+                self._overflow_started[i] = self.clock()
+                self._overflow_keys[i] = key
+                return self._start(candidate, sound, volume)
+
+        if self.overflow:
+            oldest = min(
+                range(len(self.overflow)), key=self._overflow_started.__getitem__
+            )
+            victim = self.overflow[oldest]
+            victim.stop()
+            self.stolen_voices += 1
+            self._overflow_started[oldest] = self.clock()
+            self._overflow_keys[oldest] = key
+            return self._start(victim, sound, volume)
+
+        if channel is not None:
+            # Sem overflow: reinicia a própria nota no canal dedicado
+            channel.stop()
+            self.stolen_voices += 1
+            return self._start(channel, sound, volume)
+
+        self.dropped_voices += 1
+        logger.warning(f"No voice available for {key}")
+        return None
+
+    def stop(self, key: str) -> int:
+        """
+        Para todas as vozes tocando um som (note-off).
+
+        Args:
+            key: Chave do som
+
+        Returns:
+            Número de canais parados
+        """
+        stopped = 0
+        channel = self.dedicated.get(key)
+        if channel is not None and channel.get_busy():
+            channel.stop()
+            stopped += 1
+        for i, candidate in enumerate(self.overflow):
+            if self._overflow_keys[i] == key and candidate.get_busy():
+                candidate.stop()
+                stopped += 1
+        return stopped
+
+    def stop_channel(self, key: str, channel: Any) -> bool:
+        """
+        Para uma única voz, se o canal ainda estiver tocando o som.
+
+        Usado no cancelamento de uma nota prevista: outras vozes do mesmo
+        som (notas reais ainda soando) continuam.
+
+        Args:
+            key: Chave do som
+            channel: Canal retornado por ``play`` para a voz
+
+        Returns:
+            True se o canal foi parado
+        """
+        if self.dedicated.get(key) is channel:
+            owned = True
+        else:
+            owned = any(
+                candidate is channel and self._overflow_keys[i] == key
+                for i, candidate in enumerate(self.overflow)
+            )
+        if not owned or not channel.get_busy():
+            return False
+        channel.stop()
+        return True
+
+    def _start(self, channel: Any, sound: Any, volume: float) -> Optional[Any]:
+        """Inicia a reprodução, contando falhas como descartes."""
+        try:
+            channel.set_volume(volume)
+            channel.play(sound)
+            return channel
+        except Exception as e:
+            self.dropped_voices += 1
+            logger.error(f"Error starting voice: {e}")
+            return None
@@ -0,0 +1,40 @@
+"""Componente de esqueleto da mão."""
+
+import cv2
+import numpy as np
+
+# Conexões entre landmarks (mesma topologia do HAND_CONNECTIONS do MediaPipe)
+HAND_CONNECTIONS = np.array(
+    [
+        (0, 1), (1, 2), (2, 3), (3, 4),
+        (0, 5), (5, 6), (6, 7), (7, 8),
+        (5, 9), (9, 10), (10, 11), (11, 12),
+        (9, 13), (13, 14), (14, 15), (15, 16),
+        (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+    ],
+    dtype=np.intp,
+)
+
+
+class HandSkeleton:
+    """Desenha landmarks e conexões da mão a partir de pixels pré-calculados."""
+
+    CONNECTION_COLOR = (224, 224, 224)
+    LANDMARK_COLOR = (0, 0, 255)
+    BORDER_COLOR = (224, 224, 224)
+
+    def draw(self, frame: np.ndarray, pixels: np.ndarray) -> None:
+        """
+        Desenha o esqueleto de uma mão.
+
+        Args:
+            frame: Frame a ser desenhado
+            pixels: Array (21, 2) int32 com as posições dos landmarks em pixels
+        """
+        # Todas as conexões em uma única chamada
+        segments = pixels[HAND_CONNECTIONS]
+        cv2.polylines(frame, segments, False, self.CONNECTION_COLOR, 2)
+
+        for x, y in pixels.tolist():
+            cv2.circle(frame, (x, y), 3, self.BORDER_COLOR, 2)
+            cv2.circle(frame, (x, y), 2, self.LANDMARK_COLOR, 2)
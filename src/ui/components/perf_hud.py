@@ -0,0 +1,55 @@
+"""Componente de HUD de desempenho."""
+
+from typing import Dict
+
+import cv2
+import numpy as np
+
+
+class PerfHUD:
+    """Desenha os tempos por estágio (p50/p95/p99) do profiler."""
+
+    def draw(
+        self,
+        frame: np.ndarray,
+        summary: Dict[str, Dict[str, float]],
+        x: int,
+        y: int,
+    ) -> None:
+        """
+        Desenha a tabela de tempos.
+
+        Args:
+            frame: Frame a ser desenhado
+            summary: Resumo do FrameProfiler ({estágio: {"p50": ms, ...}})
+            x: Posição X do canto superior esquerdo
+            y: Posição Y do canto superior esquerdo
+        """
+        line_h = 18
+        panel_w = 330
+        panel_h = line_h * (len(summary) + 1) + 12
+
+        # Fundo sólido: o HUD não deve custar um addWeighted por frame
+        cv2.rectangle(frame, (x, y), (x + panel_w, y + panel_h), (0, 0, 0), -1)
+
+        cv2.putText(
+            frame,
+            "stage        p50    p95    p99 ms",
+            (x + 8, y + line_h),
+            cv2.FONT_HERSHEY_PLAIN,
+            1.0,
+            (200, 200, 200),
+            1,
+        )
+
+        for i, (stage, stats) in enumerate(summary.items(), start=2):
+            color = (0, 255, 255) if stage == "total" else (255, 255, 255)
+            cv2.putText(
+                frame,
+                f"{stage:<10} {stats['p50']:6.2f} {stats['p95']:6.2f} {stats['p99']:6.2f}",
+                (x + 8, y + line_h * i),
+                cv2.FONT_HERSHEY_PLAIN,
+                1.0,
+                color,
+                1,
+            )
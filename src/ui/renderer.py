@@ -4,8 +4,10 @@ import time
 import cv2
 import numpy as np
 
-from src.domain.models import Challenge, GameStats
+from src.domain.models import Challenge, GameStats, HandFrame
 from .components.challenge_panel import ChallengePanel
+from .components.hand_skeleton import HandSkeleton
+from .components.perf_hud import PerfHUD
 from .components.stats_panel import StatsPanel
 from .components.gesture_guide import GestureGuide
 from .components.result_popup import ResultPopup
@@ -21,6 +23,8 @@ class UIRenderer:
         self.stats_panel = StatsPanel()
         self.gesture_guide = GestureGuide()
         self.result_popup = ResultPopup()
+        self.hand_skeleton = HandSkeleton()
+        self.perf_hud = PerfHUD()
         self.styles = UIStyles()
 
     def draw_ui(
@@ -84,18 +88,17 @@ class UIRenderer:
     def draw_visual_feedback(
         self,
         frame: np.ndarray,
-        hand_landmarks,
+        hand_frame: HandFrame,
+        hand_idx: int,
         active_gestures,
         gesture_config: dict,
-        w: int,
-        h: int,
     ) -> None:
         """Desenha feedback visual colorido para os gestos ativos."""
+        pixels = hand_frame.pixels[hand_idx]
         for finger_id in active_gestures:
             if finger_id in gesture_config:
                 # Pega posição do dedo
-                finger = hand_landmarks.landmark[finger_id]
-                fx, fy = int(finger.x * w), int(finger.y * h)
+                fx, fy = pixels[finger_id].tolist()
 
                 # Pega cor baseada na nota
                 note_name = gesture_config[finger_id]["name"]
@@ -107,10 +110,38 @@ class UIRenderer:
                 cv2.circle(frame, (fx, fy), 8, color, -1)
 
                 # Desenha linha do polegar ao dedo
-                thumb = hand_landmarks.landmark[4]
-                tx, ty = int(thumb.x * w), int(thumb.y * h)
+                tx, ty = pixels[4].tolist()
                 cv2.line(frame, (tx, ty), (fx, fy), color, 2)
 
+    def draw_hand(
+        self,
+        frame: np.ndarray,
+        hand_frame: HandFrame,
+        hand_idx: int,
+    ) -> None:
+        """Desenha o esqueleto da mão e o rótulo de lateralidade no pulso."""
+        pixels = hand_frame.pixels[hand_idx]
+        self.hand_skeleton.draw(frame, pixels)
+
+        wrist_x, wrist_y = pixels[0].tolist()
+        cv2.putText(
+            frame,
+            hand_frame.label(hand_idx),
+            (wrist_x, wrist_y - 20),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.6,
+            (0, 255, 255),
+            2,
+        )
+
+    def draw_perf_hud(self, frame: np.ndarray, summary: dict) -> None:
+        """Desenha o HUD de tempos por estágio no canto inferior esquerdo."""
+        if not summary:
+            return
+        h = frame.shape[0]
+        panel_h = 18 * (len(summary) + 1) + 12
+        self.perf_hud.draw(frame, summary, 10, h - 30 - panel_h)
+
     def draw_footer(
         self,
         frame: np.ndarray,
@@ -122,7 +153,7 @@ class UIRenderer:
         mode_text = "CHALLENGE MODE" if game_mode == "challenge" else "FREE PLAY"
         cv2.putText(
             frame,
-            f"Mode: {mode_text} | [M]Toggle | [Q]Quit",
+            f"Mode: {mode_text} | [M]Toggle | [P]Perf | [Q]Quit",
             (10, h - 10),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.5,
@@ -9,6 +9,36 @@ root_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(root_dir))
 
 
+class FakeClock:
+    """
+    Relógio controlado pelo teste.
+
+    Retorna ``now``, que o teste ajusta à mão; com ``step``, avança esse
+    tanto a cada leitura. ``sleep`` é um substituto de asyncio.sleep que
+    registra a espera e avança o relógio.
+    """
+
+    def __init__(self, now=0.0, step=0.0):
+        self.now = now
+        self.step = step
+        self.sleeps = []
+
+    def __call__(self):
+        if self.step:
+            self.now += self.step
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock():
+    """Fixture com um FakeClock parado em 0."""
+    return FakeClock()
+
+
 @pytest.fixture
 def sample_gesture_config():
     """Fixture com configuração de gestos de exemplo."""
@@ -0,0 +1,100 @@
+"""Testes para o AudioDispatcher."""
+
+import threading
+
+from src.services.audio_dispatcher import AudioDispatcher
+
+
+class FakeSoundService:
+    """Registra os comandos recebidos e a thread que os executou."""
+
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+
+    def _record(self, *call):
+        self.calls.append(call)
+        self.threads.add(threading.current_thread().name)
+
+    def play_sound(self, sound_path, velocity=1.0):
+        self._record("play", sound_path)
+        return f"channel-{len(self.calls)}"
+
+    def stop_sound(self, sound_path):
+        self._record("stop", sound_path)
+        return True
+
+    def stop_voice(self, sound_path, channel):
+        self._record("stop_voice", sound_path, channel)
+        return True
+
+    def set_volume(self, volume):
+        self._record("volume", volume)
+
+    def stop_all(self):
+        self._record("stop_all")
+
+
+class TestAudioDispatcher:
+    """Testes da fila de comandos de áudio."""
+
+    def test_commands_run_in_order_on_audio_thread(self):
+        """Comandos são executados em ordem, fora da thread que enfileira."""
+        service = FakeSoundService()
+        dispatcher = AudioDispatcher(service)
+        dispatcher.start()
+
+        dispatcher.note_on("do.wav")
+        dispatcher.set_volume(0.3)
+        dispatcher.note_off("do.wav")
+        dispatcher.stop_all()
+        assert dispatcher.flush()
+        dispatcher.stop()
+
+        assert service.calls == [
+            ("play", "do.wav"),
+            ("volume", 0.3),
+            ("stop", "do.wav"),
+            ("stop_all",),
+        ]
+        assert service.threads == {"audio-dispatch"}
+
+    def test_inline_mode_and_latency_stats(self):
+        """Sem thread, executa na hora e ainda mede a latência."""
+        service = FakeSoundService()
+        dispatcher = AudioDispatcher(service, threaded=False)
+        dispatcher.start()
+
+        dispatcher.note_on("re.wav")
+
+        assert service.calls == [("play", "re.wav")]
+        stats = dispatcher.latency_stats()
+        assert stats["count"] == 1
+        assert stats["max"] >= stats["p50"] >= 0.0
+
+    def test_voice_note_off_stops_only_its_channel(self):
+        """Note-off de uma voz para só o canal em que ela começou."""
+        service = FakeSoundService()
+        dispatcher = AudioDispatcher(service, threaded=False)
+
+        dispatcher.note_on("do.wav")
+        dispatcher.note_on("do.wav", voice=(1, 0))
+        dispatcher.note_off("do.wav", voice=(1, 0))
+        dispatcher.note_off("do.wav", voice=(1, 0))
+
+        assert service.calls == [
+            ("play", "do.wav"),
+            ("play", "do.wav"),
+            ("stop_voice", "do.wav", "channel-2"),
+        ]
+
+    def test_released_voice_is_not_stopped(self):
+        """Voz confirmada (liberada) não é parada por um note-off tardio."""
+        service = FakeSoundService()
+        dispatcher = AudioDispatcher(service, threaded=False)
+
+        dispatcher.note_on("do.wav", voice=(1, 0))
+        dispatcher.release_voice((1, 0))
+        dispatcher.note_off("do.wav", voice=(1, 0))
+
+        assert service.calls == [("play", "do.wav")]
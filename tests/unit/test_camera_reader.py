@@ -0,0 +1,93 @@
+"""Testes para a captura em thread dedicada do CameraService."""
+
+import time
+
+import numpy as np
+
+from src.services.camera_service import CameraService
+
+
+class FakeCapture:
+    """Captura falsa que entrega frames numerados em um intervalo fixo."""
+
+    def __init__(self, frame_interval=0.0, max_frames=None):
+        self.frame_interval = frame_interval
+        self.max_frames = max_frames
+        self.counter = 0
+
+    def read(self, image=None):
+        time.sleep(self.frame_interval)
+        if self.max_frames is not None and self.counter >= self.max_frames:
+            return False, None
+        self.counter += 1
+        if image is None:
+            image = np.empty((2, 2, 3), dtype=np.uint8)
+        image[:] = self.counter % 256
+        return True, image
+
+    def release(self):
+        pass
+
+
+def make_service(capture):
+    """Cria um CameraService threaded usando a captura falsa."""
+    service = CameraService(threaded=True)
+    service.cap = capture
+    service._initialized = True
+    return service
+
+
+class TestThreadedCapture:
+    """Testes do modo threaded."""
+
+    def test_returns_latest_frame(self):
+        """Testa que o modo threaded entrega o frame mais recente."""
+        service = make_service(FakeCapture(frame_interval=0.002))
+
+        service.read_frame()
+        time.sleep(0.05)
+        success, frame = service.read_frame()
+        service.cleanup()
+
+        assert success
+        assert service.dropped_frames > 0
+        assert service.last_frame_timestamp is not None
+        assert int(frame[0, 0, 0]) > 1
+
+    def test_repeated_read_returns_at_once(self):
+        """Testa que, sem frame novo, a leitura volta na hora marcada como repetida."""
+        service = make_service(FakeCapture(max_frames=1))
+
+        success, frame = service.read_frame()
+        start = time.perf_counter()
+        again, same = service.read_frame(frame)
+        elapsed = time.perf_counter() - start
+        service.cleanup()
+
+        assert success and again
+        assert same is frame
+        assert not service.frame_is_new
+        assert elapsed < 0.01
+
+    def test_buffers_are_swapped_not_copied(self):
+        """
+        Testa que os frames circulam por troca de buffers, sem cópias.
+
+        Três buffers circulam; um quarto pode surgir enquanto o chamador
+        ainda não devolveu nenhum (primeira leitura com frame=None).
+        """
+        service = make_service(FakeCapture(frame_interval=0.002))
+
+        buffers = set()
+        values = []
+        frame = None
+        while len(values) < 10:
+            success, frame = service.read_frame(frame)
+            if service.frame_is_new:
+                buffers.add(id(frame))
+                values.append(int(frame[0, 0, 0]))
+            time.sleep(0.003)
+        service.cleanup()
+
+        assert len(buffers) <= 4
+        assert values == sorted(values)
@@ -0,0 +1,121 @@
+"""Testes para o serviço de câmera."""
+
+import cv2
+import numpy as np
+
+from src.domain.models import CameraMode
+from src.services.camera_service import CameraService, select_camera_mode
+
+
+class FakeCapture:
+    """Captura falsa que aplica apenas os modos suportados."""
+
+    def __init__(self, supported):
+        self.supported = supported
+        self.props = {
+            cv2.CAP_PROP_FOURCC: cv2.VideoWriter_fourcc(*"YUYV"),
+            cv2.CAP_PROP_FRAME_WIDTH: 640,
+            cv2.CAP_PROP_FRAME_HEIGHT: 480,
+            cv2.CAP_PROP_FPS: 30,
+        }
+        self.counter = 0
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            # Altura acompanha a largura suportada
+            return True
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            if value not in self.supported:
+                return False
+            self.props[cv2.CAP_PROP_FRAME_HEIGHT] = self.supported[value]
+        self.props[prop] = value
+        return True
+
+    def get(self, prop):
+        return self.props.get(prop, 0)
+
+    def grab(self):
+        return True
+
+    def read(self, image=None):
+        self.counter += 1
+        return True, np.full((2, 2, 3), self.counter % 256, dtype=np.uint8)
+
+    def release(self):
+        pass
+
+
+def make_service(capture):
+    """Cria um CameraService usando a captura falsa."""
+    service = CameraService()
+    service.cap = capture
+    service._initialized = True
+    return service
+
+
+class TestSelectCameraMode:
+    """Testes para a escolha do modo de câmera."""
+
+    def test_first_mode_meeting_target_wins(self):
+        """Testa que o primeiro modo que atinge a meta é escolhido."""
+        modes = [
+            CameraMode("YUYV", 1280, 720, 30, measured_fps=8),
+            CameraMode("MJPG", 1280, 720, 30, measured_fps=29),
+            CameraMode("YUYV", 640, 480, 30, measured_fps=30),
+        ]
+
+        assert select_camera_mode(modes, target_fps=30) is modes[1]
+
+    def test_fastest_mode_when_none_meets_target(self):
+        """Testa fallback para o modo mais rápido."""
+        modes = [
+            CameraMode("YUYV", 1280, 720, 30, measured_fps=8),
+            CameraMode("YUYV", 640, 480, 30, measured_fps=15),
+        ]
+
+        assert select_camera_mode(modes, target_fps=30) is modes[1]
+        assert select_camera_mode([], target_fps=30) is None
+
+
+class TestCameraService:
+    """Testes para a classe CameraService."""
+
+    def test_set_resolution_verifies_driver(self):
+        """Testa que resoluções recusadas pelo driver retornam False."""
+        service = make_service(FakeCapture({640: 480, 1280: 720}))
+
+        assert service.set_resolution(1280, 720) is True
+        assert service.set_resolution(1920, 1080) is False
+
+    def test_negotiate_reads_back_applied_mode(self):
+        """Testa que a negociação reporta os valores aplicados pelo driver."""
+        service = make_service(FakeCapture({640: 480}))
+
+        mode = service.negotiate_mode(
+            [("MJPG", 1280, 720, 30), ("MJPG", 640, 480, 30)],
+            target_fps=30,
+            probe_frames=3,
+        )
+
+        assert mode is service.active_mode
+        assert (mode.fourcc, mode.width, mode.height) == ("MJPG", 640, 480)
+        assert mode.measured_fps > 0
+
+
+    def test_capture_mode_switches_and_restores(self):
+        """Testa que o modo ocioso reconfigura a câmera e volta ao negociado."""
+        service = make_service(FakeCapture({640: 480, 320: 240}))
+        negotiated = service.negotiate_mode(
+            [("MJPG", 640, 480, 30)], target_fps=30, probe_frames=3
+        )
+
+        idle = service.set_capture_mode(320, 240, 5)
+        assert (idle.width, idle.height, idle.fps) == (320, 240, 5)
+        assert service.get_frame_size() == (320, 240)
+        assert service.active_mode is negotiated
+
+        awake = service.set_capture_mode(
+            negotiated.width, negotiated.height, negotiated.fps
+        )
+        assert (awake.width, awake.height, awake.fps) == (640, 480, 30)
+        assert awake.fourcc == "MJPG"
@@ -0,0 +1,99 @@
+"""Testes para a fonte de vídeo em arquivo."""
+
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from src.services.file_camera_service import FileCameraService
+
+
+@pytest.fixture
+def frames_dir(tmp_path):
+    """Cria um diretório com 5 frames numerados."""
+    for i in range(5):
+        frame = np.full((48, 64, 3), i * 10, dtype=np.uint8)
+        cv2.imwrite(str(tmp_path / f"frame_{i:03d}.png"), frame)
+    return tmp_path
+
+
+class TestFileCameraService:
+    """Testes para a classe FileCameraService."""
+
+    def test_reads_frames_in_order(self, frames_dir):
+        """Testa leitura sequencial dos frames do diretório."""
+        source = FileCameraService(str(frames_dir), loop=False)
+        assert source.initialize()
+
+        values = []
+        while True:
+            success, frame = source.read_frame()
+            if not success:
+                break
+            values.append(int(frame[0, 0, 0]))
+
+        assert values == [0, 10, 20, 30, 40]
+        assert source.get_frame_size() == (64, 48)
+
+    def test_loop_rewinds(self, frames_dir):
+        """Testa que o modo loop volta ao primeiro frame."""
+        source = FileCameraService(str(frames_dir), loop=True)
+        source.initialize()
+
+        values = [int(source.read_frame()[1][0, 0, 0]) for _ in range(7)]
+
+        assert values == [0, 10, 20, 30, 40, 0, 10]
+
+    def test_set_resolution_resizes_frames(self, frames_dir):
+        """Testa redimensionamento para a resolução configurada."""
+        source = FileCameraService(str(frames_dir))
+        source.initialize()
+        source.set_resolution(32, 24)
+
+        success, frame = source.read_frame()
+
+        assert success
+        assert frame.shape == (24, 32, 3)
+
+    def test_negotiate_keeps_native_size(self, frames_dir):
+        """Testa que a negociação não estica nem redimensiona os frames."""
+        source = FileCameraService(str(frames_dir))
+        source.initialize()
+
+        mode = source.negotiate_mode([("MJPG", 1280, 720, 30)], target_fps=30)
+        success, frame = source.read_frame()
+
+        assert (mode.width, mode.height) == (64, 48)
+        assert frame.shape == (48, 64, 3)
+
+    def test_capture_mode_is_fixed(self, frames_dir):
+        """Testa que o modo de captura de um arquivo não muda."""
+        source = FileCameraService(str(frames_dir))
+        source.initialize()
+
+        mode = source.set_capture_mode(320, 240, 5)
+        success, frame = source.read_frame()
+
+        assert (mode.width, mode.height) == (64, 48)
+        assert frame.shape == (48, 64, 3)
+
+    def test_realtime_drops_late_frames(self, frames_dir):
+        """Testa que o modo realtime descarta frames atrasados."""
+        source = FileCameraService(str(frames_dir), realtime=True, fps=100, loop=False)
+        source.initialize()
+
+        source.read_frame()
+        time.sleep(0.035)
+        success, frame = source.read_frame()
+
+        assert success
+        assert source.dropped_frames >= 2
+        assert int(frame[0, 0, 0]) >= 30
+
+    def test_missing_source(self, tmp_path):
+        """Testa falha ao abrir diretório sem frames."""
+        source = FileCameraService(str(tmp_path))
+
+        assert source.initialize() is False
+        assert source.read_frame() == (False, None)
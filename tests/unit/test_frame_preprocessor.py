@@ -0,0 +1,59 @@
+"""Testes para o pré-processador de frames."""
+
+import numpy as np
+
+from src.services.frame_preprocessor import FramePreprocessor
+
+
+class TestFramePreprocessor:
+    """Testes para a classe FramePreprocessor."""
+
+    def test_flip_and_convert(self):
+        """Testa espelhamento horizontal e conversão BGR -> RGB."""
+        frame = np.zeros((4, 6, 3), dtype=np.uint8)
+        frame[:, 0] = (255, 0, 0)  # Coluna esquerda azul (BGR)
+
+        display, rgb = FramePreprocessor().process(frame)
+
+        assert tuple(display[0, -1]) == (255, 0, 0)
+        assert tuple(rgb[0, -1]) == (0, 0, 255)
+
+    def test_buffers_reused_between_frames(self):
+        """Testa que os buffers não são realocados em regime permanente."""
+        preprocessor = FramePreprocessor()
+        display, rgb = preprocessor.process(np.zeros((4, 6, 3), dtype=np.uint8))
+
+        capture = preprocessor.capture_buffer
+        display2, rgb2 = preprocessor.process(capture)
+
+        assert display2 is display
+        assert rgb2 is rgb
+        assert preprocessor.reallocations == 1
+
+    def test_reallocates_on_resolution_change(self):
+        """Testa realocação quando a resolução muda."""
+        preprocessor = FramePreprocessor()
+        preprocessor.process(np.zeros((4, 6, 3), dtype=np.uint8))
+        display, _ = preprocessor.process(np.zeros((8, 12, 3), dtype=np.uint8))
+
+        assert display.shape == (8, 12, 3)
+        assert preprocessor.reallocations == 2
+
+    def test_landmarks_mode_skips_flip_for_inference(self):
+        """Testa que o modo landmarks envia o frame original à inferência."""
+        frame = np.zeros((4, 6, 3), dtype=np.uint8)
+        frame[:, 0] = (255, 0, 0)
+
+        display, rgb = FramePreprocessor(mirror_mode="landmarks").process(frame)
+
+        assert tuple(rgb[0, 0]) == (0, 0, 255)
+        assert tuple(display[0, -1]) == (255, 0, 0)
+
+    def test_landmarks_mode_without_display_mirror(self):
+        """Testa que sem espelhamento de exibição o frame capturado é usado."""
+        frame = np.zeros((4, 6, 3), dtype=np.uint8)
+        preprocessor = FramePreprocessor(mirror_mode="landmarks", mirror_display=False)
+
+        display, _ = preprocessor.process(frame)
+
+        assert display is frame
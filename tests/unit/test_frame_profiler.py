@@ -0,0 +1,51 @@
+"""Testes para o profiler de frames."""
+
+import json
+
+from src.core.frame_profiler import FrameProfiler
+
+
+class TestFrameProfiler:
+    """Testes para a classe FrameProfiler."""
+
+    def test_disabled_records_nothing(self):
+        """Testa que o profiler desabilitado não coleta."""
+        profiler = FrameProfiler(enabled=False)
+
+        profiler.begin_frame()
+        profiler.mark("capture")
+        profiler.end_frame()
+
+        assert profiler.frames == 0
+        assert profiler.summary() == {}
+
+    def test_summary_percentiles(self):
+        """Testa resumo com percentis por estágio e total."""
+        profiler = FrameProfiler(enabled=True, window=10, stages=("a", "b"))
+
+        for _ in range(15):
+            profiler.begin_frame()
+            profiler.mark("a")
+            profiler.mark("b")
+            profiler.end_frame()
+
+        summary = profiler.summary()
+
+        assert profiler.frames == 15
+        assert set(summary) == {"a", "b", "total"}
+        assert summary["total"]["p99"] >= summary["a"]["p50"]
+        assert summary["a"]["p50"] <= summary["a"]["p95"] <= summary["a"]["p99"]
+
+    def test_export_json(self, tmp_path):
+        """Testa exportação do resumo em JSON."""
+        profiler = FrameProfiler(enabled=True, stages=("a",))
+        profiler.begin_frame()
+        profiler.mark("a")
+        profiler.end_frame()
+
+        path = tmp_path / "profile.json"
+        assert profiler.export_json(str(path))
+
+        data = json.loads(path.read_text())
+        assert data["frames"] == 1
+        assert "p95" in data["stages"]["a"]
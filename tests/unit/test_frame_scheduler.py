@@ -0,0 +1,66 @@
+"""Testes para o agendador de frames."""
+
+import asyncio
+
+import pytest
+
+from src.core.frame_scheduler import FrameScheduler
+
+
+@pytest.fixture
+def clock(fake_clock, monkeypatch):
+    """Relógio falso instalado no lugar de asyncio.sleep."""
+    monkeypatch.setattr(asyncio, "sleep", fake_clock.sleep)
+    return fake_clock
+
+
+def run_frames(scheduler, clock, work_times):
+    """Simula frames com os tempos de trabalho dados."""
+
+    async def loop():
+        for work in work_times:
+            clock.now += work
+            await scheduler.wait()
+
+    asyncio.run(loop())
+
+
+class TestFrameScheduler:
+    """Testes para a classe FrameScheduler."""
+
+    def test_sleeps_only_remaining_time(self, clock):
+        """Testa que o sono desconta o tempo gasto no frame."""
+        scheduler = FrameScheduler(target_fps=100, clock=clock)
+
+        run_frames(scheduler, clock, [0.0, 0.004, 0.004])
+
+        assert clock.sleeps[1] == pytest.approx(0.006)
+        assert clock.sleeps[2] == pytest.approx(0.006)
+        assert scheduler.missed_deadlines == 0
+
+    def test_counts_missed_deadlines(self, clock):
+        """Testa contagem de deadlines perdidos sem dormir."""
+        scheduler = FrameScheduler(target_fps=100, clock=clock)
+
+        run_frames(scheduler, clock, [0.0, 0.015, 0.004])
+
+        assert scheduler.missed_deadlines == 1
+        assert clock.sleeps[1] == 0
+        assert clock.sleeps[2] == pytest.approx(0.001)
+
+    def test_resyncs_after_long_stall(self, clock):
+        """Testa realinhamento após atraso maior que um frame."""
+        scheduler = FrameScheduler(target_fps=100, clock=clock)
+
+        run_frames(scheduler, clock, [0.0, 0.05, 0.004])
+
+        assert clock.sleeps[2] == pytest.approx(0.006)
+
+    def test_uncapped_never_sleeps(self, clock):
+        """Testa que o modo uncapped só cede o event loop."""
+        scheduler = FrameScheduler(target_fps=60, uncapped=True, clock=clock)
+
+        run_frames(scheduler, clock, [0.001] * 5)
+
+        assert clock.sleeps == [0] * 5
+        assert scheduler.frames == 5
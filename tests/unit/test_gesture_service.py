@@ -0,0 +1,328 @@
+"""Testes para o serviço de detecção de gestos."""
+
+import numpy as np
+import pytest
+
+from src.domain.models import HandFrame
+from src.services.gesture_service import GestureService
+
+LEFT = {
+    8: {"sound": "c4.wav", "name": "C4"},
+    12: {"sound": "d4.wav", "name": "D4"},
+}
+RIGHT = {
+    8: {"sound": "e4.wav", "name": "E4"},
+    12: {"sound": "f4.wav", "name": "F4"},
+    16: {"sound": "g4.wav", "name": "G4"},
+}
+
+
+def base_landmarks(n_hands):
+    """Mãos 1000x1000 com escala de 100 px (punho -> MCP do médio)."""
+    landmarks = np.zeros((n_hands, 21, 3), dtype=np.float32)
+    landmarks[:, :, 0] = 0.9  # Dedos longe do polegar
+    landmarks[:, 0, :2] = (0.5, 0.5)
+    landmarks[:, 9, :2] = (0.5, 0.4)
+    landmarks[:, 4, :2] = (0.1, 0.1)
+    return landmarks
+
+
+def make_hand_frame(touching_per_hand, labels=("Left", "Right")):
+    """Cria um HandFrame 1000x1000 com os dedos dados encostados no polegar."""
+    landmarks = base_landmarks(len(labels))
+    for hand, fingers in enumerate(touching_per_hand):
+        for finger_id in fingers:
+            landmarks[hand, finger_id, :2] = (0.11, 0.1)  # 10 px do polegar
+    return HandFrame.from_arrays(landmarks, labels, [1.0] * len(labels), 1000, 1000)
+
+
+@pytest.fixture
+def service():
+    """GestureService configurado com as duas mãos."""
+    return GestureService(
+        press_threshold=0.4, min_hold=0.0, left_hand_gestures=LEFT, right_hand_gestures=RIGHT
+    )
+
+
+class TestGestureService:
+    """Testes para a classe GestureService."""
+
+    def test_detect_frame_batches_all_hands(self, service):
+        """Testa detecção de toques em todas as mãos de uma vez."""
+        events = service.detect_frame(make_hand_frame([{8}, {12, 16}]))
+
+        assert events.pressed.shape == (2, 3)
+        assert events.active(0) == {8}
+        assert events.active(1) == {12, 16}
+        assert not events.valid[0, 2]
+
+    def test_press_and_release_transitions(self, service):
+        """Testa que toques só disparam na transição."""
+        first = service.detect_frame(make_hand_frame([{8}, set()]))
+        held = service.detect_frame(make_hand_frame([{8}, set()]))
+        released = service.detect_frame(make_hand_frame([set(), set()]))
+
+        assert first.pressed.sum() == 1
+        assert held.pressed.sum() == 0
+        assert released.released[0, 0]
+        assert service.get_active_gestures(0) == set()
+
+    def test_gesture_data_lookup(self, service):
+        """Testa mapeamento de colunas para os dados do gesto."""
+        events = service.detect_frame(make_hand_frame([set(), {16}]))
+        hand_idx, column = np.argwhere(events.pressed)[0]
+
+        assert service.gesture_data(1, column)["name"] == "G4"
+        assert "G4" in service.active_notes
+
+    def test_per_hand_wrapper(self, sample_gesture_config):
+        """Testa o wrapper por mão e o callback de gesto."""
+        service = GestureService(press_threshold=0.4)
+        fired = []
+        hand_frame = make_hand_frame([{12}], labels=("Left",))
+
+        active = service.detect_finger_gestures(
+            hand_frame, 0, sample_gesture_config, lambda note, data: fired.append(note)
+        )
+        service.detect_finger_gestures(
+            hand_frame, 0, sample_gesture_config, lambda note, data: fired.append(note)
+        )
+
+        assert active == {12}
+        assert fired == ["D4"]
+
+    def test_per_hand_wrapper_with_different_config_sizes(self):
+        """Testa que configs de tamanhos diferentes não redisparam toques mantidos."""
+        service = GestureService(press_threshold=0.4, max_hands=2)
+        fired = []
+        hand_frame = make_hand_frame([{12}, {16}])
+
+        for _ in range(3):
+            service.detect_finger_gestures(
+                hand_frame, 0, LEFT, lambda note, data: fired.append(note)
+            )
+            service.detect_finger_gestures(
+                hand_frame, 1, RIGHT, lambda note, data: fired.append(note)
+            )
+
+        assert fired == ["D4", "G4"]
+        assert service.get_active_gestures(0) == {12}
+        assert service.get_active_gestures(1) == {16}
+
+    def test_empty_frame(self, service):
+        """Testa frame sem mãos."""
+        events = service.detect_frame(HandFrame.empty(640, 480))
+
+        assert events.pressed.shape == (0, 3)
+
+
+def finger_at(distance_px):
+    """HandFrame com uma mão esquerda e o indicador a distance_px do polegar."""
+    landmarks = base_landmarks(1)
+    landmarks[0, 8, :2] = (0.1 + distance_px / 1000.0, 0.1)
+    return HandFrame.from_arrays(landmarks, ("Left",), [1.0], 1000, 1000)
+
+
+class TestGestureVelocity:
+    """Testes da velocity estimada pela aproximação dos dedos."""
+
+    def _press_velocity(self, path_px, frame_time=1 / 30):
+        clock = iter(np.arange(len(path_px)) * frame_time)
+        service = GestureService(
+            press_threshold=0.4,
+            release_threshold=0.5,
+            left_hand_gestures=LEFT,
+            right_hand_gestures=RIGHT,
+            velocity_speed_range=(1.5, 15.0),
+            velocity_smoothing=1.0,
+            clock=lambda: next(clock),
+        )
+        for distance in path_px:
+            events = service.detect_frame(finger_at(distance))
+        assert events.pressed[0, 0]
+        return float(events.velocity[0, 0])
+
+    def test_fast_approach_is_louder(self):
+        """Aproximação rápida gera velocity maior que a lenta."""
+        fast = self._press_velocity([200, 30])  # 170 px em 1/30 s
+        slow = self._press_velocity([50, 45, 39])  # 6 px por frame
+
+        assert fast == 1.0
+        assert slow < 0.2
+        assert fast > slow
+
+    def test_hand_without_history_uses_default(self):
+        """Mão que acabou de aparecer usa a velocity padrão."""
+        service = GestureService(
+            left_hand_gestures=LEFT, right_hand_gestures=RIGHT, default_velocity=0.6
+        )
+
+        events = service.detect_frame(finger_at(10))
+
+        assert events.velocity[0, 0] == pytest.approx(0.6)
+
+
+class TestPredictiveOnset:
+    """Testes do disparo preditivo de notas."""
+
+    def _service(self):
+        clock = iter(np.arange(100) / 30)
+        return GestureService(
+            press_threshold=0.4,
+            release_threshold=0.5,
+            left_hand_gestures=LEFT,
+            right_hand_gestures=RIGHT,
+            velocity_smoothing=1.0,
+            clock=lambda: next(clock),
+            predictive=True,
+            predictive_margin=0.05,
+        )
+
+    def test_fires_before_touch_and_confirms(self):
+        """A nota sai um frame antes do toque e o toque não a repete."""
+        service = self._service()
+        events = [service.detect_frame(finger_at(d)) for d in (200, 130, 70, 15)]
+
+        assert events[2].predicted[0, 0] and not events[2].touching[0, 0]
+        assert events[2].onsets[0, 0]
+        assert events[3].pressed[0, 0] and events[3].confirmed[0, 0]
+        assert not events[3].onsets[0, 0]
+        assert service.predictions == 1
+
+    def test_cancels_when_finger_backs_off(self):
+        """Previsão sem toque é cancelada quando o dedo se afasta."""
+        service = self._service()
+        events = [service.detect_frame(finger_at(d)) for d in (200, 130, 70, 90)]
+
+        assert events[2].predicted[0, 0]
+        assert events[3].cancelled[0, 0]
+        assert service.cancellations == 1
+
+    def test_cancels_when_hand_vanishes(self):
+        """Previsão de uma mão que some vira cancelamento (note-off)."""
+        service = self._service()
+        events = [service.detect_frame(finger_at(d)) for d in (200, 130, 70)]
+        vanished = service.detect_frame(HandFrame.empty(1000, 1000))
+        after = service.detect_frame(HandFrame.empty(1000, 1000))
+
+        assert events[2].predicted[0, 0]
+        lost = [(column, data["name"]) for _, column, data in vanished.lost]
+        assert lost == [(0, "C4")]
+        assert after.lost == []
+        assert service.cancellations == 1
+
+    def test_reset_between_frames_reports_lost(self):
+        """Previsões descartadas por reset() saem no frame seguinte."""
+        service = self._service()
+        events = [service.detect_frame(finger_at(d)) for d in (200, 130, 70)]
+        service.reset()
+        after = service.detect_frame(HandFrame.empty(1000, 1000))
+
+        assert events[2].predicted[0, 0]
+        assert [data["name"] for _, _, data in after.lost] == ["C4"]
+
+    def test_disabled_onsets_match_presses(self):
+        """Sem previsão, as notas começam exatamente nos toques."""
+        service = GestureService(
+            press_threshold=0.4, left_hand_gestures=LEFT, right_hand_gestures=RIGHT
+        )
+        events = [service.detect_frame(finger_at(d)) for d in (200, 70, 15)]
+
+        assert not events[1].onsets.any()
+        assert events[2].onsets is events[2].pressed
+
+
+class TestTouchHysteresis:
+    """Testes dos limiares normalizados, da histerese e do hold mínimo."""
+
+    def _service(self, times, **kwargs):
+        clock = iter(times)
+        return GestureService(
+            left_hand_gestures=LEFT,
+            right_hand_gestures=RIGHT,
+            clock=lambda: next(clock),
+            **kwargs,
+        )
+
+    def test_threshold_scales_with_hand_size(self):
+        """A mesma pose dispara perto ou longe da câmera."""
+        service = self._service(np.arange(10), press_threshold=0.3, min_hold=0.0)
+        near = base_landmarks(1)
+        near[0, 8, :2] = (0.125, 0.1)  # 25 px, mão de 100 px
+        far = base_landmarks(1)
+        far[0, 9, :2] = (0.5, 0.45)  # mão de 50 px
+        far[0, 8, :2] = (0.125, 0.1)  # 25 px = 0.5 mão
+
+        frame = lambda lm: HandFrame.from_arrays(lm, ("Left",), [1.0], 1000, 1000)
+
+        assert service.detect_frame(frame(near)).touching[0, 0]
+        service.reset()
+        assert not service.detect_frame(frame(far)).touching[0, 0]
+
+    def test_no_chatter_near_threshold(self):
+        """Oscilar entre os limiares de toque e soltura não redispara a nota."""
+        service = self._service(
+            np.arange(10) * 0.1, press_threshold=0.3, release_threshold=0.45, min_hold=0.0
+        )
+        events = [service.detect_frame(finger_at(d)) for d in (29, 35, 28, 40, 29, 50)]
+
+        assert sum(int(e.pressed[0, 0]) for e in events) == 1
+        assert events[-1].released[0, 0]
+
+    def test_min_hold_delays_release(self):
+        """Um toque só pode terminar depois do hold mínimo."""
+        service = self._service(
+            [0.0, 0.02, 0.04, 0.2], press_threshold=0.3, min_hold=0.1
+        )
+        events = [service.detect_frame(finger_at(d)) for d in (20, 90, 90, 90)]
+
+        assert events[0].pressed[0, 0]
+        assert events[1].touching[0, 0] and events[2].touching[0, 0]
+        assert events[3].released[0, 0]
+
+    def test_release_below_press_is_rejected(self):
+        """Limiar de soltura menor que o de toque é configuração inválida."""
+        with pytest.raises(ValueError):
+            GestureService(press_threshold=0.4, release_threshold=0.3)
+
+
+class TestHandIdentity:
+    """Testes do estado de toque indexado pelo ID persistente da mão."""
+
+    def tracked_frame(self, touching_per_hand, labels, track_ids):
+        hand_frame = make_hand_frame(touching_per_hand, labels)
+        hand_frame.track_ids = np.asarray(track_ids, dtype=np.int64)
+        return hand_frame
+
+    def test_swapped_order_keeps_touch_state(self, service):
+        """Testa que a troca de ordem das mãos não redispara nem perde toques."""
+        service.detect_frame(self.tracked_frame([{8}, {16}], ("Left", "Right"), [0, 1]))
+        events = service.detect_frame(
+            self.tracked_frame([{16}, {8}], ("Right", "Left"), [1, 0])
+        )
+
+        assert not events.pressed.any()
+        assert not events.released.any()
+        assert service.get_active_gestures(0) == {8}
+        assert service.get_active_gestures(1) == {16}
+        assert service.reorders == 1
+
+    def test_returning_hand_resumes_state(self, service):
+        """Testa que uma mão que some por um frame retoma seu toque."""
+        service.detect_frame(self.tracked_frame([{8}, {16}], ("Left", "Right"), [0, 1]))
+        service.detect_frame(self.tracked_frame([{16}], ("Right",), [1]))
+        events = service.detect_frame(
+            self.tracked_frame([{8}, {16}], ("Left", "Right"), [0, 1])
+        )
+
+        assert not events.pressed.any()
+
+    def test_new_id_starts_clean(self, service):
+        """Testa que um ID novo não herda o toque da linha que ocupa."""
+        service.detect_frame(self.tracked_frame([{8}, set()], ("Left", "Right"), [0, 1]))
+        events = service.detect_frame(
+            self.tracked_frame([{8}, set()], ("Left", "Right"), [2, 1])
+        )
+
+        assert events.pressed[0, 0]
+        assert service.get_active_gestures(2) == {8}
@@ -0,0 +1,60 @@
+"""Testes para o tracker de identidade das mãos."""
+
+import numpy as np
+
+from src.domain.models import HandFrame
+from src.services.hand_tracker import HandTracker
+
+
+def make_frame(wrists, labels):
+    """Cria um HandFrame com os punhos nas posições dadas (normalizadas)."""
+    landmarks = np.zeros((len(labels), 21, 3), dtype=np.float32)
+    for hand, wrist in enumerate(wrists):
+        landmarks[hand, :, :2] = wrist
+    return HandFrame.from_arrays(landmarks, labels, [1.0] * len(labels), 640, 480)
+
+
+class TestHandTracker:
+    """Testes para a classe HandTracker."""
+
+    def test_ids_follow_hands_when_order_swaps(self):
+        """Testa que os IDs seguem as mãos, não o índice na lista."""
+        tracker = HandTracker()
+        first = tracker.update(make_frame([(0.2, 0.5), (0.8, 0.5)], ("Left", "Right")))
+        swapped = make_frame([(0.79, 0.5), (0.21, 0.5)], ("Right", "Left"))
+        second = tracker.update(swapped)
+
+        assert first.tolist() == [0, 1]
+        assert second.tolist() == [1, 0]
+        assert swapped.track_ids is second
+
+    def test_crossing_hands_keep_ids_by_position(self):
+        """Testa que a posição desempata mesmo com a lateralidade trocada."""
+        tracker = HandTracker(handedness_penalty=0.05)
+        tracker.update(make_frame([(0.45, 0.5), (0.55, 0.5)], ("Left", "Right")))
+        ids = tracker.update(make_frame([(0.45, 0.5), (0.55, 0.5)], ("Right", "Left")))
+
+        assert ids.tolist() == [0, 1]
+
+    def test_far_jump_opens_new_track(self):
+        """Testa que um salto maior que max_distance vira outra mão."""
+        tracker = HandTracker(max_distance=0.1)
+        tracker.update(make_frame([(0.2, 0.5)], ("Left",)))
+        ids = tracker.update(make_frame([(0.8, 0.5)], ("Left",)))
+
+        assert ids.tolist() == [1]
+        assert tracker.n_tracks == 2
+
+    def test_missing_hand_survives_then_expires(self):
+        """Testa que uma mão ausente mantém o ID por max_missing_frames."""
+        tracker = HandTracker(max_missing_frames=2)
+        tracker.update(make_frame([(0.2, 0.5)], ("Left",)))
+        empty = HandFrame.empty(640, 480)
+
+        tracker.update(empty)
+        assert tracker.update(make_frame([(0.2, 0.5)], ("Left",))).tolist() == [0]
+
+        for _ in range(3):
+            tracker.update(empty)
+        assert tracker.n_tracks == 0
+        assert tracker.update(make_frame([(0.2, 0.5)], ("Left",))).tolist() == [1]
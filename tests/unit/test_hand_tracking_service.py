@@ -0,0 +1,169 @@
+"""Testes para a inferência por região do HandTrackingService."""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.services.hand_tracking_service import HandTrackingService
+
+
+class FakeHands:
+    """Substituto do MediaPipe Hands que acha uma mão em um ponto fixo do frame."""
+
+    def __init__(self, hand_xy):
+        self.hand_xy = hand_xy  # (x, y) em pixels do frame inteiro
+        self.shapes = []
+        self.images = []
+        self.offset = (0, 0)  # Canto da região enviada (definido pelo teste)
+        self.scale = 1.0
+
+    def process(self, image):
+        self.shapes.append(image.shape[:2])
+        self.images.append(image)
+        height, width = image.shape[:2]
+        x = ((self.hand_xy[0] - self.offset[0]) * self.scale) / width
+        y = ((self.hand_xy[1] - self.offset[1]) * self.scale) / height
+        if not (0 <= x <= 1 and 0 <= y <= 1):
+            return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+        landmarks = [SimpleNamespace(x=x, y=y, z=0.0) for _ in range(21)]
+        return SimpleNamespace(
+            multi_hand_landmarks=[SimpleNamespace(landmark=landmarks)],
+            multi_handedness=[
+                SimpleNamespace(classification=[SimpleNamespace(label="Right", score=0.9)])
+            ],
+        )
+
+
+def make_service(fake_hands, **kwargs):
+    """HandTrackingService inline com o MediaPipe substituído."""
+    service = HandTrackingService(roi=True, **kwargs)
+    service.hands = fake_hands
+    service._initialized = True
+    return service
+
+
+class TestRegionOfInterest:
+    """Testes do modo ROI."""
+
+    def test_crops_around_previous_hand_and_maps_back(self):
+        """Testa que a região é usada e os landmarks voltam ao frame inteiro."""
+        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        fake = FakeHands((640, 360))
+        service = make_service(fake, roi_working_size=4096)
+
+        service.detect(frame)
+        x0, y0, x1, y1 = service._roi_box
+        fake.offset = (x0, y0)
+        hand_frame = service.detect(frame)
+
+        assert fake.shapes[0] == (720, 1280)
+        assert fake.shapes[1] == (y1 - y0, x1 - x0)
+        assert service.roi_frames == 1
+        np.testing.assert_allclose(hand_frame.points[0, 0], (640, 360), atol=1)
+
+    def test_large_regions_are_downscaled(self):
+        """Testa que a região enviada respeita roi_working_size."""
+        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        fake = FakeHands((640, 360))
+        service = make_service(fake, roi_working_size=16, roi_padding=2.0)
+
+        service.detect(frame)
+        x0, y0, x1, y1 = service._roi_box
+        fake.offset = (x0, y0)
+        fake.scale = 16 / max(x1 - x0, y1 - y0)
+        hand_frame = service.detect(frame)
+
+        assert max(fake.shapes[1]) == 16
+        np.testing.assert_allclose(hand_frame.points[0, 0], (640, 360), atol=2)
+
+    def test_crop_buffer_is_reused(self):
+        """Testa que regiões do mesmo tamanho reutilizam o buffer do recorte."""
+        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        fake = FakeHands((640, 360))
+        service = make_service(fake, roi_working_size=16, roi_padding=2.0)
+
+        service.detect(frame)
+        x0, y0, x1, y1 = service._roi_box
+        fake.offset = (x0, y0)
+        fake.scale = 16 / max(x1 - x0, y1 - y0)
+        service.detect(frame)
+        service.detect(frame)
+
+        assert service.roi_frames == 2
+        assert fake.images[1] is fake.images[2]
+
+    def test_falls_back_to_full_frame_when_lost(self):
+        """Testa o fallback para o frame inteiro quando a região fica vazia."""
+        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        fake = FakeHands((640, 360))
+        service = make_service(fake)
+
+        service.detect(frame)
+        fake.offset = (10_000, 10_000)  # A mão some da região
+        service.detect(frame)
+
+        assert service.roi_fallbacks == 1
+        assert fake.shapes[-1] == (720, 1280)
+
+
+class TestInferenceScale:
+    """Testes da escala de inferência."""
+
+    def test_scaled_input_keeps_display_coordinates(self):
+        """Testa que a imagem reduzida não muda as coordenadas dos landmarks."""
+        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        fake = FakeHands((640, 360))
+        fake.scale = 0.5
+        service = HandTrackingService(inference_scale=0.5)
+        service.hands = fake
+        service._initialized = True
+
+        hand_frame = service.detect(frame)
+
+        assert fake.shapes == [(360, 640)]
+        assert (hand_frame.width, hand_frame.height) == (1280, 720)
+        np.testing.assert_allclose(hand_frame.points[0, 0], (640, 360), atol=1)
+
+    def test_configure_before_initialize_only_updates_settings(self):
+        """Testa que configure sem MediaPipe ativo só guarda os parâmetros."""
+        service = HandTrackingService()
+        service.configure(inference_scale=0.75, model_complexity=0)
+
+        assert service.inference_scale == 0.75
+        assert service._hands_config()["model_complexity"] == 0
+
+
+class TestTrackingStats:
+    """Testes da contagem de frames rastreados vs. re-detectados."""
+
+    def test_counts_palm_detection_until_all_hands_tracked(self):
+        """Testa que só frames após max_num_hands mãos contam como rastreados."""
+        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        service = HandTrackingService(max_num_hands=1)
+        service.hands = FakeHands((640, 360))
+        service._initialized = True
+
+        for _ in range(3):
+            service.detect(frame)
+
+        stats = service.tracking_stats()
+        assert stats["detection_frames"] == 1
+        assert stats["tracking_frames"] == 2
+
+    def test_roi_fallback_counts_as_detection(self):
+        """Testa que a região vazia + frame inteiro conta como detecção."""
+        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+        fake = FakeHands((640, 360))
+        service = make_service(fake, max_num_hands=1, roi_working_size=4096)
+
+        service.detect(frame)
+        x0, y0, _, _ = service._roi_box
+        fake.offset = (x0, y0)
+        service.detect(frame)
+        fake.offset = (10_000, 10_000)  # A mão some da região
+        service.detect(frame)
+
+        stats = service.tracking_stats()
+        assert service.roi_frames == 1 and service.roi_fallbacks == 1
+        assert stats["tracking_frames"] == 1
+        assert stats["detection_frames"] == 2
@@ -0,0 +1,217 @@
+"""Testes para o worker de inferência em pipeline."""
+
+import queue
+import threading
+from types import SimpleNamespace
+
+import mediapipe.python.solutions.hands as mp_hands
+import numpy as np
+import pytest
+
+import src.services.hand_tracking_service as hand_tracking_service
+from src.services.hand_tracking_service import HandTrackingService
+from src.services.hand_tracking_worker import (
+    HandTrackingWorker,
+    _worker_main,
+    pack_results,
+    unpack_results,
+)
+
+
+def fake_results(values):
+    """Resultados no formato do MediaPipe, uma mão por valor (x = y = z = valor)."""
+    if not values:
+        return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+    return SimpleNamespace(
+        multi_hand_landmarks=[
+            SimpleNamespace(landmark=[SimpleNamespace(x=v, y=v, z=v)] * 21) for v in values
+        ],
+        multi_handedness=[
+            SimpleNamespace(classification=[SimpleNamespace(label="Right", score=0.5)])
+            for _ in values
+        ],
+    )
+
+
+class FakeHands:
+    """Substituto do MediaPipe Hands: uma mão em x = primeiro pixel / 255."""
+
+    def __init__(self, **kwargs):
+        self.config = kwargs
+
+    def process(self, frame):
+        return fake_results([frame[0, 0, 0] / 255.0])
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    """HandTrackingWorker com o loop real rodando em uma thread, sem MediaPipe."""
+    monkeypatch.setattr(mp_hands, "Hands", FakeHands)
+    config = {"max_num_hands": 1}
+    worker = HandTrackingWorker(config, timeout=5.0)
+    worker._requests = queue.Queue()
+    worker._responses = queue.Queue()
+    thread = threading.Thread(
+        target=_worker_main,
+        args=(config, worker._requests, worker._responses),
+        daemon=True,
+    )
+    thread.start()
+    assert worker._responses.get(timeout=5.0) == ("ready", None)
+    yield worker
+    worker._requests.put(None)
+    thread.join(timeout=5.0)
+    worker._process = None
+    worker.stop()
+
+
+def frame_of(value, shape=(48, 64, 3)):
+    """Frame uniforme com o valor dado."""
+    return np.full(shape, value, dtype=np.uint8)
+
+
+class TestResultPacking:
+    """Testes de pack_results/unpack_results."""
+
+    def test_round_trip(self):
+        """Testa que landmarks, rótulos e scores sobrevivem ao empacotamento."""
+        landmarks, labels, scores = pack_results(fake_results([0.25, 0.5]))
+        results = unpack_results(landmarks, labels, scores)
+
+        assert landmarks.shape == (2, 21, 3)
+        assert landmarks.dtype == np.float32
+        assert labels == ["Right", "Right"]
+        assert len(results.multi_hand_landmarks) == 2
+        assert results.multi_hand_landmarks[1].landmark[20].x == pytest.approx(0.5)
+        assert results.multi_handedness[0].classification[0].score == pytest.approx(0.5)
+
+    def test_no_hands(self):
+        """Testa resultados sem mãos."""
+        landmarks, labels, scores = pack_results(fake_results([]))
+
+        assert landmarks.shape == (0, 21, 3)
+        assert unpack_results(landmarks, labels, scores) == (None, None)
+
+
+class TestWorkerHandoff:
+    """Testes da troca de frames por memória compartilhada."""
+
+    def test_returns_previous_frame_result(self, worker):
+        """Testa a latência de um frame: cada submit retorna o frame anterior."""
+        first = worker.submit(frame_of(51))
+        second = worker.submit(frame_of(102))
+        third = worker.submit(frame_of(153))
+
+        assert len(first[0]) == 0
+        assert second[0][0, 0, 0] == pytest.approx(0.2)
+        assert third[0][0, 0, 0] == pytest.approx(0.4)
+        assert worker.finish()[0][0, 0, 0] == pytest.approx(0.6)
+        assert worker.finish() is None
+
+    def test_slots_alternate(self, worker):
+        """Testa que o frame novo nunca é escrito no slot do frame em voo."""
+        sent = []
+        put = worker._requests.put
+
+        def record(request):
+            sent.append(request)
+            put(request)
+
+        worker._requests.put = record
+        for value in (0, 0, 0):
+            worker.submit(frame_of(value))
+        worker.finish()
+        names = [name for _, name, _ in sent]
+
+        assert [seq for seq, _, _ in sent] == [0, 1, 2]
+        assert names[0] != names[1]
+        assert names[2] == names[0]
+        assert set(names) == {slot.name for slot in worker._slots}
+
+    def test_resolution_change_reallocates_slots(self, worker):
+        """Testa que trocar a resolução recria os slots sem perder o resultado."""
+        worker.submit(frame_of(51))
+        old_names = {slot.name for slot in worker._slots}
+        previous = worker.submit(frame_of(102, shape=(96, 128, 3)))
+        latest = worker.finish()
+
+        assert worker._slot_shape == (96, 128, 3)
+        assert old_names.isdisjoint(slot.name for slot in worker._slots)
+        assert previous[0][0, 0, 0] == pytest.approx(0.2)
+        assert latest[0][0, 0, 0] == pytest.approx(0.4)
+
+
+class TestPipelinedService:
+    """Testes do HandTrackingService no modo pipelined."""
+
+    def test_process_frame_lags_one_frame(self, worker):
+        """Testa que process_frame retorna o resultado do frame anterior."""
+        service = HandTrackingService(pipelined=True)
+        service.worker = worker
+        service._initialized = True
+
+        first = service.process_frame(frame_of(51))
+        second = service.process_frame(frame_of(102))
+
+        assert first.multi_hand_landmarks is None
+        assert second.multi_hand_landmarks[0].landmark[0].x == pytest.approx(0.2)
+
+    def test_tracking_stats_come_from_worker(self, worker):
+        """Testa que rastreado vs. detectado segue o que o worker rodou."""
+        service = HandTrackingService(pipelined=True, max_num_hands=1)
+        service.worker = worker
+        service._initialized = True
+
+        for value in (51, 102, 153):
+            service.detect(frame_of(value))
+
+        # 1º frame: sem resultado; 2º: detector de palma; 3º: rastreado
+        stats = service.tracking_stats()
+        assert stats["detection_frames"] == 1
+        assert stats["tracking_frames"] == 1
+
+    def test_configure_rebuilds_worker_in_background(self, worker, monkeypatch):
+        """Testa que trocar o modelo não bloqueia e o worker atual segue ativo."""
+        started = threading.Event()
+        release = threading.Event()
+
+        class SlowWorker:
+            def __init__(self, hands_config):
+                self.hands_config = hands_config
+                self.frames = 0
+                self.last_palm_detection = None
+
+            def start(self):
+                started.set()
+                return release.wait(timeout=5.0)
+
+            def submit(self, frame):
+                self.frames += 1
+                return pack_results(fake_results([]))
+
+            def stop(self):
+                pass
+
+        monkeypatch.setattr(hand_tracking_service, "HandTrackingWorker", SlowWorker)
+        service = HandTrackingService(pipelined=True, model_complexity=1)
+        service.worker = worker
+        service._initialized = True
+        service.detect(frame_of(51))
+
+        service.configure(model_complexity=0)
+        assert started.wait(timeout=5.0)
+        during = service.detect(frame_of(102))
+        assert service.worker is worker
+
+        release.set()
+        service._rebuild_thread.join(timeout=5.0)
+        swapped = service.detect(frame_of(153))
+
+        assert during.n_hands == 1
+        assert swapped.n_hands == 1  # Resultado em voo do worker antigo
+        assert isinstance(service.worker, SlowWorker)
+        assert service.worker.hands_config["model_complexity"] == 0
+        assert service.worker.frames == 1
@@ -0,0 +1,56 @@
+"""Testes para o monitor de ociosidade."""
+
+import pytest
+
+from src.core.idle_monitor import IdleMonitor
+
+
+class TestIdleMonitor:
+    """Testes para a classe IdleMonitor."""
+
+    def test_enters_idle_after_timeout_without_hands(self, fake_clock):
+        """Testa que o modo ocioso só começa após idle_after sem mãos."""
+        monitor = IdleMonitor(idle_after=10.0, clock=fake_clock)
+
+        fake_clock.now = 9.9
+        assert not monitor.update(0)
+        fake_clock.now = 10.0
+        assert monitor.update(0)
+        assert monitor.idle
+        assert not monitor.update(0)  # Só sinaliza a entrada uma vez
+
+    def test_hands_postpone_idle(self, fake_clock):
+        """Testa que ver mãos reinicia a contagem."""
+        monitor = IdleMonitor(idle_after=10.0, clock=fake_clock)
+        fake_clock.now = 8.0
+        monitor.update(1)
+        fake_clock.now = 15.0
+
+        assert not monitor.update(0)
+
+    def test_reports_idle_time_and_wake_latency(self, fake_clock):
+        """Testa o tempo ocioso e o tempo do movimento até as mãos."""
+        monitor = IdleMonitor(idle_after=10.0, clock=fake_clock)
+        fake_clock.now = 10.0
+        monitor.update(0)
+        fake_clock.now = 40.0
+        monitor.wake()
+        fake_clock.now = 40.05
+        monitor.update(1)
+
+        stats = monitor.stats()
+        assert stats["idle_seconds"] == pytest.approx(30.0)
+        assert stats["wakes"] == 1
+        assert stats["wake_p50_ms"] == pytest.approx(50.0)
+
+    def test_wake_without_hands_is_false_wake(self, fake_clock):
+        """Testa que acordar sem ver mãos conta como despertar falso."""
+        monitor = IdleMonitor(idle_after=10.0, clock=fake_clock)
+        fake_clock.now = 10.0
+        monitor.update(0)
+        fake_clock.now = 20.0
+        monitor.wake()
+        fake_clock.now = 30.0
+
+        assert monitor.update(0)
+        assert monitor.stats()["false_wakes"] == 1
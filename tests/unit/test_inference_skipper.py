@@ -0,0 +1,73 @@
+"""Testes para a inferência intermitente com extrapolação."""
+
+import numpy as np
+
+from src.domain.models import HandFrame
+from src.services.inference_skipper import InferenceSkipper
+
+
+def make_frame(x, track_ids=(0,)):
+    """Mãos com todos os landmarks em (x, 0.5), uma por ID."""
+    landmarks = np.zeros((len(track_ids), 21, 3), dtype=np.float32)
+    landmarks[..., 0] = x
+    landmarks[..., 1] = 0.5
+    hand_frame = HandFrame.from_arrays(
+        landmarks, ["Right"] * len(track_ids), [1.0] * len(track_ids), 1000, 1000
+    )
+    hand_frame.track_ids = np.asarray(track_ids, dtype=np.int64)
+    return hand_frame
+
+
+def step(skipper, clock, hand_frame):
+    """Avança um frame de 1/30 s; infere se o skipper pedir."""
+    clock.now += 1 / 30
+    if skipper.should_infer():
+        skipper.observe(hand_frame)
+        return True
+    skipper.extrapolate()
+    return False
+
+
+class TestInferenceSkipper:
+    """Testes para a classe InferenceSkipper."""
+
+    def test_still_hand_uses_max_interval(self, fake_clock):
+        """Testa que uma mão parada roda a inferência só a cada max_skip frames."""
+        skipper = InferenceSkipper(max_skip=3, clock=fake_clock)
+        inferred = [step(skipper, fake_clock, make_frame(0.5)) for _ in range(12)]
+
+        assert skipper.interval == 3
+        assert sum(inferred[3:]) == 3
+
+    def test_fast_hand_infers_every_frame(self, fake_clock):
+        """Testa que mãos rápidas voltam à inferência em todo frame."""
+        skipper = InferenceSkipper(max_skip=3, max_step=0.01, clock=fake_clock)
+        inferred = [
+            step(skipper, fake_clock, make_frame(0.1 + 0.05 * i)) for i in range(10)
+        ]
+
+        assert skipper.interval == 1
+        assert all(inferred)
+
+    def test_extrapolates_with_hand_velocity(self, fake_clock):
+        """Testa que o frame pulado continua o movimento da mão."""
+        skipper = InferenceSkipper(max_skip=4, max_step=1.0, clock=fake_clock)
+        for i in range(3):
+            fake_clock.now += 0.1
+            skipper.should_infer()
+            skipper.observe(make_frame(0.2 + 0.01 * i))
+
+        fake_clock.now += 0.1
+        assert not skipper.should_infer()
+        hand_frame = skipper.extrapolate()
+
+        np.testing.assert_allclose(hand_frame.landmarks[0, :, 0], 0.23, atol=1e-5)
+        assert hand_frame.track_ids.tolist() == [0]
+
+    def test_without_hands_always_infers(self, fake_clock):
+        """Testa que sem mãos todo frame passa pela inferência."""
+        skipper = InferenceSkipper(max_skip=3, clock=fake_clock)
+        empty = HandFrame.empty(1000, 1000)
+        empty.track_ids = np.empty(0, dtype=np.int64)
+
+        assert all(step(skipper, fake_clock, empty) for _ in range(5))
@@ -0,0 +1,74 @@
+"""Testes para o filtro One-Euro dos landmarks."""
+
+import numpy as np
+import pytest
+
+from src.domain.models import HandFrame
+from src.services.landmark_filter import LandmarkFilter
+
+
+@pytest.fixture
+def clock(fake_clock):
+    """Relógio que avança um frame de 30 fps a cada leitura."""
+    fake_clock.step = 1 / 30
+    return fake_clock
+
+
+def make_frame(landmarks, track_ids=None):
+    """Cria um HandFrame 1000x1000 a partir de landmarks (n, 21, 3)."""
+    labels = ["Right"] * len(landmarks)
+    hand_frame = HandFrame.from_arrays(landmarks, labels, [1.0] * len(labels), 1000, 1000)
+    if track_ids is not None:
+        hand_frame.track_ids = np.asarray(track_ids, dtype=np.int64)
+    return hand_frame
+
+
+class TestLandmarkFilter:
+    """Testes para a classe LandmarkFilter."""
+
+    def test_first_frame_passes_through(self, clock):
+        """Testa que uma mão sem histórico não é alterada."""
+        landmarks = np.full((1, 21, 3), 0.5, dtype=np.float32)
+        hand_frame = make_frame(landmarks.copy())
+        LandmarkFilter(clock=clock).apply(hand_frame)
+
+        np.testing.assert_allclose(hand_frame.landmarks, landmarks, atol=1e-6)
+        assert hand_frame.pixels[0, 0, 0] == 500
+
+    def test_reduces_jitter_of_still_hand(self, clock):
+        """Testa que o tremor de uma mão parada é atenuado."""
+        rng = np.random.default_rng(0)
+        base = np.full((1, 21, 3), 0.5, dtype=np.float32)
+        landmark_filter = LandmarkFilter(clock=clock)
+        errors = []
+        for _ in range(60):
+            noisy = base + rng.normal(0, 0.003, base.shape).astype(np.float32)
+            hand_frame = make_frame(noisy)
+            landmark_filter.apply(hand_frame)
+            errors.append(np.abs(hand_frame.landmarks - base).mean())
+
+        assert np.mean(errors[10:]) < 0.5 * 0.003
+
+    def test_state_follows_track_ids(self, clock):
+        """Testa que o estado de cada mão segue o seu ID, não o índice."""
+        landmark_filter = LandmarkFilter(clock=clock)
+        left = np.full((21, 3), 0.2, dtype=np.float32)
+        right = np.full((21, 3), 0.8, dtype=np.float32)
+        landmark_filter.apply(make_frame(np.stack([left, right]), [0, 1]))
+
+        swapped = make_frame(np.stack([right, left]), [1, 0])
+        landmark_filter.apply(swapped)
+
+        np.testing.assert_allclose(swapped.landmarks[0], right, atol=1e-6)
+        np.testing.assert_allclose(swapped.landmarks[1], left, atol=1e-6)
+
+    def test_smoothing_reuses_buffer(self):
+        """Testa que o fator de suavização é escrito no buffer dado."""
+        dt = np.array([[[1 / 30]], [[np.inf]]], dtype=np.float32)
+        out = np.empty_like(dt)
+
+        result = LandmarkFilter._smoothing(1.0, dt, out=out)
+
+        assert result is out
+        expected = 1.0 / (1.0 + 1.0 / (2 * np.pi * dt[0, 0, 0]))
+        np.testing.assert_allclose(out[:, 0, 0], [expected, 1.0], rtol=1e-6)
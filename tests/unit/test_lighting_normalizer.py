@@ -0,0 +1,44 @@
+"""Testes para a correção de iluminação."""
+
+import numpy as np
+
+from src.services.lighting_normalizer import LightingNormalizer
+
+
+def frame_of(level):
+    """Frame RGB 720p uniforme no nível dado."""
+    return np.full((720, 1280, 3), level, dtype=np.uint8)
+
+
+class TestLightingNormalizer:
+    """Testes para a classe LightingNormalizer."""
+
+    def test_dark_frame_is_brightened(self):
+        """Testa que um frame escuro fica mais claro, no lugar."""
+        normalizer = LightingNormalizer()
+        rgb = frame_of(30)
+        result = normalizer.apply(rgb)
+
+        assert result is rgb
+        assert normalizer.gamma < 1.0
+        assert rgb[0, 0, 0] > 60
+
+    def test_bright_frame_is_untouched(self):
+        """Testa que um frame bem iluminado passa sem LUT."""
+        normalizer = LightingNormalizer()
+        rgb = frame_of(150)
+        normalizer.apply(rgb)
+
+        assert normalizer.gamma == 1.0
+        assert rgb[0, 0, 0] == 150
+
+    def test_lut_rebuilt_only_on_drift(self):
+        """Testa que a LUT só é refeita quando o histograma muda."""
+        normalizer = LightingNormalizer(smoothing=1.0)
+        for _ in range(10):
+            normalizer.apply(frame_of(30))
+        assert normalizer.rebuilds == 1
+
+        normalizer.apply(frame_of(150))
+        assert normalizer.rebuilds == 2
+        assert normalizer.gamma == 1.0
@@ -1,7 +1,8 @@
 """Testes para o módulo de modelos."""
 
+import numpy as np
 import pytest
-from src.domain.models import Challenge, GameStats
+from src.domain.models import Challenge, GameStats, HandFrame
 
 
 class TestChallenge:
@@ -71,3 +72,37 @@ class TestGameStats:
         assert stats.max_streak == 0
         assert stats.level == 1
         assert stats.perfect_hits == 0
+
+
+class TestHandFrame:
+    """Testes para a classe HandFrame."""
+
+    def test_from_arrays_projects_pixels(self):
+        """Testa projeção em pixels a partir de landmarks normalizados."""
+        landmarks = np.zeros((1, 21, 3), dtype=np.float32)
+        landmarks[0, 4] = (0.5, 0.25, 0.0)
+
+        hand_frame = HandFrame.from_arrays(landmarks, ["Right"], [0.9], 640, 480)
+
+        assert hand_frame.n_hands == 1
+        assert hand_frame.label(0) == "Right"
+        assert tuple(hand_frame.points[0, 4]) == (320.0, 120.0)
+        assert hand_frame.pixels.dtype == np.int32
+
+    def test_empty(self):
+        """Testa HandFrame sem mãos."""
+        hand_frame = HandFrame.empty(640, 480)
+
+        assert hand_frame.n_hands == 0
+        assert hand_frame.points.shape == (0, 21, 2)
+
+    def test_mirror(self):
+        """Testa espelhamento de landmarks e lateralidade."""
+        landmarks = np.full((2, 21, 3), 0.25, dtype=np.float32)
+        hand_frame = HandFrame.from_arrays(landmarks, ["Left", "Right"], [1, 1], 100, 100)
+
+        hand_frame.mirror()
+
+        assert [hand_frame.label(0), hand_frame.label(1)] == ["Right", "Left"]
+        assert hand_frame.landmarks[0, 0, 0] == pytest.approx(0.75)
+        assert hand_frame.pixels[0, 0, 0] == 75
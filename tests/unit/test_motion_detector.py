@@ -0,0 +1,43 @@
+"""Testes para o detector de movimento."""
+
+import numpy as np
+
+from src.services.motion_detector import MotionDetector
+
+
+class TestMotionDetector:
+    """Testes para a classe MotionDetector."""
+
+    def test_first_frame_is_reference(self):
+        """Testa que o primeiro frame só vira referência."""
+        detector = MotionDetector()
+        assert not detector.update(np.zeros((720, 1280, 3), dtype=np.uint8))
+
+    def test_static_scene_with_noise_is_still(self):
+        """Testa que ruído de sensor abaixo do limiar não acusa movimento."""
+        rng = np.random.default_rng(0)
+        scene = rng.integers(60, 200, (720, 1280, 3), dtype=np.uint8)
+        detector = MotionDetector()
+        detector.update(scene)
+        noisy = (scene + rng.integers(-5, 6, scene.shape)).clip(0, 255).astype(np.uint8)
+
+        assert not detector.update(noisy)
+        assert detector.score < 0.02
+
+    def test_object_entering_is_motion(self):
+        """Testa que um objeto novo na cena acusa movimento."""
+        scene = np.full((720, 1280, 3), 80, dtype=np.uint8)
+        detector = MotionDetector()
+        detector.update(scene)
+        moved = scene.copy()
+        moved[200:500, 400:700] = 220
+
+        assert detector.update(moved)
+
+    def test_reset_drops_reference(self):
+        """Testa que reset faz o próximo frame virar referência."""
+        detector = MotionDetector()
+        detector.update(np.zeros((90, 160, 3), dtype=np.uint8))
+        detector.reset()
+
+        assert not detector.update(np.full((90, 160, 3), 255, dtype=np.uint8))
@@ -0,0 +1,107 @@
+"""Testes para a gravação e a renderização offline."""
+
+import wave
+
+import numpy as np
+
+from src.domain.models import Performance
+from src.services.offline_renderer import render_performance, to_pcm16, write_wav
+from src.services.performance_recorder import PerformanceRecorder, load_performance
+
+RATE = 1000
+
+
+def make_performance(events, sounds=("a.wav", "b.wav")):
+    times, kinds, ids = zip(*events)
+    return Performance(
+        times=np.array(times, dtype=np.float64),
+        kinds=np.array(kinds, dtype=np.uint8),
+        sound_ids=np.array(ids, dtype=np.uint16),
+        sounds=list(sounds),
+    )
+
+
+def constant_samples(value, n=100):
+    """Amostras int16 estéreo constantes, para ler o mix facilmente."""
+    return lambda path: np.full((n, 2), value, dtype=np.int16)
+
+
+class TestPerformanceRecorder:
+    """Testes do gravador de eventos."""
+
+    def test_roundtrip_through_npz(self, fake_clock, tmp_path):
+        """Eventos gravados voltam iguais do arquivo."""
+        recorder = PerformanceRecorder(clock=fake_clock)
+        fake_clock.now = 500_000_000
+        recorder.note_on("a.wav")
+        fake_clock.now = 750_000_000
+        recorder.note_on("synth:C#4")
+        recorder.note_off("a.wav")
+
+        path = str(tmp_path / "take.npz")
+        assert recorder.save(path)
+        performance = load_performance(path)
+
+        np.testing.assert_allclose(performance.times, [0.5, 0.75, 0.75])
+        assert performance.kinds.tolist() == [0, 0, 1]
+        assert performance.sound_ids.tolist() == [0, 1, 0]
+        assert performance.sounds == ["a.wav", "synth:C#4"]
+
+
+class TestRenderPerformance:
+    """Testes do mix offline."""
+
+    def test_notes_start_at_exact_sample(self):
+        """Cada nota começa na amostra do seu timestamp e as sobreposições somam."""
+        performance = make_performance(
+            [(0.010, Performance.NOTE_ON, 0), (0.050, Performance.NOTE_ON, 1)]
+        )
+
+        mix = render_performance(performance, constant_samples(1000), RATE)
+
+        assert mix.shape == (150, 2)
+        assert mix[9, 0] == 0
+        assert mix[10, 0] > 0
+        np.testing.assert_allclose(mix[60, 0], 2 * mix[20, 0])
+
+    def test_note_off_cuts_with_fade(self):
+        """Note-off encerra a nota com fade até o silêncio."""
+        performance = make_performance(
+            [(0.0, Performance.NOTE_ON, 0), (0.040, Performance.NOTE_OFF, 0)],
+            sounds=("a.wav",),
+        )
+
+        mix = render_performance(performance, constant_samples(1000), RATE, fade=0.010)
+
+        assert len(mix) == 40
+        assert mix[29, 0] > 0
+        assert mix[-1, 0] == 0
+
+    def test_note_off_cuts_only_latest_voice(self):
+        """O cancelamento corta a nota prevista, não a anterior do mesmo som."""
+        performance = make_performance(
+            [
+                (0.0, Performance.NOTE_ON, 0),
+                (0.020, Performance.NOTE_ON, 0),
+                (0.040, Performance.NOTE_OFF, 0),
+            ],
+            sounds=("a.wav",),
+        )
+
+        mix = render_performance(performance, constant_samples(100), RATE, fade=0.0)
+
+        assert len(mix) == 100
+        assert mix[-1, 0] > 0
+
+    def test_writes_wav(self, tmp_path):
+        """O WAV gerado tem o formato e o tamanho do mix."""
+        performance = make_performance([(0.0, Performance.NOTE_ON, 0)], sounds=("a.wav",))
+        pcm = to_pcm16(render_performance(performance, constant_samples(30000), RATE))
+        path = str(tmp_path / "out.wav")
+
+        write_wav(path, pcm, RATE)
+
+        with wave.open(path, "rb") as wav:
+            assert wav.getnchannels() == 2
+            assert wav.getframerate() == RATE
+            assert wav.getnframes() == 100
@@ -0,0 +1,59 @@
+"""Testes para o controlador adaptativo de qualidade."""
+
+import pytest
+
+from src.core.quality_controller import QualityController
+
+LEVELS = [
+    {"inference_scale": 1.0, "model_complexity": 1},
+    {"inference_scale": 0.75, "model_complexity": 1},
+    {"inference_scale": 0.5, "model_complexity": 0},
+]
+
+
+def feed(controller, frame_time, frames):
+    """Alimenta o controlador e retorna as trocas de nível ocorridas."""
+    changes = [controller.observe(frame_time) for _ in range(frames)]
+    return [change for change in changes if change is not None]
+
+
+class TestQualityController:
+    """Testes para a classe QualityController."""
+
+    def test_steps_down_when_over_budget(self):
+        """Testa que frames lentos baixam a qualidade, um nível por vez."""
+        controller = QualityController(LEVELS, target_fps=30, window=10, cooldown=10)
+        changes = feed(controller, 0.050, 10)
+
+        assert changes == [LEVELS[1]]
+        assert controller.level == 1
+
+    def test_stays_at_cheapest_level(self):
+        """Testa que o nível não passa do mais barato."""
+        controller = QualityController(LEVELS, target_fps=30, window=5, cooldown=5)
+        feed(controller, 0.050, 100)
+
+        assert controller.level == len(LEVELS) - 1
+        assert controller.changes == 2
+
+    def test_steps_up_with_headroom_after_longer_cooldown(self):
+        """Testa que a qualidade só sobe com folga e após o dobro do cooldown."""
+        controller = QualityController(
+            LEVELS, target_fps=30, window=5, cooldown=10, start_level=2
+        )
+        assert feed(controller, 0.010, 19) == []
+        assert feed(controller, 0.010, 1) == [LEVELS[1]]
+
+    def test_holds_level_inside_band(self):
+        """Testa que tempos entre a folga e o orçamento não mudam o nível."""
+        controller = QualityController(
+            LEVELS, target_fps=30, window=5, cooldown=5, start_level=1
+        )
+        feed(controller, 0.025, 100)
+
+        assert controller.level == 1
+
+    def test_requires_levels(self):
+        """Testa que uma lista vazia de níveis é rejeitada."""
+        with pytest.raises(ValueError):
+            QualityController([])
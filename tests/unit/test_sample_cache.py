@@ -0,0 +1,83 @@
+"""Testes para o SampleCache."""
+
+import os
+
+import numpy as np
+
+from src.services.sample_cache import SampleCache
+
+SETTINGS = (44100, -16, 2)
+
+
+class CountingDecoder:
+    """Decodificador falso que conta as chamadas."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        t = np.linspace(0, 1, 1000, dtype=np.float32)
+        wave = (np.sin(2 * np.pi * 5 * t) * 1000).astype(np.int16)
+        return np.stack([wave, wave], axis=1)
+
+
+def make_sound_file(tmp_path, content=b"RIFF-data"):
+    path = tmp_path / "do.wav"
+    path.write_bytes(content)
+    return str(path)
+
+
+class TestSampleCache:
+    """Testes do cache de PCM decodificado."""
+
+    def test_second_load_is_a_hit_without_decoding(self, tmp_path):
+        """Cache quente lê o .npy em vez de decodificar."""
+        decoder = CountingDecoder()
+        sound = make_sound_file(tmp_path)
+        cache_dir = str(tmp_path / "cache")
+
+        first = SampleCache(cache_dir, SETTINGS, decoder=decoder).load(sound)
+        cache = SampleCache(cache_dir, SETTINGS, decoder=decoder)
+        second = cache.load(sound)
+
+        assert decoder.calls == 1
+        assert cache.hits == 1
+        assert isinstance(second, np.memmap)
+        np.testing.assert_array_equal(first, second)
+
+    def test_changed_file_invalidates_and_prunes(self, tmp_path):
+        """Arquivo alterado gera nova entrada e remove a antiga."""
+        decoder = CountingDecoder()
+        sound = make_sound_file(tmp_path)
+        cache_dir = str(tmp_path / "cache")
+        cache = SampleCache(cache_dir, SETTINGS, decoder=decoder)
+
+        cache.load(sound)
+        make_sound_file(tmp_path, b"RIFF-other")
+        cache.load(sound)
+
+        assert decoder.calls == 2
+        assert len(os.listdir(cache_dir)) == 1
+
+    def test_mixer_settings_are_part_of_the_key(self, tmp_path):
+        """Outra frequência do mixer não reaproveita a entrada."""
+        decoder = CountingDecoder()
+        sound = make_sound_file(tmp_path)
+        cache_dir = str(tmp_path / "cache")
+
+        SampleCache(cache_dir, SETTINGS, decoder=decoder).load(sound)
+        SampleCache(cache_dir, (48000, -16, 2), decoder=decoder).load(sound)
+
+        assert decoder.calls == 2
+
+    def test_normalizes_to_target_rms(self, tmp_path):
+        """As amostras são ajustadas para o RMS alvo."""
+        cache = SampleCache(
+            str(tmp_path / "cache"), SETTINGS, target_rms=0.2, decoder=CountingDecoder()
+        )
+
+        samples = cache.load(make_sound_file(tmp_path))
+
+        rms = np.sqrt(np.mean(np.square(samples / 32767.0)))
+        assert abs(rms - 0.2) < 0.01
@@ -0,0 +1,82 @@
+"""Testes para o SoundService."""
+
+import wave
+
+import numpy as np
+import pytest
+
+from src.services.sound_service import SoundService
+
+MIXER = {"frequency": 44100, "size": -16, "channels": 2, "buffer": 512}
+CONFIG = {8: {"sound": "do.wav"}, 12: {"sound": "synth:E4"}}
+
+
+def rms(samples):
+    data = samples.astype(np.float32) / 32767.0
+    return float(np.sqrt(np.mean(np.square(data))))
+
+
+@pytest.fixture
+def sound_file(tmp_path):
+    """WAV quieto (RMS bem abaixo do alvo) no formato do mixer."""
+    t = np.arange(4410) / 44100.0
+    wave_data = (np.sin(2 * np.pi * 440 * t) * 800).astype(np.int16)
+    with wave.open(str(tmp_path / "do.wav"), "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(44100)
+        f.writeframes(np.repeat(wave_data, 2).tobytes())
+    return tmp_path
+
+
+def make_service(monkeypatch, base_path, cache_dir):
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    service = SoundService(
+        mixer_config=MIXER, sample_cache_dir=cache_dir, sample_target_rms=0.1
+    )
+    service.initialize()
+    service.base_path = str(base_path)
+    service.load_sounds_from_config(CONFIG, {})
+    service.synth_bank.wait_warmup(timeout=5.0)
+    return service
+
+
+class TestLoudnessNormalization:
+    """Testes do volume das amostras com e sem cache."""
+
+    def test_cached_and_uncached_have_same_level(self, sound_file, monkeypatch):
+        """Ligar o cache não muda o volume dos sons."""
+        service = make_service(monkeypatch, sound_file, None)
+        uncached = service.get_samples("do.wav")
+        service.cleanup()
+
+        service = make_service(monkeypatch, sound_file, str(sound_file / "cache"))
+        cached = service.get_samples("do.wav")
+        service.cleanup()
+
+        assert abs(rms(uncached) - 0.1) < 0.005
+        assert abs(rms(cached) - rms(uncached)) < 1e-3
+
+    def test_synth_notes_are_normalized(self, sound_file, monkeypatch):
+        """Notas sintetizadas também saem no RMS alvo."""
+        service = make_service(monkeypatch, sound_file, None)
+        samples = service.get_samples("synth:E4")
+        service.cleanup()
+
+        assert abs(rms(samples) - 0.1) < 0.005
+
+
+class TestMixerLatency:
+    """Testes da medição de latência do mixer."""
+
+    def test_latency_is_measured_on_initialize(self, monkeypatch):
+        """A latência medida fica perto da duração de um buffer do mixer."""
+        monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+        service = SoundService(mixer_config=MIXER, sample_cache_dir=None)
+        service.initialize()
+        stats = service.get_stats()
+        service.cleanup()
+
+        measured = stats["measured_mixer_latency_ms"]
+        assert measured is not None
+        assert 0.0 < measured < 5 * stats["estimated_buffer_latency_ms"]
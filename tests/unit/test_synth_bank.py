@@ -0,0 +1,81 @@
+"""Testes para o banco de síntese."""
+
+import numpy as np
+import pytest
+
+from src.services.synth_bank import SynthBank, note_to_midi, synthesize_note
+
+
+class TestNoteToMidi:
+    """Testes da conversão de nomes de notas."""
+
+    @pytest.mark.parametrize(
+        "name,midi",
+        [("C4", 60), ("C#4", 61), ("Db4", 61), ("A4", 69), ("B3", 59), ("C-1", 0)],
+    )
+    def test_converts_note_names(self, name, midi):
+        """Nomes em notação científica viram números MIDI."""
+        assert note_to_midi(name) == midi
+
+    def test_rejects_invalid_names(self):
+        """Nomes inválidos geram ValueError."""
+        with pytest.raises(ValueError):
+            note_to_midi("H2")
+
+
+class TestSynthesizeNote:
+    """Testes da síntese aditiva."""
+
+    def test_output_shape_and_pitch(self):
+        """Gera (n, canais) int16 com a fundamental na frequência da nota."""
+        samples = synthesize_note(69, sample_rate=8000, channels=2, duration=1.0)
+
+        assert samples.shape == (8000, 2)
+        assert samples.dtype == np.int16
+        assert samples.flags["C_CONTIGUOUS"]
+
+        spectrum = np.abs(np.fft.rfft(samples[:, 0].astype(np.float32)))
+        assert abs(np.argmax(spectrum) - 440) <= 2
+
+    def test_envelope_starts_and_ends_silent(self):
+        """O ADSR começa e termina em silêncio (sem cliques)."""
+        samples = synthesize_note(60, sample_rate=8000, duration=0.5)
+
+        assert samples[0, 0] == 0
+        assert abs(int(samples[-1, 0])) < 50
+
+
+class TestSynthBank:
+    """Testes do banco LRU."""
+
+    def test_caches_generated_notes(self):
+        """A segunda consulta é um hit e devolve o mesmo objeto."""
+        bank = SynthBank(sample_rate=8000, duration=0.2)
+
+        first = bank.get_note("C4")
+        second = bank.get(60)
+
+        assert first is second
+        assert (bank.hits, bank.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        """Acima da capacidade, a nota menos usada sai do banco."""
+        bank = SynthBank(sample_rate=8000, capacity=2, duration=0.1)
+
+        bank.get(60)
+        bank.get(62)
+        bank.get(60)
+        bank.get(64)
+
+        assert 60 in bank and 64 in bank
+        assert 62 not in bank
+        assert bank.evictions == 1
+
+    def test_warmup_generates_in_background(self):
+        """O warmup preenche o banco em uma thread de fundo."""
+        bank = SynthBank(sample_rate=8000, duration=0.1, build=lambda s: s.copy())
+
+        bank.warmup([60, 61, 62])
+        bank.wait_warmup(timeout=5.0)
+
+        assert len(bank) == 3
@@ -0,0 +1,146 @@
+"""Testes para o VoicePool."""
+
+import numpy as np
+import pytest
+
+from src.services.voice_pool import VoicePool, velocity_to_gain
+
+
+class FakeChannel:
+    """Canal falso que fica ocupado até ser parado."""
+
+    def __init__(self, name):
+        self.name = name
+        self.playing = None
+        self.volume = 1.0
+
+    def get_busy(self):
+        return self.playing is not None
+
+    def play(self, sound):
+        self.playing = sound
+
+    def stop(self):
+        self.playing = None
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+
+@pytest.fixture
+def clock(fake_clock):
+    """Relógio que avança 1 s a cada leitura."""
+    fake_clock.step = 1.0
+    return fake_clock
+
+
+def make_pool(clock, n_overflow=2):
+    dedicated = {"do.wav": FakeChannel("do"), "re.wav": FakeChannel("re")}
+    overflow = [FakeChannel(f"ov{i}") for i in range(n_overflow)]
+    return VoicePool(dedicated, overflow, clock=clock), dedicated, overflow
+
+
+class TestVoicePool:
+    """Testes de alocação e roubo de vozes."""
+
+    def test_uses_dedicated_channel_first(self, clock):
+        """Nota livre toca no próprio canal."""
+        pool, dedicated, _ = make_pool(clock)
+
+        assert pool.play("do.wav", "DO") is dedicated["do.wav"]
+
+    def test_repeated_note_goes_to_overflow(self, clock):
+        """Nota repetida ainda soando usa o overflow em vez de cortar a anterior."""
+        pool, dedicated, overflow = make_pool(clock)
+
+        pool.play("do.wav", "DO")
+        channel = pool.play("do.wav", "DO")
+
+        assert channel is overflow[0]
+        assert dedicated["do.wav"].playing == "DO"
+        assert pool.stolen_voices == 0
+
+    def test_steals_oldest_overflow_voice_when_full(self, clock):
+        """Com o overflow cheio, a voz mais antiga é roubada e contada."""
+        pool, _, overflow = make_pool(clock)
+
+        for _ in range(3):
+            pool.play("do.wav", "DO")
+        channel = pool.play("do.wav", "DO2")
+
+        assert channel is overflow[0]
+        assert overflow[0].playing == "DO2"
+        assert pool.stolen_voices == 1
+        assert pool.dropped_voices == 0
+
+    def test_restarts_dedicated_without_overflow(self, clock):
+        """Sem overflow, a nota reinicia no próprio canal."""
+        pool, dedicated, _ = make_pool(clock, n_overflow=0)
+
+        pool.play("do.wav", "DO")
+        assert pool.play("do.wav", "DO") is dedicated["do.wav"]
+        assert pool.stolen_voices == 1
+
+    def test_unmapped_sound_without_voices_is_dropped(self, clock):
+        """Som sem canal dedicado e sem overflow é contado como descartado."""
+        pool, _, _ = make_pool(clock, n_overflow=0)
+
+        assert pool.play("mi.wav", "MI") is None
+        assert pool.dropped_voices == 1
+
+    def test_stop_silences_all_voices_of_a_note(self, clock):
+        """Note-off para o canal dedicado e as vozes de overflow da nota."""
+        pool, dedicated, overflow = make_pool(clock)
+
+        pool.play("do.wav", "DO")
+        pool.play("do.wav", "DO")
+        pool.play("re.wav", "RE")
+
+        assert pool.stop("do.wav") == 2
+        assert not dedicated["do.wav"].get_busy()
+        assert not overflow[0].get_busy()
+        assert dedicated["re.wav"].get_busy()
+
+    def test_cancelled_prediction_keeps_earlier_note(self, clock):
+        """Cancelar uma nota prevista não corta a nota real ainda soando."""
+        pool, dedicated, overflow = make_pool(clock)
+
+        pool.play("do.wav", "DO")
+        predicted = pool.play("do.wav", "DO")
+
+        assert pool.stop_channel("do.wav", predicted)
+        assert not overflow[0].get_busy()
+        assert dedicated["do.wav"].playing == "DO"
+
+    def test_stop_channel_ignores_reused_channel(self, clock):
+        """Canal já reaproveitado por outro som não é parado."""
+        pool, _, overflow = make_pool(clock, n_overflow=1)
+
+        pool.play("do.wav", "DO")
+        predicted = pool.play("do.wav", "DO")
+        predicted.stop()
+        pool.play("re.wav", "RE")
+        pool.play("re.wav", "RE")
+
+        assert not pool.stop_channel("do.wav", predicted)
+        assert overflow[0].playing == "RE"
+
+    def test_applies_voice_gain_to_channel(self, clock):
+        """O ganho da nota vai para o canal usado."""
+        pool, dedicated, _ = make_pool(clock)
+
+        pool.play("do.wav", "DO", volume=0.4)
+
+        assert dedicated["do.wav"].volume == 0.4
+
+
+class TestVelocityToGain:
+    """Testes do mapeamento velocity -> ganho."""
+
+    def test_maps_range_monotonically(self):
+        """Velocity 0 dá o ganho mínimo, 1 dá ganho total, e é crescente."""
+        gains = velocity_to_gain(np.linspace(0.0, 1.0, 5), min_gain=0.3)
+
+        assert gains[0] == 0.3
+        assert gains[-1] == 1.0
+        assert np.all(np.diff(gains) > 0)